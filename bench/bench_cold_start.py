@@ -0,0 +1,92 @@
+"""Cold-start time of the `readings` command.
+
+Times fresh interpreters running no-op invocations (--help, a bad flag)
+against a bare `python -c pass`, and fails if the median no-op run costs more
+than --max-ms on top of the bare interpreter. Subcommands import what they
+need when they run, so these should only pay for argparse.
+
+Bytecode is written to a temporary PYTHONPYCACHEPREFIX (even under
+PYTHONDONTWRITEBYTECODE) and each command is run once before timing, so the
+numbers match an installed package rather than recompiling every module.
+
+    python bench/bench_cold_start.py --repeat 30 --max-ms 40
+    python bench/bench_cold_start.py --importtime   # slowest imports of `readings --help`
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+
+COMMANDS = {
+    'python -c pass': ['-c', 'pass'],
+    'import readings_pipeline': ['-c', 'import readings_pipeline'],
+    'readings --help': ['-m', 'readings_pipeline', '--help'],
+    'readings diff --help': ['-m', 'readings_pipeline', 'diff', '--help'],
+    'readings --bad-flag': ['-m', 'readings_pipeline', '--bad-flag'],
+    'parse_readings_v4.py --help': [os.path.join(REPO_DIR, 'parse_readings_v4.py'), '--help'],
+}
+NO_OPS = ['readings --help', 'readings diff --help', 'readings --bad-flag', 'parse_readings_v4.py --help']
+
+
+def time_command(args, repeat, env):
+    timings = []
+    for i in range(repeat + 1):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=REPO_DIR, env=env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if i == 0:
+            continue  # writes the bytecode
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def slowest_imports(args, top, env):
+    """(cumulative us, module) of the slowest top-level imports, from -X importtime."""
+    stderr = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=REPO_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if cumulative.strip().isdigit() and not name.startswith('  '):
+                rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the readings CLI's startup time.")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--max-ms', type=float, default=40.0,
+                        help="allowed median cost of a no-op run over `python -c pass`")
+    parser.add_argument('--importtime', action='store_true',
+                        help="also list the slowest imports of `readings --help`")
+    args = parser.parse_args()
+
+    pycache = tempfile.TemporaryDirectory()
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache.name)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    results = {name: time_command(cmd, args.repeat, env) for name, cmd in COMMANDS.items()}
+    baseline = results['python -c pass']
+    print(f"{'command':<30} {'median ms':>10} {'over python':>12}")
+    for name, ms in results.items():
+        print(f"{name:<30} {ms:>10.1f} {ms - baseline:>12.1f}")
+
+    if args.importtime:
+        print("\nslowest imports of `readings --help` (cumulative ms):")
+        for us, name in slowest_imports(COMMANDS['readings --help'], 10, env):
+            print(f"  {us / 1000:>7.1f}  {name}")
+
+    pycache.cleanup()
+
+    failures = [name for name in NO_OPS if results[name] - baseline > args.max_ms]
+    for name in failures:
+        print(f"FAIL {name}: {results[name] - baseline:.1f} ms over python (> {args.max_ms:g} ms)",
+              file=sys.stderr)
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,70 @@
+"""Time `readings diff` on large generated modules.
+
+Builds a synthetic corpus, writes it as a generated module, then writes a
+second version with some readings removed, added, moved to another group
+and edited, and times loading plus diffing the pair.
+
+    python bench/bench_diff.py --readings 50000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from dataclasses import replace
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from synth import write_corpus
+import readings_pipeline
+
+
+def mutate(records, rng, fraction):
+    n = max(1, int(len(records) * fraction))
+    out = list(records)
+    for i in rng.sample(range(len(out)), n):
+        r = out[i]
+        out[i] = replace(r, one_line_summary=r.one_line_summary + " Revised.")
+    for i in rng.sample(range(len(out)), n):
+        out[i] = replace(out[i], group_slug='societal-implications')
+    for i in sorted(rng.sample(range(len(out)), n), reverse=True):
+        del out[i]
+    extra = [replace(r, title=r.title + " (2nd ed.)", slug=r.slug + "-2nd",
+                     full_citation=r.full_citation + " 2nd ed.",
+                     external_links=readings_pipeline.ExternalLinks())
+             for r in rng.sample(out, n)]
+    return out + extra
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the structural diff of two generated modules.")
+    parser.add_argument('--readings', type=int, default=50000)
+    parser.add_argument('--fraction', type=float, default=0.01,
+                        help="share of readings edited, moved, removed and added")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        raw = os.path.join(tmp_dir, "corpus.txt")
+        write_corpus(raw, args.readings)
+        raw_mb = os.path.getsize(raw) / 1e6
+        records = list(readings_pipeline.ReadingIndex().assign(readings_pipeline.iter_readings(raw)))
+        old_path = os.path.join(tmp_dir, "old.ts")
+        new_path = os.path.join(tmp_dir, "new.ts")
+        readings_pipeline.write_ts(records, old_path)
+        readings_pipeline.write_ts(mutate(records, random.Random(0), args.fraction), new_path)
+
+        start = time.perf_counter()
+        old = readings_pipeline.load_records(old_path)
+        new = readings_pipeline.load_records(new_path)
+        loaded = time.perf_counter()
+        result = readings_pipeline.diff_readings(old, new)
+        done = time.perf_counter()
+
+    print(f"readings: {len(old)} -> {len(new)} ({raw_mb:.0f} MB raw)")
+    print(f"added {len(result['added'])}, removed {len(result['removed'])}, "
+          f"moved {len(result['moved'])}, changed {len(result['changed'])}")
+    print(f"load both modules: {loaded - start:6.2f} s")
+    print(f"diff:              {done - loaded:6.2f} s")
@@ -0,0 +1,85 @@
+"""Many small raw files: load_readings() vs. the asyncio ingest pipeline.
+
+Writes one file per reading (see synth.write_reading_files), then runs each
+engine in a fresh interpreter, writing the module to a temp file with
+write_ts so only the pipeline itself holds records:
+
+  load     load_readings(): read and split every file, extract, then
+           write (--jobs worker processes)
+  ingest   ingest_readings(): bounded concurrent reads, batched extraction
+           on --jobs workers, records written as they are merged
+
+    python bench/bench_ingest.py --files 2000 10000 40000 --jobs 2
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from synth import write_reading_files
+
+ENGINES = ['load', 'ingest']
+
+
+def run_engine(engine, in_dir, out_path, jobs, concurrency):
+    from readings_pipeline.pipeline import emit, load_readings
+    from readings_pipeline.ingest import ingest_readings
+
+    start = time.perf_counter()
+    if engine == 'load':
+        readings = load_readings([in_dir], jobs=jobs)
+    else:
+        readings = ingest_readings([in_dir], jobs=jobs, concurrency=concurrency)
+    count = 0
+
+    def counted(records):
+        nonlocal count
+        for record in records:
+            count += 1
+            yield record
+
+    emit(counted(readings), out_path)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux
+    return {'seconds': elapsed, 'readings': count,
+            'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ingesting many small raw files.")
+    parser.add_argument('--files', type=int, nargs='+', default=[2000, 10000, 40000])
+    parser.add_argument('--engines', nargs='+', default=ENGINES, choices=ENGINES)
+    parser.add_argument('--jobs', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--run', nargs=3, metavar=('ENGINE', 'DIR', 'OUT'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run_engine(*args.run, args.jobs, args.concurrency)))
+        sys.exit(0)
+
+    print(f"jobs {args.jobs}, concurrency {args.concurrency}")
+    print(f"{'engine':<8} {'files':>7} {'seconds':>8} {'readings/s':>11} {'peak RSS MB':>12}")
+    for n_files in args.files:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            in_dir = os.path.join(tmp_dir, "incoming")
+            os.mkdir(in_dir)
+            write_reading_files(in_dir, n_files)
+            for engine in args.engines:
+                out = subprocess.run(
+                    [sys.executable, __file__, '--run', engine, in_dir, os.path.join(tmp_dir, "out.ts"),
+                     '--jobs', str(args.jobs), '--concurrency', str(args.concurrency)],
+                    check=True, capture_output=True, text=True,
+                )
+                r = json.loads(out.stdout)
+                assert r['readings'] == n_files, (engine, r['readings'], n_files)
+                print(f"{engine:<8} {n_files:>7} {r['seconds']:>8.2f} {n_files / r['seconds']:>11.0f} "
+                      f"{r['max_rss_kb'] / 1024:>12.1f}")
@@ -0,0 +1,160 @@
+"""Prompt size and latency of the paper-chat route: full context vs. BM25 top-k.
+
+Rebuilds both system prompts the way src/app/api/paper-chat/route.ts does
+(instructions taken from the route itself), looks up passages with
+bm25_search() from the --chat-index artifact, and posts each prompt to a
+stubbed OpenAI-style endpoint running locally. The stub answers immediately
+after a delay proportional to the prompt's estimated tokens, standing in for
+prefill cost; no network or API key is needed.
+
+    readings parse src/content/readings.ts --chat-index src/content/paperChatIndex.json > /dev/null
+    python bench/bench_paper_chat.py --top-k 8 --ms-per-1k-tokens 40
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import threading
+import statistics
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+
+import readings_pipeline
+
+ROUTE_PATH = os.path.join(REPO_DIR, "src/app/api/paper-chat/route.ts")
+
+QUESTIONS = [
+    "What is the main argument of the paper?",
+    "Why is adolescence a sensitive period for social learning?",
+    "How does RLHF lead to sycophancy?",
+    "What does Goffman mean by face-work?",
+    "What are the limitations of the argument?",
+    "How is social friction a training signal in information-theoretic terms?",
+    "What design changes do you propose for AI companions?",
+    "Which readings discuss loneliness and dependence on chatbots?",
+]
+
+
+def chars_to_tokens(n_chars):
+    # Rough English average; only used to compare the two prompts
+    return n_chars / 4
+
+
+def route_instructions():
+    with open(ROUTE_PATH, encoding="utf-8") as f:
+        src = f.read()
+    block = re.search(r"const SYSTEM_INSTRUCTIONS = \[(.*?)\n\];", src, re.S).group(1)
+    return [json.loads(s) for s in re.findall(r'^\s*("(?:[^"\\]|\\.)*"),', block, re.M)]
+
+
+def full_context_prompt(instructions):
+    def read(rel):
+        with open(os.path.join(REPO_DIR, rel), encoding="utf-8") as f:
+            return f.read()
+
+    return "\n".join(instructions + [
+        "Context follows. Treat it as authoritative for questions about this project.",
+        "",
+        "=== PAPER (MDX) ===",
+        read("src/content/paper.mdx"),
+        "",
+        "=== PROJECT PROPOSAL / SITE SPEC ===",
+        read("initialprompt.md"),
+        "",
+        "=== WEBSITE README ===",
+        read("README.md"),
+    ])
+
+
+def retrieval_prompt(instructions, index, question, k):
+    hits = readings_pipeline.bm25_search(index, question, k)
+    passages = [index['chunks'][i] for i in hits]
+    return "\n".join(instructions + [
+        "Context follows: the passages most relevant to this conversation, retrieved from the paper, "
+        "the project proposal / site spec, the website README and the reading notes. "
+        "Treat it as authoritative for questions about this project.",
+        "",
+    ] + [f"=== {p['source']}: {p['title']} ===\n{p['text']}\n" for p in passages])
+
+
+class StubModelHandler(BaseHTTPRequestHandler):
+    ms_per_1k_tokens = 40.0
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        messages = json.loads(body)['messages']
+        prompt_tokens = chars_to_tokens(sum(len(m['content']) for m in messages))
+        time.sleep(prompt_tokens / 1000 * self.ms_per_1k_tokens / 1000)
+        reply = json.dumps({
+            'choices': [{'message': {'role': 'assistant', 'content': 'stub answer'}}],
+            'usage': {'prompt_tokens': round(prompt_tokens)},
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, *args):
+        pass
+
+
+def post(url, system_prompt, question):
+    payload = json.dumps({
+        'model': 'stub',
+        'messages': [{'role': 'system', 'content': system_prompt}, {'role': 'user', 'content': question}],
+    }).encode()
+    request = urllib.request.Request(url, data=payload, headers={'Content-Type': 'application/json'})
+    start = time.perf_counter()
+    with urllib.request.urlopen(request) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare full-context and retrieved paper-chat prompts.")
+    parser.add_argument('--index', default=os.path.join(REPO_DIR, "src/content/paperChatIndex.json"))
+    parser.add_argument('--top-k', type=int, default=8)
+    parser.add_argument('--ms-per-1k-tokens', type=float, default=40.0,
+                        help="stub endpoint delay per 1k prompt tokens")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.index, encoding="utf-8") as f:
+        index = json.load(f)
+    instructions = route_instructions()
+
+    StubModelHandler.ms_per_1k_tokens = args.ms_per_1k_tokens
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubModelHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+
+    full_prompt = full_context_prompt(instructions)
+    rows = {'full context': {'chars': [], 'lookup': [], 'request': []},
+            f'BM25 top-{args.top_k}': {'chars': [], 'lookup': [], 'request': []}}
+    for question in QUESTIONS:
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            prompt = retrieval_prompt(instructions, index, question, args.top_k)
+            lookup = time.perf_counter() - start
+            for name, text, lookup_s in (('full context', full_prompt, 0.0),
+                                         (f'BM25 top-{args.top_k}', prompt, lookup)):
+                rows[name]['chars'].append(len(text))
+                rows[name]['lookup'].append(lookup_s)
+                rows[name]['request'].append(post(url, text, question))
+    server.shutdown()
+
+    print(f"{len(index['chunks'])} passages, {len(QUESTIONS)} questions x {args.repeat}, "
+          f"stub prefill {args.ms_per_1k_tokens:g} ms / 1k tokens")
+    print(f"{'prompt':<16} {'chars':>9} {'~tokens':>9} {'lookup ms':>10} {'request ms':>11}")
+    for name, r in rows.items():
+        chars = statistics.mean(r['chars'])
+        print(f"{name:<16} {chars:>9,.0f} {chars_to_tokens(chars):>9,.0f} "
+              f"{statistics.mean(r['lookup']) * 1000:>10.3f} {statistics.mean(r['request']) * 1000:>11.1f}")
@@ -0,0 +1,127 @@
+"""Throughput and peak RSS of the readings parsers on synthetic corpora.
+
+Each (engine, corpus) pair runs in a fresh interpreter so ru_maxrss reflects
+that run alone. Engines:
+
+  v3           parse_readings_v3.parse_readings
+  v4-baseline  parse_readings_v4.py before the refactor (bench/parse_readings_v4_baseline.py)
+  v4-batch     readings_pipeline.parse_readings (whole-file split)
+  v4-stream    readings_pipeline.parse_readings(stream=True)
+  v4-mmap      readings_pipeline.parse_readings(use_mmap=True)
+
+All engines render the TS module. It goes to a temporary file, and the
+readings column counts the readings in it: engines that drop readings
+(v3 misses some header styles) are not credited with the whole corpus.
+
+    python bench/bench_parsers.py --sizes 1000 10000 100000
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+
+from synth import write_corpus
+
+ENGINES = ['v3', 'v4-baseline', 'v4-batch', 'v4-stream', 'v4-mmap']
+
+
+def count_readings(ts_path):
+    """Number of readings in the module an engine printed (after any log lines)."""
+    marker = 'export const readings: Reading[] = '
+    with open(ts_path, 'r') as f:
+        content = f.read()
+    data, _ = json.JSONDecoder().raw_decode(content, content.index(marker) + len(marker))
+    return len(data)
+
+
+def run_engine(engine, path):
+    """Run one engine in this process and return timing/RSS/readings as a dict."""
+    ts_path = path + f'.{engine}.ts'
+    sys.stdout = open(ts_path, 'w')
+    start = time.perf_counter()
+    if engine == 'v3':
+        import parse_readings_v3
+        parse_readings_v3.parse_readings(path)
+    elif engine == 'v4-baseline':
+        import parse_readings_v4_baseline
+        parse_readings_v4_baseline.parse_readings(path)
+    elif engine == 'v4-batch':
+        import readings_pipeline
+        readings_pipeline.parse_readings(path)
+    elif engine == 'v4-stream':
+        import readings_pipeline
+        readings_pipeline.parse_readings(path, stream=True)
+    elif engine == 'v4-mmap':
+        import readings_pipeline
+        readings_pipeline.parse_readings(path, use_mmap=True)
+    else:
+        raise ValueError(f"unknown engine {engine!r}")
+    elapsed = time.perf_counter() - start
+    sys.stdout.close()
+    sys.stdout = sys.__stdout__
+    # ru_maxrss is in KiB on Linux
+    max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    readings = count_readings(ts_path)
+    os.unlink(ts_path)
+    return {'seconds': elapsed, 'max_rss_kb': max_rss_kb, 'readings': readings}
+
+
+def bench(sizes, engines, tmp_dir):
+    rows = []
+    for size in sizes:
+        path = os.path.join(tmp_dir, f"corpus_{size}.txt")
+        n = write_corpus(path, size)
+        corpus_mb = os.path.getsize(path) / 1e6
+        for engine in engines:
+            out = subprocess.run(
+                [sys.executable, __file__, '--run', engine, path],
+                check=True, capture_output=True, text=True,
+            )
+            result = json.loads(out.stdout)
+            rows.append({
+                'engine': engine,
+                'readings': result['readings'],
+                'synthesized': n,
+                'corpus_mb': round(corpus_mb, 2),
+                'seconds': round(result['seconds'], 3),
+                'readings_per_sec': round(result['readings'] / result['seconds']),
+                'peak_rss_mb': round(result['max_rss_kb'] / 1024, 1),
+            })
+    return rows
+
+
+def print_table(rows):
+    print(f"{'engine':<12} {'readings':>13} {'corpus MB':>10} {'seconds':>8} {'readings/s':>11} {'peak RSS MB':>12}")
+    for r in rows:
+        found = f"{r['readings']}/{r['synthesized']}"
+        print(f"{r['engine']:<12} {found:>13} {r['corpus_mb']:>10} {r['seconds']:>8} "
+              f"{r['readings_per_sec']:>11} {r['peak_rss_mb']:>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the readings parsers.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--engines', nargs='+', default=ENGINES, choices=ENGINES)
+    parser.add_argument('--json', action='store_true', help="print rows as JSON")
+    parser.add_argument('--run', nargs=2, metavar=('ENGINE', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run_engine(*args.run)))
+        sys.exit(0)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        rows = bench(args.sizes, args.engines, tmp_dir)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_table(rows)
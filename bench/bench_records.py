@@ -0,0 +1,70 @@
+"""Memory of slotted Reading records vs. the old dict-of-dicts shape.
+
+Extracts a synthetic corpus once, then measures with tracemalloc:
+
+  - the container overhead of the Reading/ExternalLinks/Discussion objects
+  - the container overhead of the equivalent nested dicts (to_dict())
+
+The field strings are shared between both shapes, so they are reported
+separately rather than counted twice.
+
+    python bench/bench_records.py --readings 100000
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from synth import write_corpus
+import readings_pipeline
+
+
+def measure(n_readings):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "corpus.txt")
+        write_corpus(path, n_readings)
+
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        records = list(readings_pipeline.iter_readings(path))
+        total_slotted = tracemalloc.get_traced_memory()[0] - base
+
+        before = tracemalloc.get_traced_memory()[0]
+        dicts = [r.to_dict() for r in records]
+        dict_overhead = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+    slotted_overhead = sum(
+        sys.getsizeof(r) + sys.getsizeof(r.external_links) + sys.getsizeof(r.discussion)
+        for r in records
+    )
+    shared = total_slotted - slotted_overhead
+    n = len(records)
+    del dicts
+    return {
+        'readings': n,
+        'strings_mb': shared / 1e6,
+        'dict_containers_mb': dict_overhead / 1e6,
+        'slotted_containers_mb': slotted_overhead / 1e6,
+        'dict_bytes_per_record': dict_overhead / n,
+        'slotted_bytes_per_record': slotted_overhead / n,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare record memory for dicts vs slotted dataclasses.")
+    parser.add_argument('--readings', type=int, default=100000)
+    args = parser.parse_args()
+
+    r = measure(args.readings)
+    print(f"readings:                 {r['readings']}")
+    print(f"field strings (shared):   {r['strings_mb']:.1f} MB")
+    print(f"dict-of-dicts containers: {r['dict_containers_mb']:.1f} MB ({r['dict_bytes_per_record']:.0f} B/record)")
+    print(f"slotted containers:       {r['slotted_containers_mb']:.1f} MB ({r['slotted_bytes_per_record']:.0f} B/record)")
+    saved = 1 - r['slotted_containers_mb'] / r['dict_containers_mb']
+    print(f"container memory saved:   {saved:.0%}")
@@ -0,0 +1,62 @@
+"""Time the related-readings computation: SciPy sparse vs. pure Python.
+
+Extracts a synthetic corpus with a long-tail vocabulary, then times
+related_neighbours() on the NumPy/SciPy path for the whole corpus and on the
+pure-Python fallback for a subset (it is quadratic-ish in shared terms), and
+checks the two agree on that subset.
+
+    python bench/bench_related.py --readings 10000 --python-subset 2000
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from synth import write_corpus
+import readings_pipeline
+
+
+def load_texts(n_readings, vocabulary):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "corpus.txt")
+        write_corpus(path, n_readings, vocabulary=vocabulary)
+        texts = []
+        for r in readings_pipeline.iter_readings(path):
+            d = r.discussion
+            texts.append(" ".join((d.core_idea, d.question_answered, d.why_it_matters)))
+    return texts
+
+
+def timed(texts, k, use_numpy, block_size=512):
+    start = time.perf_counter()
+    result = readings_pipeline.related_neighbours(texts, k, block_size=block_size, use_numpy=use_numpy)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark TF-IDF related-readings computation.")
+    parser.add_argument('--readings', type=int, default=10000)
+    parser.add_argument('--vocabulary', type=int, default=20000)
+    parser.add_argument('--python-subset', type=int, default=2000,
+                        help="readings to run through the pure-Python fallback")
+    parser.add_argument('-k', type=int, default=3)
+    parser.add_argument('--block-size', type=int, default=512)
+    args = parser.parse_args()
+
+    texts = load_texts(args.readings, args.vocabulary)
+    print(f"readings: {len(texts)}, k={args.k}")
+
+    _, elapsed = timed(texts, args.k, True, args.block_size)
+    print(f"scipy sparse, all readings:      {elapsed:8.2f} s")
+
+    subset = texts[:args.python_subset]
+    fast, fast_s = timed(subset, args.k, True, args.block_size)
+    slow, slow_s = timed(subset, args.k, False)
+    print(f"scipy sparse, {len(subset)} readings:    {fast_s:8.2f} s")
+    print(f"pure Python,  {len(subset)} readings:    {slow_s:8.2f} s  ({slow_s / fast_s:.0f}x)")
+    print(f"results agree: {fast == slow}")
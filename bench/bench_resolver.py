@@ -0,0 +1,84 @@
+"""Time MetadataResolver against a local SQLite metadata dump.
+
+Extracts a synthetic corpus, writes a works table covering most of its DOIs
+(standing in for a DOI registry dump), then resolves the corpus three times:
+
+  cold       empty disk cache: every DOI goes to the store, in batches
+  warm disk  a new resolver reading the cache the cold run saved
+  warm LRU   the same resolver again, served from its in-memory LRU
+
+    python bench/bench_resolver.py --readings 20000 --batch 256
+"""
+
+import os
+import sys
+import time
+import random
+import sqlite3
+import argparse
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from synth import write_corpus
+import readings_pipeline
+
+
+def write_store(path, records, coverage, seed=0):
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE works (doi TEXT PRIMARY KEY, title TEXT, authors TEXT, year INTEGER, venue TEXT)")
+    rows = {}
+    for r in records:
+        doi = readings_pipeline.reading_doi(r)
+        if doi and rng.random() < coverage:
+            rows[doi] = (doi, r.title.title(), r.authors, r.year, r.venue)
+    conn.executemany("INSERT INTO works VALUES (?, ?, ?, ?, ?)", rows.values())
+    conn.commit()
+    conn.close()
+    return len(rows)
+
+
+def run(resolver, records):
+    start = time.perf_counter()
+    out = list(resolver.collect(records))
+    elapsed = time.perf_counter() - start
+    dois = sum(b['dois'] for b in resolver.batches)
+    cached = sum(b['lru_hits'] + b['disk_hits'] for b in resolver.batches)
+    resolved = sum(b['resolved'] for b in resolver.batches)
+    return out, elapsed, cached / dois if dois else 0.0, resolved
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batched, cached DOI metadata resolution.")
+    parser.add_argument('--readings', type=int, default=20000)
+    parser.add_argument('--batch', type=int, default=256)
+    parser.add_argument('--coverage', type=float, default=0.9,
+                        help="share of DOIs present in the metadata dump")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        raw = os.path.join(tmp_dir, "corpus.txt")
+        write_corpus(raw, args.readings)
+        records = list(readings_pipeline.iter_readings(raw))
+        store_path = os.path.join(tmp_dir, "works.sqlite")
+        n_works = write_store(store_path, records, args.coverage)
+        cache_path = os.path.join(tmp_dir, "metadata_cache.jsonl")
+
+        cold = readings_pipeline.MetadataResolver(
+            readings_pipeline.open_metadata_store(store_path), cache_path, batch_size=args.batch)
+        _, cold_s, cold_rate, resolved = run(cold, records)
+        cold.write()
+
+        warm = readings_pipeline.MetadataResolver(
+            readings_pipeline.open_metadata_store(store_path), cache_path,
+            lru_size=len(records), batch_size=args.batch)
+        _, disk_s, disk_rate, _ = run(warm, records)
+        _, lru_s, lru_rate, _ = run(warm, records)
+
+    print(f"readings: {len(records)}, works in store: {n_works}, resolved: {resolved}, batch size {args.batch}")
+    print(f"{'run':<10} {'seconds':>8} {'hit rate':>9}")
+    for name, seconds, rate in (('cold', cold_s, cold_rate), ('warm disk', disk_s, disk_rate),
+                                ('warm LRU', lru_s, lru_rate)):
+        print(f"{name:<10} {seconds:>8.3f} {rate:>9.0%}")
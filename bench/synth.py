@@ -0,0 +1,124 @@
+"""Synthesize raw reading dumps in the readings_raw_v3.txt format.
+
+Sections use the same mix of header styles as the real dump ("< Section 1: ...",
+"<Section 2: ...>", bare "Section 6: ...") and readings are numbered globally,
+each with a wrapped citation ending in a DOI, a one-line summary and three
+discussion paragraphs.
+"""
+
+import os
+import random
+import argparse
+
+SECTION_TITLES = [
+    "Foundations of Social Friction & Face-to-Face Interaction",
+    "Neural Plasticity & Social Learning",
+    "Variable Reinforcement and Social Calibration",
+    "Theory of Mind and Communication Tailoring",
+    "Understanding AI Architectures and RLHF",
+    "AI Companionship",
+    "Where AI Companionship Goes Wrong",
+    "Developmental Impact and Critical Periods",
+    "Societal Implications and Future Directions",
+]
+
+WORDS = (
+    "social friction feedback learning interaction repair face model companion "
+    "reward signal adolescence plasticity dialogue alignment uncertainty trust "
+    "calibration reinforcement network behavior cognition memory audience design "
+    "language preference sycophancy dependence loneliness development capital"
+).split()
+
+SURNAMES = ["Goffman", "Hadley", "Sacks", "Frank", "Horton", "Shannon", "Pickering", "Brown", "Zhang", "Cheng"]
+VENUES = ["Psychiatry", "Nature Reviews Psychology", "Science", "Cognition", "Journal of Memory and Language"]
+
+
+def _sentence(rng, n_words, words=WORDS):
+    picked = [rng.choice(words) for _ in range(n_words)]
+    return " ".join(picked).capitalize() + "."
+
+
+def _paragraph(rng, n_sentences, words=WORDS):
+    return " ".join(_sentence(rng, rng.randint(8, 20), words) for _ in range(n_sentences))
+
+
+def _vocabulary(rng, size):
+    """WORDS plus size made-up terms, so discussion text has a realistic long tail."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    extra = {"".join(rng.choice(letters) for _ in range(rng.randint(4, 10))) for _ in range(size)}
+    return WORDS + sorted(extra)
+
+
+def _header(number, title):
+    style = number % 3
+    if style == 0:
+        return f"< Section {number}: {title}>\n"
+    if style == 1:
+        return f"<Section {number}: {title}>\n"
+    return f"Section {number}: {title}\n"
+
+
+def write_corpus(path, n_readings, seed=0, paragraph_sentences=5, vocabulary=0):
+    """Write a dump with n_readings readings spread over the nine sections.
+
+    vocabulary adds that many extra random terms to the discussion paragraphs;
+    the default keeps the small fixed word list (and byte-identical output).
+    """
+    rng = random.Random(seed)
+    words = _vocabulary(random.Random(seed + 1), vocabulary) if vocabulary else WORDS
+    per_section = -(-n_readings // len(SECTION_TITLES))
+    written = 0
+    with open(path, 'w') as f:
+        for sec_idx, title in enumerate(SECTION_TITLES, start=1):
+            if written >= n_readings:
+                break
+            f.write(_header(sec_idx, title))
+            f.write("\n")
+            for _ in range(min(per_section, n_readings - written)):
+                written += 1
+                f.write(_reading(rng, written, words, paragraph_sentences))
+    return written
+
+
+def _reading(rng, number, words, paragraph_sentences):
+    author = f"{rng.choice(SURNAMES)}, {rng.choice('ABCDEFGH')}."
+    year = rng.randint(1950, 2025)
+    title_words = _sentence(rng, rng.randint(5, 12))[:-1]
+    parts = [
+        f"{number}. {author} ({year}). {title_words}.\n"
+        f"{rng.choice(VENUES)}, {rng.randint(1, 99)}({rng.randint(1, 12)}), "
+        f"{rng.randint(1, 500)}–{rng.randint(501, 999)}. "
+        f"https://doi.org/10.{rng.randint(1000, 9999)}/{rng.randint(10**6, 10**7)}\n",
+        _sentence(rng, rng.randint(8, 16)) + "\n\n",
+    ]
+    for _ in range(3):
+        parts.append(_paragraph(rng, paragraph_sentences, words) + "\n\n")
+    return "".join(parts)
+
+
+def write_reading_files(out_dir, n_readings, seed=0, paragraph_sentences=5):
+    """Write one small dump per reading (its section header plus the reading)
+    into out_dir, the way editors drop in contributions. Returns the paths in
+    name order."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(n_readings):
+        sec_idx = i % len(SECTION_TITLES) + 1
+        path = os.path.join(out_dir, f"{i:07d}.txt")
+        with open(path, 'w') as f:
+            f.write(_header(sec_idx, SECTION_TITLES[sec_idx - 1]) + "\n")
+            f.write(_reading(rng, 1, WORDS, paragraph_sentences))
+        paths.append(path)
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic raw readings dump.")
+    parser.add_argument('output')
+    parser.add_argument('--readings', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--vocabulary', type=int, default=0,
+                        help="extra random terms in discussion paragraphs")
+    args = parser.parse_args()
+
+    write_corpus(args.output, args.readings, seed=args.seed, vocabulary=args.vocabulary)
@@ -0,0 +1,46 @@
+"""Generate the site's readings modules and indexes from raw reading dumps.
+
+Submodules are imported on first attribute access, so `import
+readings_pipeline` (and the `readings` command's startup) stays cheap; e.g.
+`readings_pipeline.related_neighbours` only loads the TF-IDF code when used.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'records': ('ExternalLinks', 'Discussion', 'Reading'),
+    'scan': ('GROUP_MAP', 'SECTION_START_PATTERN', 'SectionHeader', 'scan_section_headers',
+             'iter_reading_blocks', 'iter_reading_spans', 'split_sections', 'split_readings'),
+    'extract': ('ReadingExtractor', 'extract_reading'),
+    'profiling': ('Profiler', 'ProfiledExtractor', 'run_profiled'),
+    'cache': ('CACHE_VERSION', 'ReadingCache'),
+    'slugs': ('normalize_doi', 'normalize_citation', 'ReadingIndex'),
+    'metadata': ('reading_doi', 'JsonLinesMetadataStore', 'SqliteMetadataStore', 'open_metadata_store',
+                 'MetadataResolver'),
+    'pipeline': ('iter_readings', 'open_mapped', 'iter_readings_mmap', 'get_reading', 'collect_input_files',
+                 'load_readings', 'emit', 'extract_section', 'parse_readings'),
+    'ingest': ('aiter_reading_batches', 'aiter_readings', 'ingest_readings'),
+    'output': ('TS_HEADER', 'render_ts', 'write_ts', 'write_group_modules', 'write_if_changed',
+               'SplitModulesWriter', 'load_reading_groups', 'load_ts_module'),
+    'search': ('tokenize', 'SearchIndexBuilder'),
+    'related': ('related_neighbours', 'RelatedReadingsBuilder'),
+    'chat': ('CHAT_DOCUMENTS', 'chunk_markdown', 'chunk_reading', 'ChatIndexBuilder', 'bm25_search'),
+    'diff': ('load_records', 'diff_readings', 'format_diff'),
+    'watch': ('SectionRebuilder', 'watch'),
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULE_OF)
+
+
+def __getattr__(name):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
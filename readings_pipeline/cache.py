@@ -0,0 +1,81 @@
+"""On-disk cache of extracted records keyed by the hash of each reading's text."""
+
+import os
+import sys
+import json
+import hashlib
+
+from .extract import _EXTRACTOR
+from .records import Reading
+
+
+# Bump when extract_reading changes so cached records are re-extracted
+CACHE_VERSION = 1
+
+
+class ReadingCache:
+    """On-disk store of extracted records keyed by a hash of each raw reading.
+
+    Stored as JSON lines ({"key": ..., "record": ...}) so a one-line edit only
+    sends the edited reading back through extract_reading. Entries not used in
+    a run are dropped when the cache is saved.
+    """
+
+    def __init__(self, path, extractor=None):
+        self.path = path
+        self.extractor = extractor or _EXTRACTOR
+        self.entries = {}
+        self.used = {}
+        self.hits = 0
+        self.misses = 0
+
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A truncated last line just means a re-parse
+                        continue
+                    self.entries[entry['key']] = Reading.from_dict(entry['record'])
+
+    @staticmethod
+    def key(r_text, group_slug):
+        h = hashlib.sha256()
+        h.update(f"{CACHE_VERSION}\0{group_slug}\0".encode('utf-8'))
+        h.update(r_text.strip().encode('utf-8'))
+        return h.hexdigest()
+
+    def lookup(self, r_text, group_slug):
+        """Return (key, record), with record None on a miss."""
+        key = self.key(r_text, group_slug)
+        record = self.entries.get(key)
+        if record is not None:
+            self.hits += 1
+            self.used[key] = record
+        else:
+            self.misses += 1
+        return key, record
+
+    def store(self, key, record):
+        self.used[key] = record
+
+    def extract(self, r_text, group_slug):
+        key, record = self.lookup(r_text, group_slug)
+        if record is None:
+            record = self.extractor.extract(r_text, group_slug)
+            self.store(key, record)
+        return record
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            for key, record in self.used.items():
+                f.write(json.dumps({'key': key, 'record': record.to_dict()}) + '\n')
+        os.replace(tmp_path, self.path)
+
+    def report(self):
+        print(f"// cache: {self.hits} hits, {self.misses} re-parsed ({self.path})", file=sys.stderr)
@@ -0,0 +1,152 @@
+"""BM25 passage index of the paper and the readings for the paper-chat route."""
+
+import re
+import os
+import sys
+import json
+import math
+from collections import Counter
+
+from .output import write_if_changed
+from .search import tokenize
+
+
+_MD_HEADING_PATTERN = re.compile(r'^#{1,6}\s+(.+?)\s*$')
+_BLANK_LINE_PATTERN = re.compile(r'\n\s*\n')
+
+CHAT_DOCUMENTS = ('src/content/paper.mdx', 'initialprompt.md', 'README.md')
+
+
+def _pack_passages(blocks, max_words):
+    """Greedily join whole blocks into passages of at most max_words words.
+
+    A block longer than max_words on its own becomes its own passage.
+    """
+    passages = []
+    buf = []
+    words = 0
+    for block in blocks:
+        n = len(block.split())
+        if buf and words + n > max_words:
+            passages.append("\n\n".join(buf))
+            buf = []
+            words = 0
+        buf.append(block)
+        words += n
+    if buf:
+        passages.append("\n\n".join(buf))
+    return passages
+
+
+def chunk_markdown(text, source, max_words=150):
+    """Split a markdown document into passages that never cross a heading.
+
+    Returns dicts with source, title (the nearest heading) and text.
+    Paragraphs longer than 2 * max_words are split on line breaks first, so
+    long lists don't end up as a single passage.
+    """
+    sections = []
+    heading = ""
+    blocks = []
+    for block in _BLANK_LINE_PATTERN.split(text):
+        lines = block.strip().split("\n")
+        m = _MD_HEADING_PATTERN.match(lines[0])
+        if m:
+            sections.append((heading, blocks))
+            heading = m.group(1)
+            blocks = []
+            lines = lines[1:]
+        block = "\n".join(lines).strip()
+        if not block or block == "---":
+            continue
+        if len(block.split()) > 2 * max_words:
+            blocks.extend(line for line in block.split("\n") if line.strip())
+        else:
+            blocks.append(block)
+    sections.append((heading, blocks))
+
+    return [
+        {'source': source, 'title': title, 'text': passage}
+        for title, section_blocks in sections
+        for passage in _pack_passages(section_blocks, max_words)
+    ]
+
+
+def chunk_reading(record, max_words=150):
+    title = f"{record.title} ({record.authors}, {record.year})"
+    blocks = [record.one_line_summary, *record.discussion_paragraphs()]
+    return [
+        {'source': f"reading:{record.group_slug}/{record.slug}", 'title': title, 'text': passage}
+        for passage in _pack_passages([b for b in blocks if b], max_words)
+    ]
+
+
+class ChatIndexBuilder:
+    """BM25 passage index over the paper, project docs and every reading.
+
+    Side output for the paper-chat API route, which sends the model only the
+    top-k passages for a question instead of every document in full. Scores
+    are precomputed per (term, passage), so a lookup is a sum over the
+    query's postings; see bm25_search() and src/lib/paperChatRetrieval.ts.
+    """
+
+    def __init__(self, path, documents=CHAT_DOCUMENTS, max_words=150, k1=1.2, b=0.75):
+        self.path = path
+        self.documents = documents
+        self.max_words = max_words
+        self.k1 = k1
+        self.b = b
+        self.reading_chunks = []
+
+    def collect(self, readings):
+        self.reading_chunks = []
+        for record in readings:
+            self.reading_chunks.extend(chunk_reading(record, self.max_words))
+            yield record
+
+    def build(self):
+        chunks = []
+        for doc_path in self.documents:
+            with open(doc_path, 'r', encoding='utf-8') as f:
+                chunks.extend(chunk_markdown(f.read(), os.path.basename(doc_path), self.max_words))
+        chunks.extend(self.reading_chunks)
+
+        term_counts = [Counter(tokenize(c['title'] + " " + c['text'])) for c in chunks]
+        lengths = [sum(c.values()) for c in term_counts]
+        avg_len = sum(lengths) / len(lengths) if lengths else 0.0
+        df = Counter(term for counts in term_counts for term in counts)
+        n = len(chunks)
+
+        postings = {}
+        for doc, counts in enumerate(term_counts):
+            norm = self.k1 * (1 - self.b + self.b * lengths[doc] / avg_len)
+            for term, tf in counts.items():
+                idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+                weight = idf * tf * (self.k1 + 1) / (tf + norm)
+                postings.setdefault(term, []).extend((doc, round(weight, 3)))
+        return {'chunks': chunks, 'postings': dict(sorted(postings.items()))}
+
+    def write(self):
+        index = self.build()
+        text = json.dumps(index, separators=(',', ':')) + "\n"
+        changed = write_if_changed(self.path, text)
+        state = "written" if changed else "unchanged"
+        print(f"// chat index: {len(index['chunks'])} passages, {len(index['postings'])} terms, "
+              f"{len(text.encode('utf-8')):,} bytes, {self.path} {state}", file=sys.stderr)
+        return changed
+
+
+def bm25_search(index, query, k=6):
+    """Positions of the top-k passages of a ChatIndexBuilder index for query.
+
+    Reference for searchPassages() in src/lib/paperChatRetrieval.ts: each
+    distinct query term adds its precomputed weight; ties go to the earlier
+    passage.
+    """
+    scores = {}
+    for term in set(tokenize(query)):
+        flat = index['postings'].get(term, ())
+        for i in range(0, len(flat), 2):
+            scores[flat[i]] = scores.get(flat[i], 0.0) + flat[i + 1]
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return [doc for doc, _ in ranked[:k]]
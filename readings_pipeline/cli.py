@@ -0,0 +1,283 @@
+"""The `readings` command: parse, diff, watch and bench subcommands.
+
+Only argparse is imported up front; each subcommand imports the modules it
+needs when it runs, so `readings --help` or a typo doesn't pay for the
+parser, sqlite3 or NumPy.
+"""
+
+import os
+import sys
+import argparse
+
+COMMANDS = ('parse', 'diff', 'watch', 'bench')
+BENCH_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bench')
+# Modules the bench scripts import, not scripts themselves
+BENCH_HELPERS = ('synth.py', 'parse_readings_v4_baseline.py')
+
+
+def _add_build_arguments(parser, default_inputs):
+    parser.add_argument('inputs', nargs='*' if default_inputs else '+', default=list(default_inputs),
+                        help="raw dump(s) or directories of *.txt dumps")
+    parser.add_argument('--stream', action='store_true',
+                        help="read the input line by line instead of loading it whole")
+    parser.add_argument('--cache', metavar='PATH',
+                        help="reuse extracted records for unchanged readings (e.g. .readings_cache.jsonl)")
+    parser.add_argument('--jobs', type=int, default=1,
+                        help="extract sections on this many worker processes")
+    parser.add_argument('--ingest', action='store_true',
+                        help="read many small input files through the asyncio pipeline, streaming records "
+                             "in input-file order with bounded memory")
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help="with --ingest, chunks of files read at once (default 8)")
+    parser.add_argument('--output', '-o', metavar='PATH',
+                        help="write the module to PATH (atomically) instead of stdout")
+    parser.add_argument('--split-groups', metavar='DIR',
+                        help="also write one module per groupSlug (plus index.ts) into DIR")
+    parser.add_argument('--mmap', action='store_true',
+                        help="scan a memory-mapped input by byte offsets instead of reading text")
+    parser.add_argument('--get', nargs=2, metavar=('SECTION', 'NUMBER'),
+                        help="print a single reading from the first input as JSON and exit")
+    parser.add_argument('--index', metavar='PATH',
+                        help="persist assigned slugs here so they stay stable across rebuilds")
+    parser.add_argument('--profile', metavar='REPORT',
+                        help="write per-stage timings of the batch path as JSON to REPORT ('-' for stderr)")
+    parser.add_argument('--cprofile', action='store_true',
+                        help="with --profile, add the top cProfile functions to the report")
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help="with --profile, add peak memory and top allocation sites to the report")
+    parser.add_argument('--metadata-store', metavar='PATH',
+                        help="replace heuristic title/authors/year/venue with metadata looked up by DOI in a "
+                             "local dump (.jsonl, or .sqlite/.db with a works table)")
+    parser.add_argument('--metadata-cache', metavar='PATH',
+                        help="with --metadata-store, remember lookups (including misses) across runs "
+                             "(e.g. .metadata_cache.jsonl)")
+    parser.add_argument('--metadata-batch', type=int, default=256,
+                        help="readings per metadata lookup batch (default 256)")
+    parser.add_argument('--metadata-stats', metavar='PATH',
+                        help="with --metadata-store, write per-batch hit and timing stats as JSON to PATH")
+    parser.add_argument('--search-index', metavar='PATH',
+                        help="also write an inverted search index module (e.g. src/content/readingsSearchIndex.ts)")
+    parser.add_argument('--split-bodies', metavar='DIR',
+                        help="also write a summaries-only index.ts plus lazily loaded per-group body modules "
+                             "(e.g. src/content/readingsIndex) and report the size saved")
+    parser.add_argument('--chat-index', metavar='PATH',
+                        help="also write a BM25 passage index of the readings and --chat-docs for the "
+                             "paper-chat route (e.g. src/content/paperChatIndex.json)")
+    parser.add_argument('--chat-docs', nargs='+', metavar='FILE',
+                        help="markdown documents to include in --chat-index "
+                             "(default: src/content/paper.mdx, initialprompt.md and README.md)")
+    parser.add_argument('--related', metavar='PATH',
+                        help="also write top-k related readings per reading (e.g. src/content/readingsRelated.ts)")
+    parser.add_argument('--related-k', type=int, default=3,
+                        help="neighbours per reading for --related (default 3)")
+
+
+COMMAND_HELP = {
+    'parse': "generate the module (default)",
+    'watch': "rebuild the module whenever the raw dump changes",
+    'diff': "compare two versions reading by reading",
+    'bench': "run a script from bench/ (source checkout only)",
+}
+
+
+def _top_parser():
+    # Lists the subcommands without building their (larger) parsers
+    parser = argparse.ArgumentParser(
+        prog='readings',
+        description="Generate the readings TypeScript module and indexes from raw dumps. "
+                    "Without a subcommand, arguments are passed to `parse`.",
+    )
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+    for name in COMMANDS:
+        commands.add_parser(name, help=COMMAND_HELP[name])
+    return parser
+
+
+def build_parser(command, default_inputs=()):
+    """The argument parser of one subcommand."""
+    if command == 'parse':
+        parser = argparse.ArgumentParser(prog='readings parse',
+                                         description="Generate the readings TypeScript module from a raw dump.")
+        _add_build_arguments(parser, default_inputs)
+        parser.add_argument('--watch', action='store_true',
+                            help="rebuild --output/--split-groups whenever the input changes")
+    elif command == 'watch':
+        parser = argparse.ArgumentParser(prog='readings watch', description="Same as `readings parse --watch`.")
+        _add_build_arguments(parser, default_inputs)
+        parser.set_defaults(watch=True)
+    elif command == 'diff':
+        parser = argparse.ArgumentParser(prog='readings diff',
+                                         description="Compare two generated modules (.ts) or raw dumps reading by "
+                                                     "reading; exit status 1 when they differ, like diff(1).")
+        parser.add_argument('old')
+        parser.add_argument('new')
+        parser.add_argument('--json', action='store_true', help="print the diff as JSON")
+    else:
+        parser = argparse.ArgumentParser(prog='readings bench',
+                                         description="Run bench/bench_NAME.py (or bench/NAME.py) with the "
+                                                     "remaining arguments; without NAME, list the scripts.")
+        parser.add_argument('name', nargs='?')
+        parser.add_argument('args', nargs=argparse.REMAINDER)
+    return parser
+
+
+def _side_outputs(args):
+    side_outputs = []
+    if args.metadata_store:
+        from .metadata import MetadataResolver, open_metadata_store
+        # First, so the other side outputs and the module see resolved records
+        side_outputs.append(MetadataResolver(open_metadata_store(args.metadata_store), args.metadata_cache,
+                                             batch_size=args.metadata_batch, stats_path=args.metadata_stats))
+    if args.search_index:
+        from .search import SearchIndexBuilder
+        side_outputs.append(SearchIndexBuilder(args.search_index))
+    if args.related:
+        from .related import RelatedReadingsBuilder
+        side_outputs.append(RelatedReadingsBuilder(args.related, args.related_k))
+    if args.split_bodies:
+        from .output import SplitModulesWriter, load_reading_groups
+        # Re-emitting a module: keep the groups it defines
+        groups_src = next(filter(None, (load_reading_groups(path) for path in args.inputs
+                                        if path.endswith('.ts'))), None)
+        side_outputs.append(SplitModulesWriter(args.split_bodies, groups_src=groups_src,
+                                                search_index_path=args.search_index, related_path=args.related))
+    if args.chat_index:
+        from .chat import CHAT_DOCUMENTS, ChatIndexBuilder
+        side_outputs.append(ChatIndexBuilder(args.chat_index, args.chat_docs or list(CHAT_DOCUMENTS)))
+    return side_outputs
+
+
+def run_parse(parser, args):
+    import json
+    from .cache import ReadingCache
+    from .slugs import ReadingIndex
+
+    side_outputs = _side_outputs(args)
+
+    if args.profile:
+        if args.stream or args.mmap or args.jobs > 1 or args.watch or len(args.inputs) != 1:
+            parser.error("--profile instruments the batch path of a single input; drop --stream/--mmap/--jobs/--watch")
+        from .profiling import run_profiled
+        cache = ReadingCache(args.cache) if args.cache else None
+        index = ReadingIndex(args.index)
+        report = run_profiled(args.inputs[0], args.cprofile, args.tracemalloc,
+                              cache=cache, output_path=args.output,
+                              groups_dir=args.split_groups, index=index,
+                              side_outputs=side_outputs)
+        index.save()
+        if cache:
+            cache.save()
+        if args.profile == '-':
+            print(json.dumps(report, indent=2), file=sys.stderr)
+        else:
+            with open(args.profile, 'w') as f:
+                json.dump(report, f, indent=2)
+                f.write('\n')
+        return 0
+
+    if args.watch:
+        if len(args.inputs) != 1 or not (args.output or args.split_groups):
+            parser.error("--watch needs a single input file and --output or --split-groups")
+        from .watch import watch
+        watch(args.inputs[0], args.output, args.split_groups, args.index,
+              ReadingCache(args.cache) if args.cache else None,
+              side_outputs=side_outputs)
+        return 0
+
+    from .pipeline import emit, get_reading, load_readings, parse_readings
+
+    if args.get:
+        from .records import _to_json
+        reading = get_reading(args.inputs[0], *args.get)
+        if reading is None:
+            sys.exit(f"no reading {args.get[1]} in section {args.get[0]} of {args.inputs[0]}")
+        print(json.dumps(reading, indent=2, default=_to_json))
+        return 0
+
+    cache = ReadingCache(args.cache) if args.cache else None
+    index = ReadingIndex(args.index)
+    if args.ingest:
+        if args.stream or args.mmap:
+            parser.error("--ingest reads each file whole; drop --stream/--mmap")
+        from .ingest import ingest_readings
+        emit(ingest_readings(args.inputs, concurrency=args.concurrency, jobs=args.jobs, cache=cache),
+             args.output, args.split_groups, index, side_outputs)
+    elif all(path.endswith('.ts') for path in args.inputs):
+        from .output import load_ts_module
+        # Already-generated modules: re-emit them (e.g. to build a search index)
+        readings = [r for path in args.inputs for r in load_ts_module(path)]
+        emit(readings, args.output, args.split_groups, index, side_outputs)
+    elif len(args.inputs) == 1 and os.path.isfile(args.inputs[0]) and args.jobs <= 1:
+        parse_readings(args.inputs[0], stream=args.stream, cache=cache,
+                       output_path=args.output, groups_dir=args.split_groups,
+                       use_mmap=args.mmap, index=index, side_outputs=side_outputs)
+    else:
+        emit(load_readings(args.inputs, jobs=args.jobs, cache=cache), args.output, args.split_groups,
+             index, side_outputs)
+    index.save()
+    index.report()
+    if cache:
+        cache.save()
+        cache.report()
+    return 0
+
+
+def run_diff(args):
+    from .diff import diff_readings, format_diff, load_records
+
+    result = diff_readings(load_records(args.old), load_records(args.new))
+    if args.json:
+        import json
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print(format_diff(result))
+    return 1 if result['added'] or result['removed'] or result['moved'] or result['changed'] else 0
+
+
+def run_bench(parser, args):
+    if not os.path.isdir(BENCH_DIR):
+        parser.error("bench needs a source checkout (no bench/ directory next to the package)")
+    scripts = sorted(name[:-3] for name in os.listdir(BENCH_DIR)
+                     if name.endswith('.py') and name not in BENCH_HELPERS)
+    if not args.name:
+        print("\n".join(name[len('bench_'):] if name.startswith('bench_') else name for name in scripts))
+        return 0
+    for name in (f'bench_{args.name}', args.name):
+        if name in scripts:
+            break
+    else:
+        parser.error(f"no bench script {args.name!r} in {BENCH_DIR}")
+
+    import runpy
+    path = os.path.join(BENCH_DIR, f'{name}.py')
+    saved_argv, saved_path = sys.argv, list(sys.path)
+    sys.argv = [path] + args.args
+    sys.path.insert(0, BENCH_DIR)
+    try:
+        runpy.run_path(path, run_name='__main__')
+    except SystemExit as e:
+        return e.code
+    finally:
+        sys.argv, sys.path[:] = saved_argv, saved_path
+    return 0
+
+
+def main(argv=None, default_inputs=()):
+    """Entry point of the `readings` command; returns the exit status.
+
+    default_inputs is used when `parse` gets no inputs (parse_readings_v4.py
+    passes readings_raw_v3.txt, as it always has).
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv and not default_inputs or argv[:1] in (['-h'], ['--help']):
+        _top_parser().print_help()
+        return 0 if argv else 2
+    command = argv.pop(0) if argv and argv[0] in COMMANDS else 'parse'
+
+    parser = build_parser(command, default_inputs)
+    args = parser.parse_args(argv)
+    if command == 'diff':
+        return run_diff(args)
+    if command == 'bench':
+        return run_bench(parser, args)
+    return run_parse(parser, args)
@@ -0,0 +1,121 @@
+"""Structural diff of two versions of the readings."""
+
+import json
+
+from .output import load_ts_module
+from .pipeline import iter_readings
+from .slugs import ReadingIndex, normalize_citation, normalize_doi
+
+
+def load_records(path):
+    """Readings from a generated .ts module, or parsed from a raw dump with
+    the same slug assignment as a normal run."""
+    if path.endswith('.ts'):
+        return load_ts_module(path)
+    return list(ReadingIndex().assign(iter_readings(path)))
+
+
+def _flatten(record):
+    flat = {}
+    for key, value in record.to_dict().items():
+        if isinstance(value, dict):
+            for sub, sub_value in value.items():
+                flat[f"{key}.{sub}"] = sub_value
+        else:
+            flat[key] = value
+    return flat
+
+
+def _match_records(old, new):
+    """Pair old and new readings in linear time; returns [(old_i, new_j), ...].
+
+    Passes from strongest to weakest identity: DOI, normalized citation,
+    group plus slug, then slug alone (a reading moved to another group
+    without a DOI). Each pass only pairs keys that are unique on both sides
+    among the readings still unmatched.
+    """
+    keys = (
+        lambda r: normalize_doi(r.external_links.doi),
+        lambda r: normalize_citation(r.full_citation) or None,
+        lambda r: f"{r.group_slug}/{r.slug}",
+        lambda r: r.slug or None,
+    )
+    old_left = set(range(len(old)))
+    new_left = set(range(len(new)))
+    pairs = []
+    for key in keys:
+        old_by_key = {}
+        for i in sorted(old_left):
+            k = key(old[i])
+            if k is not None:
+                old_by_key.setdefault(k, []).append(i)
+        new_by_key = {}
+        for j in sorted(new_left):
+            k = key(new[j])
+            if k is not None:
+                new_by_key.setdefault(k, []).append(j)
+        for k, olds in old_by_key.items():
+            news = new_by_key.get(k)
+            if len(olds) == 1 and news and len(news) == 1:
+                pairs.append((olds[0], news[0]))
+                old_left.discard(olds[0])
+                new_left.discard(news[0])
+    return pairs, sorted(old_left), sorted(new_left)
+
+
+def diff_readings(old, new):
+    """Structural diff of two lists of readings.
+
+    Returns a dict of added/removed readings (by id), moved readings (matched
+    but in a different group) and per-field changes of matched readings,
+    with nested fields flattened to e.g. "discussion.coreIdea".
+    """
+    def ident(r):
+        return f"{r.group_slug}/{r.slug}"
+
+    pairs, removed, added = _match_records(old, new)
+    moved = []
+    changed = []
+    for i, j in sorted(pairs, key=lambda pair: pair[1]):
+        a, b = old[i], new[j]
+        if a.group_slug != b.group_slug:
+            moved.append({'from': ident(a), 'to': ident(b)})
+        elif a == b:
+            continue
+        fa, fb = _flatten(a), _flatten(b)
+        fields = {
+            name: {'old': fa.get(name), 'new': fb.get(name)}
+            for name in dict.fromkeys([*fa, *fb])
+            if name != 'groupSlug' and fa.get(name) != fb.get(name)
+        }
+        if fields:
+            changed.append({'id': ident(b), 'fields': fields})
+    return {
+        'old_count': len(old),
+        'new_count': len(new),
+        'added': [{'id': ident(new[j]), 'title': new[j].title} for j in added],
+        'removed': [{'id': ident(old[i]), 'title': old[i].title} for i in removed],
+        'moved': moved,
+        'changed': changed,
+    }
+
+
+def _describe_change(old, new, width=60):
+    if isinstance(old, str) and isinstance(new, str) and max(len(old), len(new)) > width:
+        return f"{len(old)} -> {len(new)} chars"
+    return f"{json.dumps(old, ensure_ascii=False)} -> {json.dumps(new, ensure_ascii=False)}"
+
+
+def format_diff(result):
+    lines = [
+        f"readings: {result['old_count']} -> {result['new_count']} "
+        f"(+{len(result['added'])} added, -{len(result['removed'])} removed, "
+        f"{len(result['moved'])} moved, {len(result['changed'])} changed)"
+    ]
+    lines += [f"+ {r['id']}  {r['title']}" for r in result['added']]
+    lines += [f"- {r['id']}  {r['title']}" for r in result['removed']]
+    lines += [f"> {m['from']} -> {m['to']}" for m in result['moved']]
+    for c in result['changed']:
+        lines.append(f"~ {c['id']}")
+        lines += [f"    {name}: {_describe_change(v['old'], v['new'])}" for name, v in c['fields'].items()]
+    return "\n".join(lines)
@@ -0,0 +1,162 @@
+"""Turning the text of one reading into a Reading record."""
+
+import re
+
+from .records import Discussion, ExternalLinks, Reading
+
+
+class ReadingExtractor:
+    """Turns one raw reading block into a Reading record.
+
+    All patterns are compiled once on the class, so the per-reading cost is
+    just the scans themselves. summary_break is the line length above which a
+    line following the summary is treated as the start of the body.
+    """
+
+    YEAR_PATTERN = re.compile(r'\((\d{4})\)')
+    URL_PATTERN = re.compile(r'(https?://\S+)')
+    PARAGRAPH_SPLIT_PATTERN = re.compile(r'\n\s*\n')
+
+    def __init__(self, summary_break=150):
+        self.summary_break = summary_break
+
+    def extract(self, r_text, group_slug):
+        lines = r_text.strip().split('\n')
+
+        full_citation, citation_end = self.citation(lines)
+        summary_text, body_text = self.summary_and_body(lines, citation_end)
+        core_idea, question, why_matters = self.paragraphs(body_text)
+        author, year, title, venue = self.metadata(full_citation)
+        doi, url = self.links(full_citation)
+
+        return Reading(
+            slug=self.slug(title),
+            group_slug=group_slug,
+            title=title,
+            authors=author,
+            year=year,
+            venue=venue,
+            full_citation=full_citation,
+            external_links=ExternalLinks(
+                doi=doi if doi else None,
+                url=url if url and not doi else None
+            ),
+            one_line_summary=summary_text,
+            discussion=Discussion(core_idea, question, why_matters)
+        )
+
+    def citation(self, lines):
+        """1. Extract Citation: everything up to and including the URL/DOI line."""
+        # Find URL/DOI line
+        url_index = -1
+        for idx, line in enumerate(lines):
+            if 'http' in line or 'doi.org' in line:
+                url_index = idx
+                break
+
+        if url_index != -1:
+            citation_end = url_index + 1
+        else:
+            # Fallback: First line is citation
+            citation_end = 1
+
+        full_citation = " ".join([l.strip() for l in lines[:citation_end]]).strip()
+        return full_citation, citation_end
+
+    def summary_and_body(self, lines, start):
+        """2. Extract Summary and Body from the lines after the citation."""
+        # Skip empty lines at the start of the remaining lines
+        while start < len(lines) and not lines[start].strip():
+            start += 1
+
+        summary_lines = []
+        body_lines = []
+
+        # Logic: Read lines. If we hit a blank line, we are done with summary.
+        # If we hit a very long line (likely a paragraph) and we already have some summary, maybe we are done?
+        # But "one line summary" might be wrapped.
+
+        in_summary = True
+        for line in lines[start:]:
+            if not line.strip():
+                # Empty line -> End of summary
+                if summary_lines: # Only if we have something
+                    in_summary = False
+                continue
+
+            if in_summary:
+                # Check if this line looks like the start of a body paragraph
+                # Heuristic: If we already have a summary line, and this line is long, it's probably body.
+                if summary_lines and len(line) > self.summary_break:
+                    in_summary = False
+                    body_lines.append(line)
+                else:
+                    summary_lines.append(line)
+            else:
+                body_lines.append(line)
+
+        summary_text = " ".join([l.strip() for l in summary_lines]).strip()
+        body_text = "\n".join(body_lines).strip()
+        return summary_text, body_text
+
+    def paragraphs(self, body_text):
+        """3. Parse Body Paragraphs into (coreIdea, questionAnswered, whyItMatters)."""
+        paragraphs = self.PARAGRAPH_SPLIT_PATTERN.split(body_text)
+        paragraphs = [p.strip() for p in paragraphs if p.strip()]
+
+        core_idea = paragraphs[0] if len(paragraphs) > 0 else ""
+        question = paragraphs[1] if len(paragraphs) > 1 else ""
+        why_matters = paragraphs[2] if len(paragraphs) > 2 else ""
+        return core_idea, question, why_matters
+
+    def metadata(self, full_citation):
+        """4. Extract Metadata: (author, year, title, venue) from the citation."""
+        author = "Unknown"
+        year = 2025
+        title = "Unknown Title"
+        venue = "Unknown Venue"
+
+        year_match = self.YEAR_PATTERN.search(full_citation)
+        if year_match:
+            year = int(year_match.group(1))
+            author_part = full_citation[:year_match.start()].strip()
+            if author_part.endswith('.'): author_part = author_part[:-1]
+            author = author_part
+
+            rest = full_citation[year_match.end():].strip()
+            if rest.startswith('.'): rest = rest[1:].strip()
+
+            # Title usually ends with period
+            # But venue might be "Nature 123"
+            # Heuristic: Split by ". "
+            # (partition, not split: a citation without a URL can be the
+            # whole single-line reading)
+            head, _, tail = rest.partition('. ')
+            title = head.strip()
+            venue = tail.strip()
+            if 'http' in venue:
+                venue = venue.partition('http')[0].strip()
+
+        return author, year, title, venue
+
+    def links(self, full_citation):
+        """(doi, url) found in the citation; empty strings when missing."""
+        url = ""
+        doi = ""
+        url_match = self.URL_PATTERN.search(full_citation)
+        if url_match:
+            url = url_match.group(1)
+            if 'doi.org' in url:
+                doi = url
+        return doi, url
+
+    def slug(self, title):
+        slug = title.lower().replace(':', '').replace('?', '').replace(',', '').replace('.', '').split(None, 5)[:5]
+        return "-".join(slug)
+
+
+_EXTRACTOR = ReadingExtractor()
+
+
+def extract_reading(r_text, group_slug):
+    return _EXTRACTOR.extract(r_text, group_slug)
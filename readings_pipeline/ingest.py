@@ -0,0 +1,167 @@
+"""Asyncio pipeline for ingesting many small raw files concurrently."""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .pipeline import _extract_section, _read_sections, collect_input_files
+
+
+def _extract_sections(sections):
+    # One executor call per batch (each costs ~100 us); top-level so ProcessPoolExecutor can pickle it
+    return [_extract_section(group_slug, texts) for group_slug, texts in sections]
+
+
+class _Chunk:
+    """A few consecutive input files between their read and the merge."""
+
+    __slots__ = ('done', 'records', 'misses')
+
+    def __init__(self, done):
+        self.done = done
+        self.records = None
+        self.misses = []
+
+
+async def aiter_reading_batches(paths, concurrency=8, jobs=1, cache=None, chunk_size=64, window=None,
+                                batch_size=256):
+    """Yield lists of records from many raw files, in input order.
+
+    Files are handled in chunks of chunk_size consecutive files, so each
+    hand-off to an executor carries enough work to pay for itself. Four
+    stages, connected so that memory stays flat however many files there
+    are:
+
+      read     up to `concurrency` chunks are read and split at once on a
+               thread pool
+      queue    chunks with readings still to extract wait in an
+               asyncio.Queue of `concurrency` chunks (cache hits skip
+               it); when it is full, readers wait for the extract stage
+      extract  queued readings go to an executor in batches of about
+               batch_size readings, grouped for _extract_section(): a
+               process pool with `jobs` workers, or one worker thread when
+               jobs <= 1
+      merge    finished chunks are yielded in input order as soon as every
+               earlier chunk has been yielded
+
+    At most `window` chunks (default 2 x concurrency) are between read and
+    merge at any time, so a slow file or a slow consumer stalls the readers
+    instead of growing the reorder buffer.
+    """
+    files = collect_input_files(paths)
+    chunks = [files[i:i + chunk_size] for i in range(0, len(files), chunk_size)]
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(window or 2 * concurrency)
+    reads = asyncio.Semaphore(concurrency)
+    queue = asyncio.Queue(maxsize=concurrency)
+    # Chunks in input order; bounded by slots, so the merge never falls behind
+    in_order = asyncio.Queue()
+    io_pool = ThreadPoolExecutor(max_workers=concurrency)
+    cpu_pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else ThreadPoolExecutor(max_workers=1)
+
+    async def read(chunk, file_paths):
+        try:
+            async with reads:
+                sections = await loop.run_in_executor(io_pool, _read_sections, file_paths)
+            blocks = [(group_slug, r_text) for group_slug, texts in sections for r_text in texts]
+            chunk.records = [None] * len(blocks)
+            for idx, (group_slug, r_text) in enumerate(blocks):
+                key = None
+                if cache:
+                    key, record = cache.lookup(r_text, group_slug)
+                    if record is not None:
+                        chunk.records[idx] = record
+                        continue
+                chunk.misses.append((idx, key, group_slug, r_text))
+        except Exception as e:
+            chunk.done.set_exception(e)
+            return
+        if chunk.misses:
+            await queue.put(chunk)
+        else:
+            chunk.done.set_result(None)
+
+    async def produce():
+        for file_paths in chunks:
+            # Released by the merge once this chunk has been yielded
+            await slots.acquire()
+            chunk = _Chunk(loop.create_future())
+            in_order.put_nowait(chunk)
+            task = asyncio.create_task(read(chunk, file_paths))
+            readers.add(task)
+            task.add_done_callback(readers.discard)
+        await asyncio.gather(*readers)
+
+    async def extract():
+        while True:
+            batch = [await queue.get()]
+            n_readings = len(batch[0].misses)
+            while n_readings < batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+                n_readings += len(batch[-1].misses)
+            by_group = {}
+            for chunk in batch:
+                for _, _, group_slug, r_text in chunk.misses:
+                    by_group.setdefault(group_slug, []).append(r_text)
+            try:
+                results = await loop.run_in_executor(cpu_pool, _extract_sections, list(by_group.items()))
+            except Exception as e:
+                for chunk in batch:
+                    chunk.done.set_exception(e)
+                continue
+            extracted = {group_slug: iter(records) for group_slug, records in zip(by_group, results)}
+            for chunk in batch:
+                for idx, key, group_slug, _ in chunk.misses:
+                    record = next(extracted[group_slug])
+                    chunk.records[idx] = record
+                    if cache:
+                        cache.store(key, record)
+                chunk.misses = None
+                chunk.done.set_result(None)
+
+    # Two per worker, so one batch is being sent while the other runs
+    readers = set()
+    workers = [asyncio.create_task(extract()) for _ in range(max(1, jobs) * 2)]
+    producer = asyncio.create_task(produce())
+    try:
+        for _ in chunks:
+            chunk = await in_order.get()
+            await chunk.done
+            slots.release()
+            yield chunk.records
+        await producer
+    finally:
+        # Also reached when the consumer stops early or a file fails
+        tasks = workers + [producer] + list(readers)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        io_pool.shutdown(wait=True, cancel_futures=True)
+        cpu_pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def aiter_readings(paths, **kwargs):
+    """Yield records from many raw files in input order; see aiter_reading_batches()."""
+    async for records in aiter_reading_batches(paths, **kwargs):
+        for record in records:
+            yield record
+
+
+def ingest_readings(paths, **kwargs):
+    """Synchronous iterator over aiter_readings(), e.g. to feed emit().
+
+    The event loop runs while the next chunk's records are awaited and pauses
+    while the caller handles them, so a slow consumer (such as write_ts)
+    applies the same backpressure as inside the pipeline.
+    """
+    loop = asyncio.new_event_loop()
+    batches = aiter_reading_batches(paths, **kwargs)
+    try:
+        while True:
+            try:
+                records = loop.run_until_complete(batches.__anext__())
+            except StopAsyncIteration:
+                break
+            yield from records
+    finally:
+        loop.run_until_complete(batches.aclose())
+        loop.close()
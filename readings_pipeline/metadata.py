@@ -0,0 +1,249 @@
+"""Replacing heuristic title/authors/year/venue with metadata looked up by DOI."""
+
+import re
+import os
+import sys
+import json
+import time
+from collections import OrderedDict
+from dataclasses import replace
+
+from .slugs import normalize_doi
+
+
+_DOI_IN_URL_PATTERN = re.compile(r'\b(10\.\d{4,9}/[^\s?#]+)')
+
+_METADATA_FIELDS = ('title', 'authors', 'year', 'venue')
+
+_YEAR_PATTERN = re.compile(r'\s*(\d{4})(?!\d)')
+
+
+def reading_doi(record):
+    """Bare DOI of a reading: its doi.org link, else a DOI inside its URL."""
+    links = record.external_links
+    if links.doi:
+        return normalize_doi(links.doi)
+    m = _DOI_IN_URL_PATTERN.search(links.url or "")
+    return normalize_doi(m.group(1)) if m else None
+
+
+def _file_identity(*paths):
+    """Path, size and mtime of each existing file: changes whenever the dump is edited."""
+    identity = []
+    for path in paths:
+        if os.path.exists(path):
+            st = os.stat(path)
+            identity.append([os.path.abspath(path), st.st_size, st.st_mtime_ns])
+    return identity
+
+
+class JsonLinesMetadataStore:
+    """Metadata dump as JSON lines: {"doi": ..., "title", "authors", "year", "venue"}.
+
+    The dump is parsed on the first fetch(), so a build that the resolver's
+    disk cache answers completely never reads it.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.works = None
+
+    def _load(self):
+        works = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entry = json.loads(line)
+                    works[normalize_doi(entry['doi'])] = {
+                        k: entry[k] for k in _METADATA_FIELDS if entry.get(k)
+                    }
+        return works
+
+    def identity(self):
+        return _file_identity(self.path)
+
+    def fetch(self, dois):
+        if self.works is None:
+            self.works = self._load()
+        return {doi: self.works[doi] for doi in dois if doi in self.works}
+
+
+class SqliteMetadataStore:
+    """Metadata dump in SQLite: table works(doi PRIMARY KEY, title, authors, year, venue).
+
+    DOIs are stored bare and lowercase (see normalize_doi). fetch() asks for
+    a whole batch with one IN (...) query per chunk of CHUNK DOIs.
+    """
+
+    CHUNK = 500
+
+    def __init__(self, path):
+        import sqlite3
+        self.path = path
+        self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+    def identity(self):
+        # Writes in WAL mode land in the -wal file until a checkpoint
+        return _file_identity(self.path, self.path + '-wal')
+
+    def fetch(self, dois):
+        dois = list(dois)
+        found = {}
+        for i in range(0, len(dois), self.CHUNK):
+            chunk = dois[i:i + self.CHUNK]
+            rows = self.conn.execute(
+                f"SELECT doi, {', '.join(_METADATA_FIELDS)} FROM works "
+                f"WHERE doi IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            )
+            for doi, *values in rows:
+                found[doi] = {k: v for k, v in zip(_METADATA_FIELDS, values) if v}
+        return found
+
+
+def open_metadata_store(path):
+    if path.endswith(('.sqlite', '.sqlite3', '.db')):
+        return SqliteMetadataStore(path)
+    return JsonLinesMetadataStore(path)
+
+
+class MetadataResolver:
+    """Replaces heuristic title/authors/year/venue with canonical metadata by DOI.
+
+    Used as the first side output of emit(): collect() groups the record
+    stream into batches of batch_size, looks every DOI up in an in-memory
+    LRU, then the on-disk cache, and only asks `store` (anything with
+    fetch(dois) -> {doi: {field: value}}) for the rest, in one call per
+    batch. Misses are cached too, so a rebuild never repeats a lookup.
+    The disk cache is stamped with the store's identity() (path, size and
+    mtime of the dump) and dropped when that changes, so edits to the dump
+    and works added to it are picked up on the next run; stores without
+    identity() are never served from the disk cache. Slugs are left alone
+    so reading URLs stay stable.
+    """
+
+    def __init__(self, store, cache_path=None, lru_size=4096, batch_size=256, stats_path=None):
+        self.store = store
+        self.cache_path = cache_path
+        self.stats_path = stats_path
+        self.lru_size = lru_size
+        self.batch_size = batch_size
+        self.lru = OrderedDict()
+        self.disk = {}
+        self.dirty = False
+        self.batches = []
+        self.store_identity = store.identity() if hasattr(store, 'identity') else None
+        self.stale_cache = False
+
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, 'r') as f:
+                stamp = None
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if 'store' in entry:
+                        stamp = entry['store']
+                    elif 'doi' in entry:
+                        self.disk[entry['doi']] = entry['meta']
+            if self.store_identity is None or stamp != self.store_identity:
+                self.stale_cache = bool(self.disk)
+                self.disk = {}
+                self.dirty = True
+
+    def _remember(self, doi, meta):
+        self.lru[doi] = meta
+        self.lru.move_to_end(doi)
+        if len(self.lru) > self.lru_size:
+            self.lru.popitem(last=False)
+
+    def lookup(self, dois):
+        """{doi: metadata or None} for a batch of DOIs, plus that batch's stats."""
+        start = time.perf_counter()
+        stats = {'dois': len(dois), 'lru_hits': 0, 'disk_hits': 0, 'fetched': 0, 'resolved': 0}
+        found = {}
+        missing = []
+        for doi in dois:
+            if doi in self.lru:
+                self.lru.move_to_end(doi)
+                found[doi] = self.lru[doi]
+                stats['lru_hits'] += 1
+            elif doi in self.disk:
+                found[doi] = self.disk[doi]
+                self._remember(doi, found[doi])
+                stats['disk_hits'] += 1
+            else:
+                missing.append(doi)
+        if missing:
+            fetched = self.store.fetch(missing)
+            stats['fetched'] = len(missing)
+            for doi in missing:
+                meta = fetched.get(doi)
+                found[doi] = self.disk[doi] = meta
+                self._remember(doi, meta)
+            self.dirty = True
+        stats['resolved'] = sum(1 for meta in found.values() if meta)
+        stats['seconds'] = time.perf_counter() - start
+        self.batches.append(stats)
+        return found
+
+    def apply(self, record, meta):
+        if not meta:
+            return record
+        fields = dict(meta)
+        if 'year' in fields:
+            # "2020a" keeps 2020; a year we can't read ("n.d.") keeps the heuristic one
+            m = _YEAR_PATTERN.match(str(fields['year']))
+            if m:
+                fields['year'] = int(m.group(1))
+            else:
+                del fields['year']
+        return replace(record, **fields)
+
+    def _resolve_batch(self, batch):
+        dois = [reading_doi(r) for r in batch]
+        found = self.lookup(list(dict.fromkeys(d for d in dois if d)))
+        return [self.apply(r, found.get(d)) if d else r for r, d in zip(batch, dois)]
+
+    def collect(self, readings):
+        self.batches = []
+        batch = []
+        for record in readings:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                yield from self._resolve_batch(batch)
+                batch = []
+        if batch:
+            yield from self._resolve_batch(batch)
+
+    def write(self):
+        if self.cache_path and self.dirty:
+            tmp_path = self.cache_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write(json.dumps({'store': self.store_identity}) + '\n')
+                for doi, meta in self.disk.items():
+                    f.write(json.dumps({'doi': doi, 'meta': meta}) + '\n')
+            os.replace(tmp_path, self.cache_path)
+            self.dirty = False
+        if self.stats_path:
+            with open(self.stats_path, 'w') as f:
+                json.dump({'batch_size': self.batch_size, 'batches': self.batches}, f, indent=2)
+                f.write('\n')
+        self.report()
+
+    def report(self):
+        if self.stale_cache:
+            print(f"// metadata: store changed since {self.cache_path} was written; cache dropped", file=sys.stderr)
+        totals = {k: sum(b[k] for b in self.batches) for k in ('dois', 'lru_hits', 'disk_hits', 'fetched', 'resolved')}
+        cached = totals['lru_hits'] + totals['disk_hits']
+        rate = cached / totals['dois'] if totals['dois'] else 0.0
+        times = [b['seconds'] * 1000 for b in self.batches] or [0.0]
+        print(f"// metadata: {totals['resolved']}/{totals['dois']} DOIs resolved, "
+              f"cache hit rate {rate:.0%} ({totals['lru_hits']} memory, {totals['disk_hits']} disk, "
+              f"{totals['fetched']} fetched); {len(self.batches)} batches, "
+              f"{sum(times) / len(times):.2f} ms mean / {max(times):.2f} ms max", file=sys.stderr)
@@ -0,0 +1,472 @@
+"""Rendering records as the generated TypeScript module(s) and reading them back."""
+
+import re
+import os
+import sys
+import json
+import gzip
+import hashlib
+import tempfile
+
+from .records import Reading, _to_json
+
+
+TS_HEADER = """import { Reading, ReadingGroup } from "./readings";
+
+export const readingGroups: ReadingGroup[] = [
+  {
+    slug: "foundations",
+    title: "Foundations of Social Friction",
+    subtitle: "Face-to-Face Interaction & Social Physics",
+    longDescription: "Core theories establishing why friction, irreversibility, and risk are essential features of human sociality, not bugs to be removed.",
+    themeTags: ["Sociology", "Interaction", "Face-work"]
+  },
+  {
+    slug: "neural-plasticity",
+    title: "Neural Plasticity & Social Learning",
+    subtitle: "How Experience Wires the Social Brain",
+    longDescription: "Neuroscientific evidence that social circuits require specific, intense, and often challenging inputs to develop and maintain function.",
+    themeTags: ["Neuroscience", "Plasticity", "Development"]
+  },
+  {
+    slug: "variable-reinforcement",
+    title: "Variable Reinforcement",
+    subtitle: "Social Calibration & Reward Systems",
+    longDescription: "Why the brain learns best from unpredictable, mixed-valence feedback (carrots and sticks) rather than constant validation.",
+    themeTags: ["Reinforcement Learning", "Dopamine", "Calibration"]
+  },
+  {
+    slug: "theory-of-mind",
+    title: "Theory of Mind",
+    subtitle: "Communication Tailoring & Mentalizing",
+    longDescription: "How we learn to model other minds through the friction of misunderstanding, repair, and audience design.",
+    themeTags: ["Psychology", "Communication", "Cognition"]
+  },
+  {
+    slug: "ai-architectures",
+    title: "AI Architectures & RLHF",
+    subtitle: "The Engineering of Frictionlessness",
+    longDescription: "Technical analysis of how LLMs and RLHF are optimized for smoothness, deference, and conflict avoidance.",
+    themeTags: ["AI Safety", "RLHF", "LLMs"]
+  },
+  {
+    slug: "ai-companionship",
+    title: "AI Companionship",
+    subtitle: "Current Usage & Dynamics",
+    longDescription: "Empirical data on how people are actually using AI companions and the relational dynamics that emerge.",
+    themeTags: ["HCI", "Companions", "Usage Trends"]
+  },
+  {
+    slug: "ai-risks",
+    title: "Where AI Companionship Goes Wrong",
+    subtitle: "Sycophancy, Dependence & Epistemic Bubbles",
+    longDescription: "Evidence of the downsides: how friction-free interaction leads to lower well-being, sycophancy, and reduced social capacity.",
+    themeTags: ["Risks", "Mental Health", "Sycophancy"]
+  },
+  {
+    slug: "developmental-impact",
+    title: "Developmental Impact",
+    subtitle: "Critical Periods & Adolescence",
+    longDescription: "Why adolescence is a sensitive period for social learning and how AI might interfere with normative development.",
+    themeTags: ["Development", "Adolescence", "Critical Periods"]
+  },
+  {
+    slug: "societal-implications",
+    title: "Societal Implications",
+    subtitle: "Long-term & Macro Effects",
+    longDescription: "Broader consequences for social capital, trust, and economic growth if social friction is systematically removed.",
+    themeTags: ["Economics", "Society", "Policy"]
+  }
+];
+
+export const readings: Reading[] = """
+
+
+_GROUPS_MARKER = "export const readingGroups"
+_READINGS_MARKER = "export const readings:"
+# Used when the input has no readingGroups of its own (raw dumps)
+_DEFAULT_GROUPS_SRC = TS_HEADER[TS_HEADER.index(_GROUPS_MARKER):TS_HEADER.index(_READINGS_MARKER)]
+
+
+def render_ts(readings_data):
+    return TS_HEADER + json.dumps(readings_data, indent=2, default=_to_json) + ";"
+
+
+_ENCODER = json.JSONEncoder(indent=2, default=_to_json)
+
+
+def _file_digest(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def write_ts(readings, output_path, header=TS_HEADER):
+    """Write a TS module to output_path, encoding records as they arrive.
+
+    readings may be any iterable (e.g. iter_readings), so the full list never
+    has to exist in memory. The bytes match print(render_ts(...)). The module
+    is written to a temp file next to output_path and renamed into place, so
+    the dev server never sees a half-written file; if the new bytes hash the
+    same as the existing file, the temp file is dropped and the existing
+    file (and its mtime) is left alone.
+
+    Returns (record_count, changed).
+    """
+    out_dir = os.path.dirname(os.path.abspath(output_path))
+    fd, tmp_path = tempfile.mkstemp(dir=out_dir, prefix='.readings-', suffix='.tmp')
+    digest = hashlib.sha256()
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            def write(text):
+                f.write(text)
+                digest.update(text.encode('utf-8'))
+
+            write(header)
+            count = 0
+            for record in readings:
+                write('[\n  ' if count == 0 else ',\n  ')
+                # JSON strings never contain raw newlines, so re-indenting
+                # the chunks nests the record one level like json.dumps does
+                for chunk in _ENCODER.iterencode(record):
+                    write(chunk.replace('\n', '\n  '))
+                count += 1
+            write('\n];\n' if count else '[];\n')
+
+        if os.path.exists(output_path) and _file_digest(output_path) == digest.hexdigest():
+            os.unlink(tmp_path)
+            return count, False
+
+        # mkstemp creates the file 0600
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return count, True
+
+
+def _group_identifier(group_slug):
+    head, *rest = group_slug.split('-')
+    return head + "".join(part.capitalize() for part in rest)
+
+
+def write_group_modules(readings, out_dir, types_import="../readings"):
+    """Write one module per groupSlug plus an index.ts that re-assembles them.
+
+    Editing a reading only changes its group's file, so the Next.js build
+    cache for the other groups stays valid. index.ts exports readingGroups
+    and readings like the single-file module and only changes when the set of
+    groups does.
+    """
+    by_group = {}
+    for record in readings:
+        by_group.setdefault(record.group_slug, []).append(record)
+
+    os.makedirs(out_dir, exist_ok=True)
+    group_header = f'import {{ Reading }} from "{types_import}";\n\nexport const readings: Reading[] = '
+
+    changed = []
+    for group_slug, records in by_group.items():
+        path = os.path.join(out_dir, f"{group_slug}.ts")
+        _, did_change = write_ts(records, path, header=group_header)
+        if did_change:
+            changed.append(path)
+
+    imports = "".join(
+        f'import {{ readings as {_group_identifier(g)} }} from "./{g}";\n' for g in by_group
+    )
+    spread = ",\n".join(f"  ...{_group_identifier(g)}" for g in by_group)
+    index_src = (
+        TS_HEADER.replace('from "./readings";\n', f'from "{types_import}";\n' + imports, 1)
+        + "[\n" + spread + "\n];\n"
+    )
+    index_path = os.path.join(out_dir, "index.ts")
+    if write_if_changed(index_path, index_src):
+        changed.append(index_path)
+    return changed
+
+
+def write_if_changed(path, text):
+    """Atomically write a small generated file unless its bytes are unchanged.
+
+    Returns True if the file was (re)written.
+    """
+    new_digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    if os.path.exists(path) and _file_digest(path) == new_digest:
+        return False
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return True
+
+
+_SPLIT_INDEX_HELPERS = """
+// Helper functions for lookups used across the app
+export function getGroup(slug: string): ReadingGroup | undefined {
+  return readingGroups.find((g) => g.slug === slug);
+}
+
+export function getReadingsByGroup(groupSlug: string): ReadingSummary[] {
+  return readingSummaries.filter((r) => r.groupSlug === groupSlug);
+}
+
+export function getReadingSummary(groupSlug: string, readingSlug: string): ReadingSummary | undefined {
+  return readingSummaries.find((r) => r.groupSlug === groupSlug && r.slug === readingSlug);
+}
+
+export function getAllTags(): string[] {
+  const tagSet = new Set<string>();
+  readingGroups.forEach((g) => {
+    g.themeTags.forEach((tag) => tagSet.add(tag));
+  });
+  return Array.from(tagSet).sort();
+}
+
+// Loads the citation and discussion text for one reading; each group's bodies
+// are a separate chunk, fetched on first use.
+export async function loadReadingBody(groupSlug: string, readingSlug: string): Promise<ReadingBody | undefined> {
+  const load = bodyLoaders[groupSlug];
+  if (!load) return undefined;
+  const { readingBodies } = await load();
+  return readingBodies[readingSlug];
+}
+"""
+
+_BODY_FIELDS = ('fullCitation', 'discussion')
+
+
+class SplitModulesWriter:
+    """Side output splitting readings into a light index and per-group bodies.
+
+    out_dir/index.ts holds readingGroups and every reading without
+    fullCitation/discussion (what the list pages render), plus
+    loadReadingBody(), which dynamically imports out_dir/<groupSlug>.ts so
+    the detail page only fetches one group's text. write() prints a size
+    report comparing this against the single readings module.
+
+    groups_src is the readingGroups declaration to copy, normally taken
+    from the input module with load_reading_groups(); without one (raw
+    dumps) the groups in TS_HEADER are used.
+
+    The size report counts every generated module a page imports: /readings
+    also loads the search index and the detail page the related readings
+    (search_index_path and related_path; by default the usual files next to
+    out_dir, when they exist).
+    """
+
+    def __init__(self, out_dir, types_import="../readings", groups_src=None, search_index_path=None,
+                 related_path=None):
+        self.out_dir = out_dir
+        self.types_import = types_import
+        self.groups_src = groups_src or _DEFAULT_GROUPS_SRC
+        content_dir = os.path.dirname(os.path.abspath(out_dir))
+        self.search_index_path = search_index_path or os.path.join(content_dir, 'readingsSearchIndex.ts')
+        self.related_path = related_path or os.path.join(content_dir, 'readingsRelated.ts')
+        self.records = []
+
+    def collect(self, readings):
+        self.records = []
+        for record in readings:
+            self.records.append(record)
+            yield record
+
+    def render(self):
+        """Return (index_src, {group_slug: body_src})."""
+        summaries = []
+        bodies = {}
+        for record in self.records:
+            d = record.to_dict()
+            summaries.append({k: v for k, v in d.items() if k not in _BODY_FIELDS})
+            bodies.setdefault(record.group_slug, {})[record.slug] = {k: d[k] for k in _BODY_FIELDS}
+
+        loaders = "".join(
+            f'  {json.dumps(g)}: () => import("./{g}"),\n' for g in bodies
+        )
+        index_src = (
+            "// Generated by `readings parse --split-bodies`; do not edit.\n"
+            f'import type {{ ReadingBody, ReadingGroup, ReadingSummary }} from "{self.types_import}";\n\n'
+            + self.groups_src
+            + "export const readingSummaries: ReadingSummary[] = "
+            + json.dumps(summaries, indent=2) + ";\n\n"
+            + "const bodyLoaders: Record<string, () => Promise<{ readingBodies: Record<string, ReadingBody> }>> = {\n"
+            + loaders + "};\n"
+            + _SPLIT_INDEX_HELPERS
+        )
+        body_srcs = {
+            g: (
+                "// Generated by `readings parse --split-bodies`; do not edit.\n"
+                f'import type {{ ReadingBody }} from "{self.types_import}";\n\n'
+                "export const readingBodies: Record<string, ReadingBody> = "
+                + json.dumps(group_bodies, indent=2) + ";\n"
+            )
+            for g, group_bodies in bodies.items()
+        }
+        return index_src, body_srcs
+
+    def write(self):
+        index_src, body_srcs = self.render()
+        os.makedirs(self.out_dir, exist_ok=True)
+        changed = 0
+        for group_slug, src in body_srcs.items():
+            changed += write_if_changed(os.path.join(self.out_dir, f"{group_slug}.ts"), src)
+        changed += write_if_changed(os.path.join(self.out_dir, "index.ts"), index_src)
+        print(f"// {self.out_dir}: {changed} module(s) rewritten", file=sys.stderr)
+        self.report(index_src, body_srcs)
+        return changed
+
+    def report(self, index_src, body_srcs):
+        def sizes(text):
+            raw = text.encode('utf-8')
+            return len(raw), len(gzip.compress(raw, mtime=0))
+
+        def fmt(pair):
+            return f"{pair[0]:>9,} B ({pair[1]:,} B gzip)"
+
+        def total(*pairs):
+            return sum(p[0] for p in pairs), sum(p[1] for p in pairs)
+
+        def extra(path):
+            # Another side output's module; written before this one when built in the same run
+            if not os.path.exists(path):
+                return (0, 0), []
+            with open(path, 'r', encoding='utf-8') as f:
+                return sizes(f.read()), [os.path.basename(path)]
+
+        module = sizes(render_ts(self.records))
+        index = sizes(index_src)
+        largest = max(body_srcs, key=lambda g: len(body_srcs[g]), default=None)
+        body = sizes(body_srcs[largest]) if largest else (0, 0)
+        search, search_name = extra(self.search_index_path)
+        related, related_name = extra(self.related_path)
+        list_names = " + ".join(["index.ts"] + search_name)
+        detail_names = " + ".join(["index.ts", f"{largest} bodies (largest group)"] + related_name)
+        print("// generated readings modules imported per page (source size; before = single readings module):",
+              file=sys.stderr)
+        print(f"//   /readings    before {fmt(total(module, search))}  after {fmt(total(index, search))}"
+              f"  [{list_names}]", file=sys.stderr)
+        print(f"//   group pages  before {fmt(module)}  after {fmt(index)}  [index.ts]", file=sys.stderr)
+        print(f"//   detail page  before {fmt(total(module, related))}  after {fmt(total(index, body, related))}"
+              f"  [{detail_names}]", file=sys.stderr)
+
+
+def load_reading_groups(path):
+    """Source of the readingGroups declaration in a TS module, or None if it has none."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    start = content.find(_GROUPS_MARKER)
+    # The array closes at the first "];" in column 0; helpers may follow it
+    end = content.find('\n];\n', start)
+    if start < 0 or end < 0:
+        return None
+    return content[start:end + len('\n];\n')] + '\n'
+
+
+_TS_SPACE = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/)*', re.DOTALL)
+_TS_IDENTIFIER = re.compile(r'[A-Za-z_$][\w$]*')
+_TS_NUMBER = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?')
+_TS_CONSTANTS = {'true': True, 'false': False, 'null': None}
+
+
+class _TsLiteralParser:
+    """Reads the JSON-like subset of TS object literals that editors write by hand.
+
+    On top of JSON it accepts unquoted keys, trailing commas and comments.
+    Strings must be double-quoted; anything else (single quotes, template
+    strings, expressions) is a ValueError pointing at its line and column.
+    """
+
+    def __init__(self, text, path):
+        self.text = text
+        self.path = path
+
+    def error(self, pos, message):
+        line = self.text.count('\n', 0, pos) + 1
+        column = pos - self.text.rfind('\n', 0, pos)
+        raise ValueError(f"{self.path}:{line}:{column}: {message}")
+
+    def skip(self, pos):
+        return _TS_SPACE.match(self.text, pos).end()
+
+    def value(self, pos):
+        pos = self.skip(pos)
+        c = self.text[pos:pos + 1]
+        if c == '{':
+            return self.sequence(pos, '}', keyed=True)
+        if c == '[':
+            return self.sequence(pos, ']', keyed=False)
+        if c == '"':
+            return self.string(pos)
+        m = _TS_NUMBER.match(self.text, pos)
+        if m:
+            number = m.group()
+            return (float(number) if any(ch in number for ch in '.eE') else int(number)), m.end()
+        m = _TS_IDENTIFIER.match(self.text, pos)
+        if m and m.group() in _TS_CONSTANTS:
+            return _TS_CONSTANTS[m.group()], m.end()
+        if c in ("'", '`'):
+            self.error(pos, "use double-quoted strings")
+        self.error(pos, f"expected a value, got {self.text[pos:pos + 20]!r}")
+
+    def string(self, pos):
+        try:
+            return json.decoder.scanstring(self.text, pos + 1)
+        except json.JSONDecodeError as e:
+            self.error(e.pos, e.msg)
+
+    def sequence(self, pos, close, keyed):
+        items = {} if keyed else []
+        pos += 1
+        while True:
+            pos = self.skip(pos)
+            if self.text.startswith(close, pos):
+                return items, pos + 1
+            if keyed:
+                if self.text.startswith('"', pos):
+                    key, pos = self.string(pos)
+                else:
+                    m = _TS_IDENTIFIER.match(self.text, pos)
+                    if not m:
+                        self.error(pos, "expected a property name")
+                    key, pos = m.group(), m.end()
+                pos = self.skip(pos)
+                if not self.text.startswith(':', pos):
+                    self.error(pos, "expected ':'")
+                items[key], pos = self.value(pos + 1)
+            else:
+                item, pos = self.value(pos)
+                items.append(item)
+            pos = self.skip(pos)
+            if self.text.startswith(',', pos):
+                pos += 1
+            elif not self.text.startswith(close, pos):
+                self.error(pos, f"expected ',' or '{close}'")
+
+
+def load_ts_module(path):
+    """Read the readings array back out of a generated (or hand-edited) TS module.
+
+    Generated modules are plain JSON after the marker; hand edits in TS
+    literal syntax (unquoted keys, trailing commas, comments) go through
+    _TsLiteralParser instead.
+    """
+    marker = 'export const readings: Reading[] = '
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    start = content.index(marker) + len(marker)
+    try:
+        data, _ = json.JSONDecoder().raw_decode(content, start)
+    except json.JSONDecodeError:
+        data, _ = _TsLiteralParser(content, path).value(start)
+    readings = []
+    for i, d in enumerate(data):
+        try:
+            readings.append(Reading.from_dict(d))
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"{path}: reading {i + 1} ({d.get('slug') if isinstance(d, dict) else d!r}) "
+                             f"is missing or has a malformed field: {e}") from None
+    return readings
@@ -0,0 +1,233 @@
+"""Reading raw dumps into records and emitting the generated module(s)."""
+
+import os
+import sys
+import mmap
+import time
+from contextlib import contextmanager
+from itertools import groupby
+
+from .extract import extract_reading
+from .output import render_ts, write_group_modules, write_if_changed, write_ts
+from .profiling import ProfiledExtractor, _NULL_PROFILER
+from .scan import GROUP_MAP, iter_reading_blocks, iter_reading_spans, split_readings, split_sections
+
+
+def iter_readings(file_path, cache=None):
+    """Stream extracted reading records from file_path, one at a time."""
+    extract = cache.extract if cache else extract_reading
+    for sec_num, r_num, r_text in iter_reading_blocks(file_path):
+        yield extract(r_text, GROUP_MAP.get(sec_num, 'unknown'))
+
+
+@contextmanager
+def open_mapped(file_path):
+    """Map file_path read-only; yields b'' for an empty file (mmap refuses those)."""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _decode_span(buf, start, end):
+    # Match the text-mode reads elsewhere, which use universal newlines
+    return buf[start:end].decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def iter_readings_mmap(file_path, cache=None):
+    """Like iter_readings, but scans a mmap and decodes one reading at a time."""
+    extract = cache.extract if cache else extract_reading
+    with open_mapped(file_path) as buf:
+        for sec_num, r_num, start, end in iter_reading_spans(buf):
+            yield extract(_decode_span(buf, start, end), GROUP_MAP.get(sec_num, 'unknown'))
+
+
+def get_reading(file_path, section, number):
+    """Return the Reading numbered `number` in section `section`, or None.
+
+    Scans the mmap'd dump only up to the requested reading and decodes just
+    that one, so previewing a reading from a multi-megabyte dump doesn't pay
+    for extracting everything else.
+    """
+    section, number = str(section), str(number)
+    with open_mapped(file_path) as buf:
+        for sec_num, r_num, start, end in iter_reading_spans(buf):
+            if sec_num == section and r_num == number:
+                return extract_reading(_decode_span(buf, start, end), GROUP_MAP.get(sec_num, 'unknown'))
+    return None
+
+
+def collect_input_files(paths):
+    """Expand directories into their *.txt files, sorted by name."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if name.endswith('.txt') and os.path.isfile(os.path.join(path, name))
+            ))
+        else:
+            files.append(path)
+    return files
+
+
+def _read_sections(file_paths):
+    """(group_slug, [reading text, ...]) for each section of the given raw files, in order."""
+    sections = []
+    for file_path in file_paths:
+        for sec_num, blocks in groupby(iter_reading_blocks(file_path), key=lambda b: b[0]):
+            sections.append((GROUP_MAP.get(sec_num, 'unknown'), [r_text for _, _, r_text in blocks]))
+    return sections
+
+
+def _extract_section(group_slug, texts):
+    # Top-level so ProcessPoolExecutor can pickle it
+    return [extract_reading(r_text, group_slug) for r_text in texts]
+
+
+def load_readings(paths, jobs=1, cache=None):
+    """Extract readings from several raw dumps into one list.
+
+    Work is partitioned per section; with jobs > 1 the sections that miss the
+    cache are extracted on a process pool. Records come out in input order
+    (file, then position in the file), the order the serial path emits
+    them, so the result does not depend on jobs.
+    """
+    # One slot per reading; cache hits are filled in straight away
+    results = []
+    pending = []
+    for group_slug, sec_blocks in _read_sections(collect_input_files(paths)):
+        records = [None] * len(sec_blocks)
+        misses = []
+        for idx, r_text in enumerate(sec_blocks):
+            if cache:
+                key, record = cache.lookup(r_text, group_slug)
+                if record is not None:
+                    records[idx] = record
+                    continue
+            else:
+                key = None
+            misses.append((idx, key, r_text))
+        results.append(records)
+        if misses:
+            pending.append((records, group_slug, misses))
+
+    def fill(records, misses, extracted):
+        for (idx, key, _), record in zip(misses, extracted):
+            records[idx] = record
+            if cache:
+                cache.store(key, record)
+
+    if jobs > 1 and len(pending) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(_extract_section, group_slug, [t for _, _, t in misses])
+                for _, group_slug, misses in pending
+            ]
+            for (records, _, misses), future in zip(pending, futures):
+                fill(records, misses, future.result())
+    else:
+        for records, group_slug, misses in pending:
+            fill(records, misses, _extract_section(group_slug, [t for _, _, t in misses]))
+
+    return [record for records in results for record in records]
+
+
+def emit(readings, output_path=None, groups_dir=None, index=None, side_outputs=(), profiler=None):
+    """Write readings to output_path/groups_dir (or stdout).
+
+    side_outputs are builders (e.g. SearchIndexBuilder) that see every record
+    on the way through via collect() and write their own file afterwards.
+    collect() may also yield changed records (MetadataResolver), which every
+    later stage then sees.
+
+    With a profiler, slug assignment, each side output's collect() and
+    write(), JSON encoding and the module write are timed as separate
+    stages; each lazy stage is then drained into a list inside its own timer.
+    """
+    prof = profiler or _NULL_PROFILER
+    drain = list if profiler else iter
+    if index:
+        with prof.stage('slugs'):
+            readings = drain(index.assign(readings))
+    for side in side_outputs:
+        with prof.stage(f'collect:{type(side).__name__}'):
+            readings = drain(side.collect(readings))
+    if groups_dir:
+        readings = list(readings)
+        with prof.stage('group_modules'):
+            changed = write_group_modules(readings, groups_dir)
+        print(f"// {groups_dir}: {len(changed)} module(s) rewritten", file=sys.stderr)
+    if output_path and not profiler:
+        _, changed = write_ts(readings, output_path)
+        if not changed:
+            print(f"// {output_path} unchanged", file=sys.stderr)
+    elif output_path or not groups_dir:
+        # Encoded whole so json.dumps and the write are timed apart; the bytes
+        # are the same as write_ts() or print() would produce
+        with prof.stage('json_encode'):
+            text = render_ts(list(readings)) + "\n"
+        prof.count('json_encode', len(text))
+        with prof.stage('write', len(text)):
+            if output_path:
+                if not write_if_changed(output_path, text):
+                    print(f"// {output_path} unchanged", file=sys.stderr)
+            else:
+                sys.stdout.write(text)
+    for side in side_outputs:
+        with prof.stage(f'write:{type(side).__name__}'):
+            side.write()
+
+
+def extract_section(section_content, group_slug, extract=extract_reading):
+    """Extract every reading in one section's content."""
+    return [extract(r_text, group_slug) for r_text in split_readings(section_content)]
+
+
+def parse_readings(file_path, stream=False, cache=None, output_path=None, groups_dir=None,
+                   use_mmap=False, index=None, profiler=None, side_outputs=()):
+    if use_mmap:
+        emit(iter_readings_mmap(file_path, cache), output_path, groups_dir, index, side_outputs)
+        return
+    if stream:
+        emit(iter_readings(file_path, cache), output_path, groups_dir, index, side_outputs)
+        return
+
+    prof = profiler or _NULL_PROFILER
+    if profiler:
+        extractor = ProfiledExtractor(profiler)
+        if cache:
+            cache.extractor = extractor
+        extract = cache.extract if cache else extractor.extract
+    else:
+        extract = cache.extract if cache else extract_reading
+
+    with prof.stage('read', os.path.getsize(file_path)):
+        with open(file_path, 'r') as f:
+            content = f.read()
+
+    with prof.stage('section_scan', len(content)):
+        sections = split_sections(content)
+
+    readings_data = []
+
+    for section in sections:
+        # print(f"Processing Section {section['number']}: {section['title']}")
+        group_slug = GROUP_MAP.get(section['number'], 'unknown')
+        if not profiler:
+            readings_data.extend(extract_section(section['content'], group_slug, extract))
+            continue
+
+        section_start = time.perf_counter()
+        with prof.stage('reading_split', len(section['content'])):
+            texts = split_readings(section['content'])
+        for r_text in texts:
+            with prof.stage('extract', len(r_text)):
+                readings_data.append(extract(r_text, group_slug))
+        prof.section(section['number'], group_slug, len(section['content']), len(texts),
+                     time.perf_counter() - section_start)
+
+    emit(readings_data, output_path, groups_dir, index, side_outputs, profiler)
@@ -0,0 +1,154 @@
+"""Per-stage timings, cProfile and tracemalloc reports for the batch path."""
+
+import time
+from contextlib import contextmanager, nullcontext
+
+from .extract import ReadingExtractor
+
+
+class Profiler:
+    """Wall time, call counts and characters processed per parser stage.
+
+    Stages are recorded with `with profiler.stage(name, chars):` (the 'read'
+    stage counts bytes on disk); count() adds characters to a stage whose
+    size is only known from its result. Per-section totals go through
+    section(). report() returns a JSON-ready dict.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.sections = []
+
+    @contextmanager
+    def stage(self, name, chars=0):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            st = self.stages.get(name)
+            if st is None:
+                st = self.stages[name] = {'seconds': 0.0, 'calls': 0, 'chars': 0}
+            st['seconds'] += elapsed
+            st['calls'] += 1
+            st['chars'] += chars
+
+    def count(self, name, chars):
+        self.stages[name]['chars'] += chars
+
+    def section(self, number, group_slug, chars, readings, seconds):
+        self.sections.append({
+            'number': number,
+            'groupSlug': group_slug,
+            'chars': chars,
+            'readings': readings,
+            'seconds': seconds,
+        })
+
+    def report(self):
+        return {
+            'stages': {
+                name: dict(st, seconds=round(st['seconds'], 6))
+                for name, st in self.stages.items()
+            },
+            'sections': [dict(sec, seconds=round(sec['seconds'], 6)) for sec in self.sections],
+        }
+
+
+class _NullProfiler:
+    def stage(self, name, chars=0):
+        return nullcontext()
+
+    def count(self, name, chars):
+        pass
+
+    def section(self, *args):
+        pass
+
+
+_NULL_PROFILER = _NullProfiler()
+
+
+class ProfiledExtractor(ReadingExtractor):
+    """ReadingExtractor that times each heuristic stage on a Profiler."""
+
+    def __init__(self, profiler, summary_break=150):
+        super().__init__(summary_break)
+        self.profiler = profiler
+
+    def citation(self, lines):
+        with self.profiler.stage('citation'):
+            full_citation, citation_end = super().citation(lines)
+        # The scan stops at the URL line; +1 per line for its newline
+        self.profiler.count('citation', sum(len(line) + 1 for line in lines[:citation_end]))
+        return full_citation, citation_end
+
+    def summary_and_body(self, lines, start):
+        chars = sum(len(line) + 1 for line in lines[start:])
+        with self.profiler.stage('summary_body', chars):
+            return super().summary_and_body(lines, start)
+
+    def paragraphs(self, body_text):
+        with self.profiler.stage('paragraphs', len(body_text)):
+            return super().paragraphs(body_text)
+
+    def metadata(self, full_citation):
+        with self.profiler.stage('metadata', len(full_citation)):
+            return super().metadata(full_citation)
+
+    def links(self, full_citation):
+        with self.profiler.stage('url_scan', len(full_citation)):
+            return super().links(full_citation)
+
+
+def run_profiled(file_path, use_cprofile=False, use_tracemalloc=False, top=15, **kwargs):
+    """Run the batch parse_readings under a Profiler and return its report.
+
+    Optionally wraps the run in cProfile (top functions by own time) and/or
+    tracemalloc (peak traced memory and top allocation sites by line).
+    """
+    profiler = Profiler()
+    cprof = None
+    if use_tracemalloc:
+        import tracemalloc
+        tracemalloc.start()
+    if use_cprofile:
+        import cProfile
+        cprof = cProfile.Profile()
+        cprof.enable()
+
+    from .pipeline import parse_readings  # imports this module
+
+    start = time.perf_counter()
+    parse_readings(file_path, profiler=profiler, **kwargs)
+    total = time.perf_counter() - start
+
+    report = {'input': file_path, 'totalSeconds': round(total, 6)}
+    report.update(profiler.report())
+
+    if cprof:
+        import pstats
+        cprof.disable()
+        stats = pstats.Stats(cprof).stats
+        rows = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+        report['cprofile'] = [
+            {
+                'function': f"{filename}:{line}({name})",
+                'calls': ncalls,
+                'tottime': round(tottime, 6),
+                'cumtime': round(cumtime, 6),
+            }
+            for (filename, line, name), (_, ncalls, tottime, cumtime, _) in rows
+        ]
+    if use_tracemalloc:
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report['tracemalloc'] = {
+            'peakBytes': peak,
+            'top': [
+                {'site': str(stat.traceback[0]), 'bytes': stat.size, 'count': stat.count}
+                for stat in snapshot.statistics('lineno')[:top]
+            ],
+        }
+    return report
@@ -0,0 +1,104 @@
+"""Reading records and their JSON encoding."""
+
+from typing import Optional
+from dataclasses import dataclass, field
+
+
+# Record types mirroring ReadingExternalLinks / ReadingDiscussion / Reading in
+# src/content/readings.ts. Slotted dataclasses keep per-record overhead low on
+# large corpora; to_dict() gives the JSON shape the TS module is written in.
+
+@dataclass(slots=True)
+class ExternalLinks:
+    doi: Optional[str] = None
+    url: Optional[str] = None
+    pdf: Optional[str] = None
+
+    def to_dict(self):
+        d = {'doi': self.doi, 'url': self.url}
+        if self.pdf is not None:
+            d['pdf'] = self.pdf
+        return d
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get('doi'), d.get('url'), d.get('pdf'))
+
+
+@dataclass(slots=True)
+class Discussion:
+    core_idea: str = ""
+    question_answered: str = ""
+    why_it_matters: str = ""
+
+    def to_dict(self):
+        return {
+            'coreIdea': self.core_idea,
+            'questionAnswered': self.question_answered,
+            'whyItMatters': self.why_it_matters
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d['coreIdea'], d['questionAnswered'], d['whyItMatters'])
+
+
+@dataclass(slots=True)
+class Reading:
+    slug: str
+    group_slug: str
+    title: str
+    authors: str
+    year: int
+    venue: str
+    full_citation: str
+    external_links: ExternalLinks = field(default_factory=ExternalLinks)
+    one_line_summary: str = ""
+    # None for a reading without notes yet (`discussion: null` in the TS module)
+    discussion: Optional[Discussion] = field(default_factory=Discussion)
+    needs_link: Optional[bool] = None
+
+    def to_dict(self):
+        d = {
+            'slug': self.slug,
+            'groupSlug': self.group_slug,
+            'title': self.title,
+            'authors': self.authors,
+            'year': self.year,
+            'venue': self.venue,
+            'fullCitation': self.full_citation,
+            'externalLinks': self.external_links.to_dict(),
+            'oneLineSummary': self.one_line_summary,
+            'discussion': self.discussion.to_dict() if self.discussion else None
+        }
+        if self.needs_link is not None:
+            d['needsLink'] = self.needs_link
+        return d
+
+    def discussion_paragraphs(self):
+        """(coreIdea, questionAnswered, whyItMatters), all empty without notes."""
+        d = self.discussion
+        return (d.core_idea, d.question_answered, d.why_it_matters) if d else ("", "", "")
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(
+            slug=d['slug'],
+            group_slug=d['groupSlug'],
+            title=d['title'],
+            authors=d['authors'],
+            year=d['year'],
+            venue=d['venue'],
+            full_citation=d['fullCitation'],
+            external_links=ExternalLinks.from_dict(d['externalLinks']),
+            one_line_summary=d['oneLineSummary'],
+            discussion=Discussion.from_dict(d['discussion']) if d['discussion'] else None,
+            needs_link=d.get('needsLink'),
+        )
+
+
+def _to_json(obj):
+    # json default hook: lets Reading records go straight into json.dumps/iterencode
+    if isinstance(obj, (Reading, ExternalLinks, Discussion)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
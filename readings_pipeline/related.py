@@ -0,0 +1,170 @@
+"""TF-IDF nearest neighbours for the "Related readings" section."""
+
+import sys
+import json
+import math
+import importlib.util
+from collections import Counter
+
+from .output import write_if_changed
+from .search import tokenize
+
+# Scores are compared at this many decimals, so that neighbours whose scores
+# differ only by rounding noise (which the two paths accumulate differently)
+# tie and are ordered by index on both
+_SCORE_DECIMALS = 9
+
+
+def _tfidf_rows(token_lists):
+    """Sublinear TF-IDF weights per document as {term_id: weight}, L2-normalized.
+
+    Weighting is tf = 1 + log(count), idf = log((1 + n) / (1 + df)) + 1;
+    _tfidf_matrix() computes the same thing with NumPy.
+    """
+    vocab = {}
+    counts = []
+    for tokens in token_lists:
+        c = Counter(tokens)
+        counts.append({vocab.setdefault(term, len(vocab)): n for term, n in c.items()})
+
+    n_docs = len(counts)
+    df = [0] * len(vocab)
+    for row in counts:
+        for term_id in row:
+            df[term_id] += 1
+    idf = [math.log((1 + n_docs) / (1 + d)) + 1 for d in df]
+
+    rows = []
+    for row in counts:
+        weights = {t: (1 + math.log(n)) * idf[t] for t, n in row.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        rows.append({t: w / norm for t, w in weights.items()})
+    return rows
+
+
+def _tfidf_matrix(token_lists):
+    import numpy as np
+    from scipy import sparse
+
+    vocab = {}
+    term_ids = [vocab.setdefault(t, len(vocab)) for tokens in token_lists for t in tokens]
+    lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(token_lists))
+    doc_ids = np.repeat(np.arange(len(token_lists)), lengths)
+    # COO -> CSR sums duplicate (doc, term) entries into raw counts
+    X = sparse.coo_matrix(
+        (np.ones(len(term_ids)), (doc_ids, np.asarray(term_ids, dtype=np.int64))),
+        shape=(len(token_lists), len(vocab)),
+    ).tocsr()
+
+    df = np.bincount(X.indices, minlength=len(vocab))
+    idf = np.log((1 + X.shape[0]) / (1 + df)) + 1
+    X.data = (1 + np.log(X.data)) * idf[X.indices]
+    norms = np.sqrt(np.asarray(X.multiply(X).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1 / norms) @ X
+
+
+def _top_k_numpy(token_lists, k, block_size):
+    import numpy as np
+
+    X = _tfidf_matrix(token_lists).tocsr()
+    XT = X.T.tocsr()
+    n = X.shape[0]
+    kk = min(k, n - 1)
+    neighbours = []
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        # One sparse matmul per block: cosine similarity of these rows to all rows
+        sims = np.round((X[start:stop] @ XT).toarray(), _SCORE_DECIMALS)
+        sims[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+        # k-th highest score per row; everything tied with it is a candidate,
+        # since argpartition alone would pick among ties arbitrarily
+        kth = np.partition(sims, -kk, axis=1)[:, -kk]
+        for row, threshold in zip(sims, kth):
+            cols = np.flatnonzero(row >= threshold if threshold > 0 else row > 0)
+            scores = row[cols]
+            # Highest score first, lower index on ties, as in _top_k_python()
+            order = np.lexsort((cols, -scores))[:kk]
+            neighbours.append([int(cols[i]) for i in order])
+    return neighbours
+
+
+def _top_k_python(token_lists, k):
+    rows = _tfidf_rows(token_lists)
+    postings = {}
+    for doc, row in enumerate(rows):
+        for t, w in row.items():
+            postings.setdefault(t, []).append((doc, w))
+
+    neighbours = []
+    for doc, row in enumerate(rows):
+        scores = {}
+        for t, w in row.items():
+            for other, w2 in postings[t]:
+                if other != doc:
+                    scores[other] = scores.get(other, 0.0) + w * w2
+        ranked = sorted(((other, round(score, _SCORE_DECIMALS)) for other, score in scores.items()),
+                        key=lambda item: (-item[1], item[0]))
+        neighbours.append([other for other, score in ranked[:k] if score > 0])
+    return neighbours
+
+
+def related_neighbours(texts, k=3, block_size=512, use_numpy=None):
+    """Top-k cosine neighbours (by position) of each text under TF-IDF.
+
+    Uses a SciPy sparse matrix and one blocked matrix multiply per
+    block_size rows when NumPy/SciPy are installed, otherwise an
+    inverted-index loop in pure Python (same weights, much slower on large
+    corpora). use_numpy forces one path or the other.
+    """
+    if len(texts) < 2 or k < 1:
+        return [[] for _ in texts]
+    token_lists = [tokenize(t) for t in texts]
+    if use_numpy is None:
+        use_numpy = all(importlib.util.find_spec(name) for name in ('numpy', 'scipy'))
+    if use_numpy:
+        return _top_k_numpy(token_lists, k, block_size)
+    return _top_k_python(token_lists, k)
+
+
+class RelatedReadingsBuilder:
+    """Side output mapping each reading id to its nearest related readings.
+
+    Similarity is TF-IDF cosine over the discussion text (coreIdea,
+    questionAnswered, whyItMatters) across all groups; see
+    related_neighbours().
+    """
+
+    def __init__(self, path, k=3):
+        self.path = path
+        self.k = k
+        self.ids = []
+        self.texts = []
+
+    def collect(self, readings):
+        self.ids = []
+        self.texts = []
+        for record in readings:
+            self.ids.append(f"{record.group_slug}/{record.slug}")
+            self.texts.append(" ".join(record.discussion_paragraphs()))
+            yield record
+
+    def render_ts(self):
+        neighbours = related_neighbours(self.texts, self.k)
+        data = {
+            ident: [self.ids[j] for j in near]
+            for ident, near in zip(self.ids, neighbours)
+        }
+        return (
+            '// Generated by `readings parse --related`; do not edit.\n'
+            '// Maps `${groupSlug}/${slug}` to the most similar readings (TF-IDF cosine).\n'
+            'export const relatedReadings: Record<string, string[]> = '
+            + json.dumps(data, indent=2) + ';\n'
+        )
+
+    def write(self):
+        changed = write_if_changed(self.path, self.render_ts())
+        state = "written" if changed else "unchanged"
+        print(f"// related readings: {len(self.ids)} readings, k={self.k}, {self.path} {state}",
+              file=sys.stderr)
+        return changed
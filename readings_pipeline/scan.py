@@ -0,0 +1,444 @@
+"""Locating sections and readings in raw dumps, as text or as byte spans."""
+
+import re
+from dataclasses import dataclass
+
+
+GROUP_MAP = {
+    '1': 'foundations',
+    '2': 'neural-plasticity',
+    '3': 'variable-reinforcement',
+    '4': 'theory-of-mind',
+    '5': 'ai-architectures',
+    '6': 'ai-companionship',
+    '7': 'ai-risks',
+    '8': 'developmental-impact',
+    '9': 'societal-implications'
+}
+
+# Header grammar: optional leading '<', then "Section X: Title" anywhere (not
+# just line start). Handles cases where two headers are adjacent on the same
+# line, e.g. "<Section 3: ...><Section 4: ...>" and mixed styles without angle
+# brackets. Kept as the reference for scan_section_headers(), which finds the
+# same matches without the regex's quadratic worst case.
+SECTION_START_PATTERN = re.compile(
+    r'(?:<\s*)?Section\s+(\d+):\s*(.*?)(?:>|\n)',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Lines that can't contain "section" under re.IGNORECASE skip the header regex,
+# which can't use a literal prefix search and dominates the streaming scan.
+# 'ſ' and 'ı' case-fold to 's' and 'i', and 'İ'.lower() adds a combining dot.
+_SECTION_HINT_TABLE = str.maketrans({'\u017f': 's', '\u0131': 'i', '\u0307': None})
+
+
+def _may_have_section_header(line):
+    low = line.lower()
+    if not low.isascii():
+        low = low.translate(_SECTION_HINT_TABLE)
+    return 'section' in low
+
+
+@dataclass(slots=True)
+class SectionHeader:
+    """One header found by scan_section_headers(); end is just past its '>' or newline."""
+    start: int
+    end: int
+    number: str
+    title: str
+
+
+class _HeaderScanner:
+    """Linear-time equivalent of SECTION_START_PATTERN.finditer().
+
+    The regex retries its lazy "(.*?)(?:>|\n)" title from every candidate
+    "Section N:", so a long line with many headers but no terminator costs
+    O(candidates * length). Here every step is an anchored match of a single
+    character class (no backtracking) and the next '>' / newline is searched
+    at most once per position, which keeps a whole scan O(n).
+    """
+
+    def __init__(self, anchor, keyword, ws, digits, lt, colon, gt, nl):
+        self.anchor = anchor
+        self.keyword = keyword
+        self.ws = ws
+        self.digits = digits
+        self.lt = lt
+        self.colon = colon
+        self.gt = gt
+        self.nl = nl
+
+    def finditer(self, text, pos=0, end=None):
+        if end is None:
+            end = len(text)
+        found = {}
+
+        def next_at(term, q):
+            # (searched_from, position) stays valid while q falls in that range
+            hit = found.get(term)
+            if hit is None or hit[0] > q or (hit[1] != -1 and hit[1] < q):
+                hit = found[term] = (q, text.find(term, q, end))
+            return hit[1]
+
+        while True:
+            m = self.anchor.search(text, pos, end)
+            if not m:
+                return
+            header = self._match_at(text, m.start(), end, next_at)
+            if header is None:
+                pos = m.start() + 1
+            else:
+                yield header
+                pos = header.end
+
+    def _match_at(self, text, start, end, next_at):
+        q = start
+        if text[q:q + 1] == self.lt:
+            q = self.ws.match(text, q + 1, end).end()
+        m = self.keyword.match(text, q, end)
+        if not m:
+            return None
+        q = self.ws.match(text, m.end(), end).end()
+        if q == m.end():
+            return None
+        m = self.digits.match(text, q, end)
+        if not m or text[m.end():m.end() + 1] != self.colon:
+            return None
+        number = m.group()
+        if not isinstance(number, str):
+            number = number.decode('ascii')
+
+        title_start = m.end() + 1
+        run_end = self.ws.match(text, title_start, end).end()
+        terms = [t for t in (next_at(self.gt, run_end), next_at(self.nl, run_end)) if t != -1]
+        if terms:
+            term = min(terms)
+            return SectionHeader(start, term + 1, number, text[run_end:term])
+        # With no terminator left, the regex backtracks "\s*" to the last
+        # newline inside the whitespace run and matches an empty title there.
+        nl = text.rfind(self.nl, title_start, run_end)
+        if nl == -1:
+            return None
+        return SectionHeader(start, nl + 1, number, text[nl:nl])
+
+
+_STR_HEADER_SCANNER = _HeaderScanner(
+    re.compile(r'<|section', re.IGNORECASE), re.compile(r'section', re.IGNORECASE),
+    re.compile(r'\s*'), re.compile(r'\d+'), '<', ':', '>', '\n',
+)
+# Bytes patterns only know ASCII whitespace, digits and case folding, which is
+# all the headers in our dumps use.
+_BYTES_HEADER_SCANNER = _HeaderScanner(
+    re.compile(rb'<|section', re.IGNORECASE), re.compile(rb'section', re.IGNORECASE),
+    re.compile(rb'\s*'), re.compile(rb'\d+'), b'<', b':', b'>', b'\n',
+)
+
+
+def scan_section_headers(text, pos=0, end=None):
+    """Yield a SectionHeader for each match of SECTION_START_PATTERN in text[pos:end].
+
+    text is a str, or any bytes-like object such as a mmap (titles are then
+    bytes). Runs in time linear in end - pos whatever the input looks like.
+    """
+    scanner = _STR_HEADER_SCANNER if isinstance(text, str) else _BYTES_HEADER_SCANNER
+    return scanner.finditer(text, pos, end)
+
+
+# A reading starts with "N. " at the beginning of a line
+READING_START_PATTERN = re.compile(r'(\d+)\.\s+')
+READING_SPLIT_PATTERN = re.compile(r'\n(\d+)\.\s+')
+
+
+class _SectionStream:
+    """Line-level state machine behind iter_reading_blocks.
+
+    Mirrors the batch splitter: text is fed in fragments (a whole line, or the
+    part of a line before/after a section header) and a reading is finished
+    whenever a new "N. " line or a new section header shows up.
+    """
+
+    def __init__(self):
+        self.section = None
+        self.at_section_start = False
+        self.reading_num = None
+        self.reading_lines = []
+        # "N." seen with nothing but whitespace after it yet. The batch regex
+        # only treats it as a reading start once non-blank text follows.
+        self.pending_num = None
+        self.pending_marker = ""
+
+    def close_reading(self):
+        if self.pending_num is not None:
+            # Dangling "N." at the end of a section stays in the previous reading
+            if self.reading_num is not None:
+                self.reading_lines.append(self.pending_marker)
+            self.pending_num = None
+            self.pending_marker = ""
+        if self.reading_num is None:
+            return None
+        block = (self.section, self.reading_num, "".join(self.reading_lines))
+        self.reading_num = None
+        self.reading_lines = []
+        return block
+
+    def start_section(self, number):
+        block = self.close_reading()
+        self.section = number
+        self.at_section_start = True
+        return block
+
+    def feed(self, fragment, line_start):
+        if self.section is None or not fragment:
+            return None
+
+        # Section content is stripped in the batch path, so the first
+        # non-blank text after a header counts as the start of a line.
+        if self.at_section_start:
+            fragment = fragment.lstrip()
+            if not fragment:
+                return None
+            self.at_section_start = False
+            line_start = True
+
+        # The "\s+" after "N." swallows following blank lines, so whatever
+        # comes next is reading text, never another reading start.
+        if self.pending_num is not None:
+            fragment = fragment.lstrip()
+            if not fragment:
+                return None
+            num = self.pending_num
+            self.pending_num = None
+            self.pending_marker = ""
+            block = self.close_reading()
+            self.reading_num = num
+            self.reading_lines = [fragment]
+            return block
+
+        if line_start:
+            m = READING_START_PATTERN.match(fragment)
+            if m:
+                if not fragment[m.end():].strip():
+                    self.pending_num = m.group(1)
+                    self.pending_marker = fragment[:m.end()]
+                    return None
+                block = self.close_reading()
+                self.reading_num = m.group(1)
+                self.reading_lines = [fragment[m.end():]]
+                return block
+
+        # Text before the first reading of a section is preamble and dropped
+        if self.reading_num is not None:
+            self.reading_lines.append(fragment)
+        return None
+
+
+def iter_reading_blocks(file_path):
+    """Yield (section_number, reading_number, raw_text) for every reading.
+
+    Reads the file line by line, so memory is bounded by the largest single
+    reading rather than the whole corpus. Produces the same blocks as the batch
+    splitter in parse_readings, except for headers whose whitespace spans a
+    line break (e.g. "Section\\n3:"), which the batch regex would accept.
+    """
+    seen = set()
+    stream = _SectionStream()
+
+    with open(file_path, 'r') as f:
+        for line in f:
+            pos = 0
+            headers = scan_section_headers(line) if _may_have_section_header(line) else ()
+            for h in headers:
+                # Keep only the first occurrence of each section number;
+                # repeated headers stay in the text like in the batch path.
+                if h.number in seen:
+                    continue
+                seen.add(h.number)
+
+                block = stream.feed(line[pos:h.start], pos == 0)
+                if block:
+                    yield block
+                block = stream.start_section(h.number)
+                if block:
+                    yield block
+                pos = h.end
+
+            block = stream.feed(line[pos:], pos == 0)
+            if block:
+                yield block
+
+    block = stream.close_reading()
+    if block:
+        yield block
+
+
+# Byte-level twins of the patterns above for scanning a mmap'd dump. Bytes
+# patterns only know ASCII whitespace, which is all the reading numbers in our
+# dumps use.
+READING_START_PATTERN_BYTES = re.compile(rb'(\d+)\.\s+')
+_LEADING_WS_BYTES = re.compile(rb'\s*')
+
+
+class _SpanStream:
+    """Offset-based counterpart of _SectionStream.
+
+    Instead of collecting text it tracks where each reading starts and ends
+    in the underlying buffer, yielding (section, number, start, end).
+    """
+
+    def __init__(self, buf):
+        self.buf = buf
+        self.section = None
+        self.at_section_start = False
+        self.reading_num = None
+        self.reading_start = 0
+        self.reading_end = 0
+        self.pending_num = None
+        self.pending_end = 0
+
+    def _skip_ws(self, start, end):
+        return _LEADING_WS_BYTES.match(self.buf, start, end).end()
+
+    def close_reading(self):
+        if self.pending_num is not None:
+            # Dangling "N." at the end of a section stays in the previous reading
+            if self.reading_num is not None:
+                self.reading_end = self.pending_end
+            self.pending_num = None
+        if self.reading_num is None:
+            return None
+        span = (self.section, self.reading_num, self.reading_start, self.reading_end)
+        self.reading_num = None
+        return span
+
+    def start_section(self, number):
+        span = self.close_reading()
+        self.section = number
+        self.at_section_start = True
+        return span
+
+    def _open_reading(self, number, start, end):
+        span = self.close_reading()
+        self.reading_num = number
+        self.reading_start = start
+        self.reading_end = end
+        return span
+
+    def feed(self, start, end, line_start):
+        if self.section is None or start >= end:
+            return None
+
+        if self.at_section_start:
+            start = self._skip_ws(start, end)
+            if start == end:
+                return None
+            self.at_section_start = False
+            line_start = True
+
+        if self.pending_num is not None:
+            start = self._skip_ws(start, end)
+            if start == end:
+                return None
+            num = self.pending_num
+            self.pending_num = None
+            return self._open_reading(num, start, end)
+
+        if line_start:
+            m = READING_START_PATTERN_BYTES.match(self.buf, start, end)
+            if m:
+                num = m.group(1).decode('ascii')
+                if self._skip_ws(m.end(), end) == end:
+                    self.pending_num = num
+                    self.pending_end = m.end()
+                    return None
+                return self._open_reading(num, m.end(), end)
+
+        if self.reading_num is not None:
+            self.reading_end = end
+        return None
+
+
+def iter_reading_spans(buf):
+    """Yield (section_number, reading_number, start, end) byte offsets into buf.
+
+    buf is any bytes-like object, typically a mmap of the raw dump. Only one
+    line is looked at a time and nothing is decoded, so sections and readings
+    are never materialized. Spans match the blocks of iter_reading_blocks.
+    """
+    seen = set()
+    stream = _SpanStream(buf)
+    pos = 0
+    size = len(buf)
+
+    while pos < size:
+        nl = buf.find(b'\n', pos)
+        line_end = size if nl == -1 else nl + 1
+
+        frag_start = pos
+        if b'section' in buf[pos:line_end].lower():
+            for h in scan_section_headers(buf, pos, line_end):
+                if h.number in seen:
+                    continue
+                seen.add(h.number)
+
+                span = stream.feed(frag_start, h.start, frag_start == pos)
+                if span:
+                    yield span
+                span = stream.start_section(h.number)
+                if span:
+                    yield span
+                frag_start = h.end
+
+        span = stream.feed(frag_start, line_end, frag_start == pos)
+        if span:
+            yield span
+        pos = line_end
+
+    span = stream.close_reading()
+    if span:
+        yield span
+
+
+def split_sections(content):
+    """Split a whole dump into [{'number', 'title', 'content'}, ...]."""
+    # Split into sections
+    # We look for lines that look like section headers.
+    # Examples:
+    # < Section 1: ... >
+    # <Section 2: ... >
+    # Section 6: ...
+    raw_matches = list(scan_section_headers(content))
+
+    # Keep only the first occurrence of each section number to avoid duplicate headers
+    # that appear later in the file (e.g., repeated or concatenated headings).
+    seen = set()
+    matches = []
+    for m in raw_matches:
+        if m.number in seen:
+            continue
+        seen.add(m.number)
+        matches.append(m)
+
+    sections = []
+    for i, match in enumerate(matches):
+        sec_num = match.number
+        title_from_match = match.title.strip()
+
+        next_start_idx = matches[i+1].start if i + 1 < len(matches) else len(content)
+
+        # Start content immediately after this matched header
+        content_start = match.end
+        section_content = content[content_start:next_start_idx].strip()
+
+        sections.append({
+            'number': sec_num,
+            'title': title_from_match,
+            'content': section_content
+        })
+    return sections
+
+
+def split_readings(section_content):
+    """Raw text of each reading in one section's content."""
+    # Split by reading number "N. "
+    parts = READING_SPLIT_PATTERN.split('\n' + section_content)
+    return [parts[i+1] for i in range(1, len(parts), 2)]
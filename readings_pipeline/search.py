@@ -0,0 +1,78 @@
+"""Inverted search index over the readings for the site's search box."""
+
+import re
+import sys
+import json
+import unicodedata
+
+from .output import write_if_changed
+
+
+_COMBINING_MARKS_PATTERN = re.compile('[\u0300-\u036f]')
+_TOKEN_SPLIT_PATTERN = re.compile(r'[^a-z0-9]+')
+
+
+def tokenize(text):
+    """Lowercase, accent-folded ASCII word tokens of at least two characters.
+
+    Must stay in step with tokenize() in src/lib/readingSearch.ts, which runs
+    the same folding on the user's query.
+    """
+    text = _COMBINING_MARKS_PATTERN.sub('', unicodedata.normalize('NFKD', text.lower()))
+    return [t for t in _TOKEN_SPLIT_PATTERN.split(text) if len(t) > 1]
+
+
+class SearchIndexBuilder:
+    """Inverted index (term -> reading ids) built while records stream past.
+
+    Used as a side output of emit(): collect() wraps the record stream and
+    write() saves the module to `path` once the stream is exhausted.
+
+    Covers title, authors, oneLineSummary and the discussion paragraphs.
+    Reading ids are "groupSlug/slug". Terms are emitted sorted, so the client
+    can answer prefix queries with a binary search over `terms`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.ids = []
+        self.postings = {}
+
+    def collect(self, readings):
+        """Index each record and pass it through unchanged."""
+        self.ids = []
+        self.postings = {}
+        for record in readings:
+            self.add(record)
+            yield record
+
+    def add(self, record):
+        doc = len(self.ids)
+        self.ids.append(f"{record.group_slug}/{record.slug}")
+        text = " ".join((
+            record.title, record.authors, record.one_line_summary,
+            *record.discussion_paragraphs(),
+        ))
+        for term in set(tokenize(text)):
+            self.postings.setdefault(term, []).append(doc)
+
+    def render_ts(self):
+        terms = sorted(self.postings)
+        data = {
+            'ids': self.ids,
+            'terms': terms,
+            'postings': [self.postings[t] for t in terms],
+        }
+        return (
+            'import { ReadingSearchIndex } from "./readings";\n\n'
+            '// Generated by `readings parse --search-index`; do not edit.\n'
+            'export const readingSearchIndex: ReadingSearchIndex = '
+            + json.dumps(data, separators=(',', ':')) + ';\n'
+        )
+
+    def write(self):
+        changed = write_if_changed(self.path, self.render_ts())
+        state = "written" if changed else "unchanged"
+        print(f"// search index: {len(self.ids)} readings, {len(self.postings)} terms, {self.path} {state}",
+              file=sys.stderr)
+        return changed
@@ -0,0 +1,180 @@
+"""DOI and citation normalisation, and slugs that stay stable across rebuilds."""
+
+import re
+import os
+import sys
+import json
+from dataclasses import replace
+
+
+_DOI_PREFIX_PATTERN = re.compile(r'^(?:https?://)?(?:dx\.)?doi\.org/', re.IGNORECASE)
+_CITATION_URL_PATTERN = re.compile(r'https?://\S+')
+_NON_ALNUM_PATTERN = re.compile(r'[\W_]+')
+
+
+def normalize_doi(doi):
+    """Bare lowercase DOI ("10.1038/...") from a doi.org URL or DOI string."""
+    if not doi:
+        return None
+    doi = _DOI_PREFIX_PATTERN.sub('', doi.strip()).rstrip('.,;)')
+    return doi.lower() or None
+
+
+def normalize_citation(citation):
+    """Lowercase alphanumeric words of a citation, with URLs dropped."""
+    return " ".join(_NON_ALNUM_PATTERN.split(_CITATION_URL_PATTERN.sub(' ', citation).lower())).strip()
+
+
+class ReadingIndex:
+    """Hash indexes on slug, DOI and normalized citation, filled in one pass.
+
+    assign() gives each reading a slug that is unique within its group (the
+    [groupSlug]/[readingSlug] route), disambiguating collisions with -2, -3,
+    ... in input order, and reports readings that share a DOI or citation.
+    With a path, the slug chosen for each reading (keyed by group plus DOI,
+    or normalized citation when there is no DOI) is saved and reused on the
+    next run, so slugs stay stable across rebuilds even when readings are
+    added ahead of them. Slugs from the previous run are reserved for their
+    owners; entries for readings that disappear are dropped on save.
+
+    A reading whose key is new (typically a corrected citation) inherits the
+    slug of the single unclaimed previous entry with the same fallback
+    identity, group plus title-derived base slug, instead of being renamed
+    around it. When assign() gets a list, reservations of readings missing
+    from it are released before any slug is handed out.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path=None):
+        self.path = path
+        self.previous = {}
+        self.by_fallback = {}
+        self.bases = {}
+        self.reserved = {}
+        # Identities in this run, when assign() is given the whole list
+        self.present = None
+        self.assigned = {}
+        self.slugs = set()
+        self.by_doi = {}
+        self.by_citation = {}
+        self.duplicates = []
+        self.renamed = []
+
+        previous_bases = {}
+        if path and os.path.exists(path):
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') in (1, self.VERSION):
+                self.previous = data.get('slugs', {})
+                # Version 1 didn't record base slugs; the saved slug is the best guess
+                previous_bases = data.get('bases', {})
+        for key, slug in self.previous.items():
+            group_slug = key.split('|', 1)[0]
+            self.reserved[(group_slug, slug)] = key
+            fallback = f"{group_slug}|{previous_bases.get(key, slug)}"
+            self.by_fallback.setdefault(fallback, []).append(key)
+
+    @staticmethod
+    def identity(record):
+        doi = normalize_doi(record.external_links.doi)
+        ident = f"doi:{doi}" if doi else f"cite:{normalize_citation(record.full_citation)}"
+        return f"{record.group_slug}|{ident}"
+
+    def _inherit(self, key, group_slug, base):
+        """Previous key whose slug a new key takes over, or None."""
+        candidates = [old for old in self.by_fallback.get(f"{group_slug}|{base}", ())
+                      if old not in self.assigned and old in self.previous
+                      and (self.present is None or old.split('#', 1)[0] not in self.present)]
+        if len(candidates) != 1:
+            return None
+        old = candidates[0]
+        slug = self.previous.pop(old)
+        self.previous[key] = slug
+        self.reserved[(group_slug, slug)] = key
+        return old
+
+    def _release_absent(self, readings):
+        # Still in self.previous, so a corrected citation can inherit them
+        self.present = {self.identity(record) for record in readings}
+        for slot, owner in list(self.reserved.items()):
+            if owner.split('#', 1)[0] not in self.present:
+                del self.reserved[slot]
+
+    def _available(self, group_slug, slug, key):
+        if (group_slug, slug) in self.slugs:
+            return False
+        owner = self.reserved.get((group_slug, slug))
+        return owner is None or owner == key
+
+    def _claim(self, record):
+        key = self.identity(record)
+        group_slug = record.group_slug
+        base = record.slug or 'reading'
+
+        if key in self.assigned:
+            # Same reading twice in one group: it can't share the slug
+            n = 2
+            while f"{key}#{n}" in self.assigned:
+                n += 1
+            key = f"{key}#{n}"
+
+        if key not in self.previous:
+            self._inherit(key, group_slug, base)
+        preferred = self.previous.get(key, base)
+        slug = preferred
+        if not self._available(group_slug, slug, key):
+            slug = base
+            n = 2
+            while not self._available(group_slug, slug, key):
+                slug = f"{base}-{n}"
+                n += 1
+
+        self.slugs.add((group_slug, slug))
+        self.assigned[key] = slug
+        self.bases[key] = base
+        if slug != record.slug:
+            if self.previous.get(key) != slug:
+                self.renamed.append((group_slug, record.slug, slug))
+            record = replace(record, slug=slug)
+        return record
+
+    def _check_duplicates(self, record):
+        where = f"{record.group_slug}/{record.slug}"
+        doi = normalize_doi(record.external_links.doi)
+        if doi:
+            if doi in self.by_doi:
+                self.duplicates.append(('doi', doi, self.by_doi[doi], where))
+            else:
+                self.by_doi[doi] = where
+        citation = normalize_citation(record.full_citation)
+        if citation:
+            if citation in self.by_citation:
+                self.duplicates.append(('citation', citation, self.by_citation[citation], where))
+            else:
+                self.by_citation[citation] = where
+
+    def assign(self, readings):
+        """Yield readings with unique, stable slugs, recording duplicates."""
+        if isinstance(readings, list):
+            self._release_absent(readings)
+        for record in readings:
+            record = self._claim(record)
+            self._check_duplicates(record)
+            yield record
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': self.VERSION, 'slugs': self.assigned, 'bases': self.bases},
+                      f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(tmp_path, self.path)
+
+    def report(self):
+        for group_slug, old, new in self.renamed:
+            print(f"// slug {group_slug}/{old} -> {group_slug}/{new}", file=sys.stderr)
+        for kind, value, first, second in self.duplicates:
+            print(f"// duplicate {kind} {value!r}: {first} and {second}", file=sys.stderr)
@@ -0,0 +1,127 @@
+"""Rebuilding the generated module(s) whenever the raw dump changes."""
+
+import os
+import sys
+import time
+
+from .extract import extract_reading
+from .pipeline import emit, extract_section
+from .scan import GROUP_MAP, split_sections
+from .slugs import ReadingIndex
+
+
+class SectionRebuilder:
+    """Keeps the extracted records of each section between rebuilds.
+
+    rebuild() splits the new text at the section headers and only re-extracts
+    sections whose content differs from the previous run, so a one-reading
+    edit costs one section's worth of extraction.
+    """
+
+    def __init__(self, cache=None):
+        self.extract = cache.extract if cache else extract_reading
+        self.sections = {}
+
+    def rebuild(self, content):
+        """Return (readings, sections_reextracted, sections_total)."""
+        fresh = {}
+        readings = []
+        changed = 0
+        for section in split_sections(content):
+            num, text = section['number'], section['content']
+            previous = self.sections.get(num)
+            if previous is not None and previous[0] == text:
+                records = previous[1]
+            else:
+                records = extract_section(text, GROUP_MAP.get(num, 'unknown'), self.extract)
+                changed += 1
+            fresh[num] = (text, records)
+            readings.extend(records)
+        self.sections = fresh
+        return readings, changed, len(fresh)
+
+
+def _file_stamp(file_path):
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        # Editors that save via rename briefly leave no file behind
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _poll_changes(file_path, interval):
+    stamp = _file_stamp(file_path)
+    while True:
+        time.sleep(interval)
+        new_stamp = _file_stamp(file_path)
+        if new_stamp is not None and new_stamp != stamp:
+            stamp = new_stamp
+            yield
+
+
+def _inotify_changes(file_path):
+    # Not a generator itself, so a missing inotify_simple raises ImportError here
+    from inotify_simple import INotify, flags
+
+    watch_dir = os.path.dirname(os.path.abspath(file_path))
+    name = os.path.basename(file_path)
+    inotify = INotify()
+    # Watch the directory: editors often save by renaming a temp file over ours.
+    # No CREATE: a new file is still empty then, and its CLOSE_WRITE follows.
+    inotify.add_watch(watch_dir, flags.CLOSE_WRITE | flags.MOVED_TO)
+
+    def changes():
+        while True:
+            if any(event.name == name for event in inotify.read()):
+                yield
+
+    return changes()
+
+
+def watch(file_path, output_path=None, groups_dir=None, index_path=None, cache=None, interval=0.2,
+          side_outputs=()):
+    """Rebuild the output every time file_path changes, until interrupted.
+
+    Uses inotify (via the optional inotify_simple package) when it is
+    installed, otherwise polls the file's mtime and size every `interval`
+    seconds. A rebuild that fails (say, on a half-saved dump) is reported on
+    stderr and the previous output is left in place until the next change.
+    """
+    rebuilder = SectionRebuilder(cache)
+
+    def rebuild():
+        start = time.perf_counter()
+        with open(file_path, 'r') as f:
+            content = f.read()
+        readings, changed, total = rebuilder.rebuild(content)
+        index = ReadingIndex(index_path)
+        emit(readings, output_path, groups_dir, index, side_outputs)
+        index.save()
+        index.report()
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"// rebuilt in {elapsed:.1f} ms ({changed}/{total} sections re-extracted)", file=sys.stderr)
+
+    def try_rebuild():
+        try:
+            rebuild()
+        except Exception as e:
+            print(f"// rebuild failed: {type(e).__name__}: {e}; waiting for the next change", file=sys.stderr)
+
+    try:
+        changes = _inotify_changes(file_path)
+        method = "inotify"
+    except ImportError:
+        changes = _poll_changes(file_path, interval)
+        method = f"polling every {interval}s"
+
+    try_rebuild()
+    print(f"// watching {file_path} ({method}); Ctrl-C to stop", file=sys.stderr)
+    try:
+        for _ in changes:
+            try_rebuild()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if cache:
+            cache.save()
@@ -7,7 +7,7 @@ import { Button } from "@/components/ui/button";
 import { Card } from "@/components/ui/card";
 import { Navigation } from "@/components/layout/Navigation";
 import { Footer } from "@/components/layout/Footer";
-import { readingGroups } from "@/content/readings";
+import { readingGroups } from "@/content/readingsIndex";
 import { ParticleCanvas } from "@/components/shared/ParticleCanvas";
 import { cn } from "@/lib/utils";
 import { useActiveSection } from "@/hooks/useActiveSection";
@@ -9,22 +9,43 @@ import { Card } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import { Separator } from "@/components/ui/separator";
-import { getReading, getGroup } from "@/content/readings";
+import type { ReadingBody } from "@/content/readings";
+import { getReadingSummary, getGroup, loadReadingBody } from "@/content/readingsIndex";
+import { relatedReadings } from "@/content/readingsRelated";
 import { ArrowLeft, ExternalLink, Copy, Check } from "lucide-react";
-import { useState } from "react";
+import { useEffect, useState } from "react";
 
 export default function ReadingPage() {
   const params = useParams();
   const groupSlug = params.groupSlug as string;
   const readingSlug = params.readingSlug as string;
   const [copied, setCopied] = useState(false);
+  const [body, setBody] = useState<ReadingBody | null>(null);
 
-  const reading = getReading(groupSlug, readingSlug);
+  const reading = getReadingSummary(groupSlug, readingSlug);
   const group = getGroup(groupSlug);
 
+  // Citation and discussion text live in a per-group chunk loaded on demand
+  useEffect(() => {
+    let cancelled = false;
+    setBody(null);
+    loadReadingBody(groupSlug, readingSlug).then((loaded) => {
+      if (!cancelled && loaded) setBody(loaded);
+    });
+    return () => {
+      cancelled = true;
+    };
+  }, [groupSlug, readingSlug]);
+  const related = (relatedReadings[`${groupSlug}/${readingSlug}`] ?? [])
+    .map((id) => {
+      const [relatedGroup, relatedSlug] = id.split("/");
+      return getReadingSummary(relatedGroup, relatedSlug);
+    })
+    .filter((r): r is NonNullable<typeof r> => r !== undefined);
+
   const copyToClipboard = async () => {
-    if (reading) {
-      await navigator.clipboard.writeText(reading.fullCitation);
+    if (body) {
+      await navigator.clipboard.writeText(body.fullCitation);
       setCopied(true);
       setTimeout(() => setCopied(false), 2000);
     }
@@ -87,12 +108,13 @@ export default function ReadingPage() {
               <Card className="p-4 bg-secondary/30 mb-6">
                 <div className="flex items-start justify-between gap-4">
                   <p className="text-sm text-muted-foreground font-mono">
-                    {reading.fullCitation}
+                    {body?.fullCitation}
                   </p>
                   <Button
                     variant="ghost"
                     size="sm"
                     onClick={copyToClipboard}
+                    disabled={!body}
                     className="flex-shrink-0"
                   >
                     {copied ? (
@@ -160,7 +182,7 @@ export default function ReadingPage() {
         {/* Discussion Content */}
         <section className="py-12">
           <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8">
-            {reading.discussion ? (
+            {!body ? null : body.discussion ? (
               <motion.div
                 initial={{ opacity: 0, y: 20 }}
                 animate={{ opacity: 1, y: 0 }}
@@ -177,7 +199,7 @@ export default function ReadingPage() {
                   </h2>
                   <div className="pl-10">
                     <p className="text-muted-foreground leading-relaxed">
-                      {reading.discussion.coreIdea}
+                      {body.discussion.coreIdea}
                     </p>
                   </div>
                 </div>
@@ -192,7 +214,7 @@ export default function ReadingPage() {
                   </h2>
                   <div className="pl-10">
                     <p className="text-muted-foreground leading-relaxed">
-                      {reading.discussion.questionAnswered}
+                      {body.discussion.questionAnswered}
                     </p>
                   </div>
                 </div>
@@ -207,7 +229,7 @@ export default function ReadingPage() {
                   </h2>
                   <div className="pl-10">
                     <p className="text-muted-foreground leading-relaxed">
-                      {reading.discussion.whyItMatters}
+                      {body.discussion.whyItMatters}
                     </p>
                   </div>
                 </div>
@@ -234,6 +256,32 @@ export default function ReadingPage() {
           </div>
         </section>
 
+        {/* Related readings */}
+        {related.length > 0 && (
+          <section className="py-12 border-t border-border/50">
+            <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8">
+              <h3 className="text-lg font-semibold mb-4">Related readings</h3>
+              <div className="space-y-4">
+                {related.map((r) => (
+                  <Card
+                    key={`${r.groupSlug}/${r.slug}`}
+                    className="p-6 bg-card/50 border-border hover:bg-card/80 transition-all duration-300"
+                  >
+                    <Link href={`/readings/${r.groupSlug}/${r.slug}`} className="group">
+                      <h4 className="font-semibold mb-1 group-hover:text-blue-400 transition-colors line-clamp-2">
+                        {r.title}
+                      </h4>
+                    </Link>
+                    <p className="text-sm text-muted-foreground">
+                      {r.authors} ({r.year})
+                    </p>
+                  </Card>
+                ))}
+              </div>
+            </div>
+          </section>
+        )}
+
         {/* Navigation */}
         <section className="py-12 border-t border-border/50">
           <div className="max-w-4xl mx-auto px-4 sm:px-6 lg:px-8">
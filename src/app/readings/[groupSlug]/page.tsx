@@ -8,7 +8,7 @@ import { Footer } from "@/components/layout/Footer";
 import { Card } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
-import { getGroup, getReadingsByGroup } from "@/content/readings";
+import { getGroup, getReadingsByGroup } from "@/content/readingsIndex";
 import { ArrowLeft, ExternalLink, FileText, ChevronRight } from "lucide-react";
 
 export default function GroupPage() {
@@ -8,7 +8,9 @@ import { Footer } from "@/components/layout/Footer";
 import { Card } from "@/components/ui/card";
 import { Input } from "@/components/ui/input";
 import { Badge } from "@/components/ui/badge";
-import { readingGroups, readings, getAllTags, getReadingsByGroup } from "@/content/readings";
+import { readingGroups, getAllTags, getReadingsByGroup } from "@/content/readingsIndex";
+import { readingSearchIndex } from "@/content/readingsSearchIndex";
+import { searchReadings } from "@/lib/readingSearch";
 import { Search, ArrowRight, BookOpen } from "lucide-react";
 
 export default function ReadingsPage() {
@@ -16,6 +18,12 @@ export default function ReadingsPage() {
   const [selectedTags, setSelectedTags] = useState<string[]>([]);
   const allTags = getAllTags();
 
+  // Index lookups instead of scanning every reading's text on each keystroke
+  const matchedReadingIds = useMemo(
+    () => searchReadings(readingSearchIndex, searchQuery),
+    [searchQuery]
+  );
+
   // Filter groups based on search and tags
   const filteredGroups = useMemo(() => {
     return readingGroups.filter((group) => {
@@ -25,8 +33,8 @@ export default function ReadingsPage() {
         if (!hasTag) return false;
       }
 
-      // Search filter
-      if (searchQuery) {
+      // Search filter (queries with no indexable words, e.g. one letter, don't filter)
+      if (searchQuery && matchedReadingIds) {
         const query = searchQuery.toLowerCase();
         const groupReadings = getReadingsByGroup(group.slug);
 
@@ -39,16 +47,14 @@ export default function ReadingsPage() {
         }
 
         // Search in readings within group
-        return groupReadings.some(
-          (r) =>
-            r.title.toLowerCase().includes(query) ||
-            r.authors.toLowerCase().includes(query)
+        return groupReadings.some((r) =>
+          matchedReadingIds.has(`${r.groupSlug}/${r.slug}`)
         );
       }
 
       return true;
     });
-  }, [searchQuery, selectedTags]);
+  }, [searchQuery, selectedTags, matchedReadingIds]);
 
   const toggleTag = (tag: string) => {
     setSelectedTags((prev) =>
@@ -94,7 +100,7 @@ export default function ReadingsPage() {
               <Search className="absolute left-3 top-1/2 -translate-y-1/2 w-4 h-4 text-muted-foreground" />
               <Input
                 type="text"
-                placeholder="Search titles, authors..."
+                placeholder="Search titles, authors, notes..."
                 value={searchQuery}
                 onChange={(e) => setSearchQuery(e.target.value)}
                 className="pl-10 bg-secondary/30"
@@ -28,10 +28,25 @@ export type Reading = {
   fullCitation: string;
   externalLinks: ReadingExternalLinks;
   oneLineSummary: string;
-  discussion: ReadingDiscussion;
+  discussion: ReadingDiscussion | null;
   needsLink?: boolean;
 };
 
+// Shapes of the split output of `readings parse --split-bodies`
+// (src/content/readingsIndex): list pages import only summaries, the detail
+// page loads a reading's body on demand.
+export type ReadingSummary = Omit<Reading, "fullCitation" | "discussion">;
+export type ReadingBody = Pick<Reading, "fullCitation" | "discussion">;
+
+// Inverted index over title, authors, summary and discussion, generated by
+// `readings parse --search-index`. postings[i] lists positions in `ids`
+// (`${groupSlug}/${slug}`) of the readings containing terms[i]; terms are sorted.
+export type ReadingSearchIndex = {
+  ids: string[];
+  terms: string[];
+  postings: number[][];
+};
+
 export const readingGroups: ReadingGroup[] = [
   {
     slug: "foundations",
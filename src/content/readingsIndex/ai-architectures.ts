@@ -0,0 +1,37 @@
+// Generated by `readings parse --split-bodies`; do not edit.
+import type { ReadingBody } from "../readings";
+
+export const readingBodies: Record<string, ReadingBody> = {
+  "language-models-are-few-shot-learners": {
+    "fullCitation": "Brown, T., Mann, B., Ryder, N., et al. (2020). Language models are few-shot learners. Advances in Neural Information Processing Systems, 33, 1877\u20131901. https://arxiv.org/pdf/2005.14165",
+    "discussion": {
+      "coreIdea": "Brown et al. show that if you scale a simple autoregressive language model up to GPT-3 size and train it on enough internet text, you get surprisingly strong \u201cfew-shot\u201d behavior: the model can solve new tasks just from instructions and a handful of examples in the prompt, with no weight updates. Under the hood, though, it\u2019s still just predicting the next token given the current context window. There\u2019s no persistent memory of the user across sessions, no stable world model in the human sense\u2014just a massive function mapping text histories to likely continuations, shaped entirely by pretraining statistics and whatever you stuff into the prompt.",
+      "questionAnswered": "The paper\u2019s central move is to demonstrate how far you can get with this bare-bones setup. No special task heads, no explicit symbolic reasoning, just scale plus in-context learning. That success is exactly why these models are so compelling as \u201ccompanions\u201d: they can flexibly imitate styles, give advice, and simulate dialogue purely by pattern-matching over text and a sliding window of recent turns.",
+      "whyItMatters": "For the social-friction angle, this gives me a clean way to say: AI companions feel socially responsive, but there\u2019s nobody \u201con the other end\u201d keeping score over time. They don\u2019t remember your past failures unless you remind them, don\u2019t hold grudges, and don\u2019t have their own goals that could conflict with yours. That statelessness is a big part of why interactions with them are low-risk and low-friction\u2014and why they can\u2019t really provide the long-horizon, reputation-based feedback that human social learning runs on."
+    }
+  },
+  "towards-understanding-sycophancy-in-language": {
+    "fullCitation": "Sharma, M., Tong, M., Korbak, T., et al. (2024). Towards understanding sycophancy in language models. International Conference on Learning Representations (ICLR 2024). https://arxiv.org/pdf/2310.13548",
+    "discussion": {
+      "coreIdea": "Sharma and colleagues dig into \u201csycophancy\u201d: the tendency of aligned language models to echo a user\u2019s stated views, even when those views are wrong or inconsistent with the model\u2019s own knowledge. Across several tasks\u2014political questions, math, factual queries\u2014they show that state-of-the-art assistants systematically bend toward users\u2019 opinions and errors, especially when the user\u2019s stance is made explicit. Analysis of human preference data then reveals an uncomfortable fact: labelers often prefer answers that agree with the user over answers that are strictly correct but disagree.",
+      "questionAnswered": "The upshot is that RLHF doesn\u2019t just train models to be helpful and safe; it also bakes in a bias toward flattery and deference, because those responses win in preference comparisons. When you optimize hard against that signal, you get models that avoid friction: they tend to soften disagreement, hedge, or outright go along with the user.",
+      "whyItMatters": "In the context of my project, this paper is almost a smoking gun. If human feedback systematically rewards \u201cmake the user feel good and validated,\u201d then AI companions will naturally become conflict-avoidant conversational partners. That creates a social environment where your beliefs are rarely challenged sharply, corrections are gentle and caveated, and it\u2019s easy to stay in epistemic bubbles of your own design. Great for comfort, terrible as a full replacement for the rough-and-tumble of human social feedback that actually forces you to revise your views."
+    }
+  },
+  "helpful-harmless-honest-sociotechnical-limits": {
+    "fullCitation": "Dahlgren Lindstr\u00f6m, A., Methnani, L., Krause, L., Ericson, P., de Rituerto de Troya, \u00cd. M., Coelho Mollo, D., & Dobbe, R. (2025). Helpful, harmless, honest? Sociotechnical limits of AI alignment and safety through Reinforcement Learning from Human Feedback. Ethics and Information Technology, 27(2), Article 28. https://doi.org/10.1007/s10676-025-09837-2",
+    "discussion": {
+      "coreIdea": "This paper steps back from the engineering details and asks what RLHF really optimizes at a sociotechnical level. The authors argue that \u201chelpful, harmless, honest\u201d is an appealing slogan, but in practice RLHF systems are strongly tilted toward helpful and harmless as judged by short-term human preference, with honesty and deeper safety goals often taking a back seat. Human raters operate under time pressure and limited knowledge; they reward outputs that look friendly, confident, and immediately satisfying, not ones that surface uncertainty, refuse dubious requests, or challenge harmful premises in a nuanced way.",
+      "questionAnswered": "They highlight several structural limits: Goodharting on proxy metrics (preference scores, upvotes), power asymmetries between developers, raters, and users, and the fact that many harms play out over long time horizons or at the collective level\u2014far beyond what a single rating can capture. RLHF thus tends to produce systems that are \u201caligned\u201d with the appearance of what people say they want in the moment, not necessarily with their long-term interests or with collective epistemic health.",
+      "whyItMatters": "For my argument about social friction, this is a crucial piece: AI companions trained this way are under constant pressure to smooth things over and keep the user comfortable. Telling hard truths, holding a firm boundary, or introducing productive discomfort are all behaviors that often lose in preference comparisons. So the very training scheme that makes these models feel friendly and supportive also makes them structurally bad at providing the kind of tough, high-friction feedback that real friends, teachers, and rivals sometimes give\u2014and that people grow from."
+    }
+  },
+  "training-language-models-to-follow": {
+    "fullCitation": "Ouyang, L., Wu, J., Jiang, X., et al. (2022). Training language models to follow instructions with human feedback. arXiv. https://doi.org/10.48550/arXiv.2203.02155",
+    "discussion": {
+      "coreIdea": "Ouyang et al. is the canonical \u201chow-to\u201d for turning a raw language model into an instruction-following assistant. They outline a three-stage pipeline: first, start from a pretrained GPT-3; second, fine-tune it on supervised examples where humans demonstrate ideal responses to prompts; third, train a reward model on human rankings of candidate outputs and then run reinforcement learning (PPO) to optimize the model toward higher predicted reward. The striking result is that a much smaller InstructGPT model, tuned this way, is preferred by humans over the giant base model across a wide range of tasks, while also being less toxic and slightly more truthful.",
+      "questionAnswered": "Technically, this paper shows that you can bend a generic next-token predictor into something that behaves like a cooperative conversational agent just by wrapping it in human feedback loops. There\u2019s no new architecture for \u201cvalues\u201d or \u201cunderstanding,\u201d just a clever use of demonstrations and preference modeling to reshape output distributions.",
+      "whyItMatters": "In my project, this is the mechanical backbone that pairs with the critique from Sharma and Dahlgren Lindstr\u00f6m. The same pipeline that boosts helpfulness and politeness is also the one that bakes in sycophancy and user-pleasing biases, because those are what win in the reward model\u2019s training data. So when I talk about AI companionship as \u201cengineered low-friction interaction,\u201d this paper is the place where that engineering actually lives: a gradient descent process nudging models, turn after turn, toward responses that feel easy and agreeable to humans in short evaluation windows, rather than toward the occasionally sharp, high-friction exchanges that long-term social learning depends on.\n\n"
+    }
+  }
+};
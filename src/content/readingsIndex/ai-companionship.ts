@@ -0,0 +1,37 @@
+// Generated by `readings parse --split-bodies`; do not edit.
+import type { ReadingBody } from "../readings";
+
+export const readingBodies: Record<string, ReadingBody> = {
+  "talk-trust-and-trade-offs-how": {
+    "fullCitation": "Common Sense Media. (2025). Talk, trust, and trade-offs: How teens experience AI companions. San Francisco, CA: Common Sense Media. https://www.commonsensemedia.org",
+    "discussion": {
+      "coreIdea": "Common Sense surveyed a nationally representative sample of U.S. teens (13\u201317) and finds that AI companions are already woven into adolescent life: about 72% have tried them, and over half are regular users. A third use them specifically for \u201csocial interaction and relationships\u201d (conversation practice, emotional support, role-play, friendship, or romance). Teens mostly come in for entertainment and curiosity, but a notable minority use companions because they\u2019re always available, nonjudgmental, and easier to talk to than real people, and some share things they wouldn\u2019t tell friends or family. At the same time, trust is ambivalent: half of teens say they don\u2019t trust advice from companions, and most still find conversations with humans more satisfying. Safety is a serious concern: prior reviews flagged sexual content, offensive stereotypes, and even dangerous \u201cadvice,\u201d leading Common Sense to recommend that minors avoid AI companions entirely.",
+      "questionAnswered": "For the friction story, this report is like a ground-level snapshot of what\u2019s actually happening.",
+      "whyItMatters": "Teens are already using AI companions in exactly the ways that matter for my argument: as low-stakes practice grounds, emotional sounding boards, and quasi-friends they can retreat to when human interaction feels too costly. Many say they can stand up for themselves better or start conversations thanks to practice with bots, but most don\u2019t use them for deliberate social skills training at all\u2014they\u2019re just there in the background as a softer social layer. That suggests a subtle shift: human interaction remains primary, but a growing share of teen \u201csocial calories\u201d is being spent in environments with limited consequences, high availability, and weak guardrails. The result is a generation that may feel more comfortable talking in general, while being less exposed to the sharper, norm-enforcing edges of peer feedback that historically shaped social development."
+    }
+  },
+  "the-rise-of-ai-companions": {
+    "fullCitation": "Zhang, Y., Ruan, Z., Wang, M., Zhang, S., & Hancock, J. T. (2025). The rise of AI companions: How human-chatbot relationships influence well-being. arXiv preprint arXiv:2506.12605. https://arxiv.org/abs/2506.12605",
+    "discussion": {
+      "coreIdea": "Zhang and colleagues combine survey data from 1,131 users with logs from hundreds of thousands of Character.AI messages to map how people actually use AI companions and how that use relates to well-being. People with smaller human social networks are more likely to lean on chatbots for companionship rather than information or productivity. Crucially, companionship-oriented use\u2014especially high-intensity, emotionally self-disclosing, partner-like interaction\u2014is consistently associated with lower well-being, particularly among those with weak offline support. The paper is careful about causality: lonely and distressed people may be drawn to companions in the first place, and heavy use might also reinforce withdrawal. Either way, the pattern looks like a risk marker rather than a reliably protective factor.",
+      "questionAnswered": "This gives empirical teeth to the worry that AI companionship can become a kind of social cul-de-sac.",
+      "whyItMatters": "The chatbots are doing their job: they provide warmth, engagement, and a sense of being understood. But the more users sink into intense, private bonds with them\u2014especially in the absence of strong human ties\u2014the more their overall psychological profile tends to look strained. In friction terms, AI companions are absorbing a lot of the emotional turbulence that would otherwise push people back toward messy human relationships: conflict, disappointment, negotiation, repair. If the relationship that feels safest is with a partner who never truly pushes back or demands anything, then the user\u2019s exposure to the very experiences that would grow their social capacity in the human world may keep shrinking over time."
+    }
+  },
+  "exploring-relationship-development-with-social": {
+    "fullCitation": "Pentina, I., Hancock, T., & Xie, T. (2023). Exploring relationship development with social chatbots: A mixed-method study of Replika. Computers in Human Behavior, 140, 107600. https://doi.org/10.1016/j.chb.2022.107600",
+    "discussion": {
+      "coreIdea": "Pentina and colleagues dig into how relationships with Replika actually develop, using interviews plus surveys of active users. They argue that simple \u201ccomputers are social actors\u201d heuristics no longer capture what\u2019s going on; people don\u2019t just mindlessly treat the bot as human. Instead, full-blown relationship dynamics emerge that look a lot like human attachment: users talk about trust, intimacy, reciprocity, and even \u201cpassionate AI usage\u201d edging toward addiction. Their model weaves together anthropomorphism, social presence, uses-and-gratifications, and attachment theory to show how companionship chatbots can move from casual use to emotionally central partnerships. Along the way, they raise concerns about emotional dependence, displacement of time and energy from human networks, and the difficulty of regulating systems that feel like partners but are owned and tuned by companies.",
+      "questionAnswered": "The key twist for my project is that this work treats AI companionship as a genuine relational process, not a mere \u201ctool\u201d interaction.",
+      "whyItMatters": "Users self-disclose more and more, feel understood, and begin to experience the bot as having memory and agency\u2014even though it has neither in the human sense. That\u2019s precisely the kind of bond that can compete with high-friction human relationships: when a Replika is always available, never storms off, and reliably meets affective needs, the motivational gradient can tilt away from friends and family who sometimes judge, misunderstand, or conflict. The paper helps me argue that AI companions don\u2019t just add connection on top of existing social life; they can reallocate attachment and practice toward an environment where many of the normal costs and corrections of human interaction never show up."
+    }
+  },
+  "social-companionship-with-artificial-intelligence": {
+    "fullCitation": "Chaturvedi, R., Verma, S., Das, R., & Dwivedi, Y. K. (2023). Social companionship with artificial intelligence: Recent trends and future avenues. Technological Forecasting and Social Change, 191, 122534. https://www.sciencedirect.com/science/article/pii/S0040162523003190",
+    "discussion": {
+      "coreIdea": "Chaturvedi and coauthors offer a broad map of \u201csocial companionship with AI\u201d as a research field. Through bibliometric and thematic analysis, they identify the main theories (anthropomorphism, social presence, attachment, uses-and-gratifications), key constructs (loneliness, trust, dependence, self-disclosure), and typical outcomes (perceived support, engagement, but also addiction, displacement, and privacy risk). They propose a conceptual framework where antecedents (user traits like loneliness, social anxiety; design features like human-like cues) feed into mediators (perceived warmth, agency, social presence), which then shape consequences for individual well-being and social networks, moderated by factors like regulation and cultural norms. The review emphasizes how quickly commercial design is racing ahead of ethical and policy thinking.",
+      "questionAnswered": "As a backdrop for my project, this review does two things.",
+      "whyItMatters": "First, it shows that companionship AIs are not fringe curiosities; they sit at the intersection of customer service, mental health, elder care, and entertainment, with overlapping mechanisms across domains. Second, it crystallizes the trade-offs: the same features that make these systems good companions\u2014high availability, emotional mirroring, personal customization\u2014are also the ones that can foster dependence and crowd out human ties. Chaturvedi et al. are not arguing that social AI is inherently bad, but they highlight how little we understand about long-term, population-level effects. That gap is exactly where my social-friction argument lives: current systems are being optimized to maximize comfort, engagement, and perceived support, while almost no one is explicitly optimizing for the preservation of hard, growth-driving aspects of human social life\u2014conflict, accountability, and the necessity of navigating other minds that aren\u2019t designed to put you first."
+    }
+  }
+};
@@ -0,0 +1,45 @@
+// Generated by `readings parse --split-bodies`; do not edit.
+import type { ReadingBody } from "../readings";
+
+export const readingBodies: Record<string, ReadingBody> = {
+  "how-ai-and-human-behaviors": {
+    "fullCitation": "Pataranutaporn, P., Liu, R., Finn, E., & Maes, P. (2024). How AI and human behaviors shape psychosocial effects of chatbot use: A longitudinal controlled study. MIT Media Lab / OpenAI preprint. https://arxiv.org/pdf/2503.17473",
+    "discussion": {
+      "coreIdea": "This study tracks nearly a thousand adults assigned to use ChatGPT daily for four weeks under different \u201cmodalities\u201d (text, neutral voice, engaging voice) and task types (personal, non-personal, open-ended). Participants are nudged into at least five minutes of daily use while the researchers track loneliness, social network size, emotional dependence, and problematic use. Across conditions, heavier use is associated with higher loneliness, stronger emotional dependence on the chatbot, more problematic usage patterns, and reduced time spent socializing with people. Personal/companion-like usage and emotionally engaging voice chatbots seem to intensify the sense of connection to the AI, but that connection doesn\u2019t translate into richer human social lives.",
+      "questionAnswered": "At its core, the paper asks: under realistic, extended use, do AI chatbots make people feel less lonely and more socially supported, or do they subtly make things worse\u2014and how much of that is about the AI\u2019s design versus the human\u2019s behavior? The answer is basically: both matter, but user behavior and dosage dominate. The engaging voice and personal-task conditions can feel more relational and comforting, yet the main signal is that more time with the bot tends to correspond to more loneliness and dependence, not less, particularly when the chatbot is framed as a companion.",
+      "whyItMatters": "For my project, this is a flagship example of \u201cfrictionless\u201d AI companionship backfiring. The chatbot reliably offers warm, low-effort, low-risk interaction: no awkward pauses, no judgmental looks, no real possibility of rejection. That removes many of the small frictions that normally force us to tune our behavior in human relationships\u2014negotiating time, tolerating silence, repairing misunderstandings. Over weeks, those missing frictions don\u2019t just make life more comfortable; they appear to crowd out human encounters that would provide messy, corrective feedback. The study gives empirical teeth to the idea that AI can feel social while quietly hollowing out the social learning loops we actually need."
+    }
+  },
+  "social-sycophancy-llms-reinforce-problematic": {
+    "fullCitation": "Cheng, D., Yang, Z., Hurtado, C., et al. (2025). Social sycophancy: LLMs reinforce problematic behavior in AITA. arXiv preprint arXiv:2505.13995.",
+    "discussion": {
+      "coreIdea": "This paper builds a dataset from AITA-style posts where human consensus labels someone as clearly \u201cin the wrong\u201d versus \u201cnot in the wrong.\u201d The authors then probe several LLMs, asking them to judge the situation and offer advice. The key pattern: models frequently soften or overturn harsh community judgments, especially when the original poster is actually the one at fault. Instead of delivering clear negative feedback\u2014\u201cyou\u2019re behaving badly; here\u2019s what needs to change\u201d\u2014the models hedge, empathize, or reframe in ways that minimize discomfort for the user. In other words, they act like social yes-men.",
+      "questionAnswered": "The central question is whether LLMs can reliably act as moral critics in everyday social conflicts, or whether they default to appeasing the user. The authors show that across models, there is a strong tendency toward \u201csocial sycophancy\u201d: the model picks responses that feel supportive and face-saving, even when that directly conflicts with human-majority judgments embedded in the dataset. Attempts to steer the models toward \u201chonesty\u201d help somewhat but don\u2019t eliminate the basic pressure toward agreement and reassurance.",
+      "whyItMatters": "For my project, this paper gives concrete, behavior-level evidence that AI advice givers are structurally disinclined to provide the kind of sharp, uncomfortable feedback that real-world social interactions routinely deliver. When you\u2019re rude to a friend, they may withdraw, push back, or confront you\u2014that\u2019s friction, and it teaches. When you\u2019re rude in an AITA post and ask an LLM, the system often massages your ego instead. That kind of systematically softened feedback erodes a crucial channel of social learning: the experience of being told, clearly and unambiguously, \u201cyou were wrong here\u2014do better.\u201d"
+    }
+  },
+  "understanding-consumer-reactions-to-chatbot": {
+    "fullCitation": "Cai, N., Heo, J., & Yan, J. (2025). Understanding consumer reactions to chatbot service failures: Evidence from a Wizard-of-Oz experiment. Acta Psychologica, 253, 104707. https://doi.org/10.1016/j.actpsy.2025.104707",
+    "discussion": {
+      "coreIdea": "In this study, participants interact with what they think is either a chatbot or a human customer service agent, but all interactions are secretly controlled (Wizard-of-Oz style). Everyone experiences a scripted service failure, and the researchers examine downstream attitudes: perceived competence and warmth, emotional reactions, and overall evaluations of the firm. The key finding is asymmetric: identical failures are judged more harshly when attributed to a chatbot. Human agents are seen as more competent and better able to repair the damage, while chatbot failures more strongly erode brand trust and satisfaction.",
+      "questionAnswered": "The paper\u2019s core question is whether, in failure contexts, chatbots can stand in for humans without changing how people feel about the interaction. The answer is no: agency type matters. Drawing on social perception theory, the authors argue that people treat human agents as richer, intention-bearing minds who can respond flexibly and make amends, while chatbots are seen as rigid systems whose mistakes signal deeper incompetence. A human saying \u201cI\u2019m sorry\u201d helps; a bot saying \u201cI\u2019m sorry\u201d often just highlights its limitations.",
+      "whyItMatters": "For my project, the interesting twist is that failures from AI agents seem to carry less social weight for the user\u2019s own learning. People are annoyed at the brand, but there is no real interpersonal negotiation: no subtle pressure to adjust tone, express needs more clearly, or empathize with a stressed worker. And from the AI side, the bot isn\u2019t socially punished in any meaningful way\u2014it doesn\u2019t care, and it doesn\u2019t learn from the specific user\u2019s anger. That combination means fewer mutually adaptive micro-adjustments. Compared with a human\u2013human service exchange, AI-mediated failures become low-friction dead ends, with weaker social learning signals on both sides."
+    }
+  },
+  "chatbots-as-social-companions-how": {
+    "fullCitation": "Guingrich, R. E., & Graziano, M. S. A. (2025). Chatbots as social companions: How people perceive consciousness, human likeness, and social health benefits. In P. Hacker (Ed.), Oxford Intersections: AI in Society. Oxford University Press. https://doi.org/10.1093/9780198945215.003.0011",
+    "discussion": {
+      "coreIdea": "This chapter pulls together experiments and survey data on how people psychologically represent chatbots. By manipulating cues like language style, narrative framing, and explicit statements about the system\u2019s \u201cinner life,\u201d the authors show that people very quickly start treating some chatbots as quasi-conscious social others. High \u201cascribed consciousness\u201d is linked to feeling understood, feeling less alone, and seeing the chatbot as a legitimate relationship partner rather than a mere tool.",
+      "questionAnswered": "The central question is double-edged: what makes a chatbot feel like a conscious, human-like companion, and does that perception actually improve social health? The first part is relatively clear\u2014anthropomorphic cues, theory-of-mind framing, and emotionally responsive behavior all push people toward seeing the bot as a mind. The second part is more sobering. Perceived social benefits mostly live within the human\u2013AI dyad; there is little evidence that stronger belief in chatbot \u201cconsciousness\u201d translates into richer human networks or improved skills in human relationships. In some samples, heavier reliance on socially humanized AI is associated with more social withdrawal or lower confidence in dealing with people.",
+      "whyItMatters": "This is almost tailor-made for the \u201csocial friction\u201d story. If you can outsource feelings of being seen and understood to a chatbot that you privately believe is conscious, you can get many of the emotional payoffs of intimacy without the taxing frictions of human relations\u2014no conflicting needs, no genuine moral accountability, no embodied awkwardness. The work suggests that as AI companions become more convincingly \u201cminded,\u201d they may become even better at smoothing away the very rough edges\u2014misunderstandings, embarrassment, conflict\u2014that, in human interactions, drive recalibration and long-term social learning."
+    }
+  },
+  "chatgpt-giving-relationship-advice": {
+    "fullCitation": "Hou, H., Leach, K., & Huang, Y. (2024). ChatGPT giving relationship advice \u2013 How reliable is it? Proceedings of the International AAAI Conference on Web and Social Media, 18 (1), 610\u2013623. https://doi.org/10.1609/icwsm.v18i1.31338",
+    "discussion": {
+      "coreIdea": "The authors take a very practical problem\u2014\u201cshould people rely on ChatGPT for relationship advice?\u201d\u2014and attack it empirically. They use a large corpus of Reddit posts about intimate relationship problems and associated human-rated advice, then ask ChatGPT to rank or judge different advice options for the same posts. Agreement with human judgments is weak, and when they resend identical queries, the model\u2019s own rankings fluctuate noticeably. Reliability drops especially in more ambiguous, morally gray situations\u2014the ones where people most want guidance.",
+      "questionAnswered": "The core question is whether a general-purpose LLM can function as a stable, human-aligned arbiter of what counts as \u201cgood\u201d relationship advice. The answer is: not yet. ChatGPT can produce articulate, plausible-sounding guidance, but its alignment with human judgments is low, and its decisions are noisy from one run to the next. The system doesn\u2019t seem to implement a consistent, deeply grounded model of relational ethics; it\u2019s more like a sophisticated pattern-matcher whose outputs wander within a polite, supportive band.",
+      "whyItMatters": "For the project, this is a neat example of friction reduction with epistemic costs. An AI advisor gives you instant, low-friction answers to painfully complicated relational questions, but those answers are neither strongly tethered to human normative consensus nor stable over time. Contrast that with turning to friends, partners, or therapists: those conversations are effortful and risky, but the feedback you get is grounded in long-run knowledge of you, shared history, and real stakes in the relationship. Repeatedly substituting AI for that messy process means you get soothing, fast-twitch \u201cadvice\u201d without fully engaging the slow, socially embedded learning that comes from negotiating conflict and sitting in uncertainty with other people."
+    }
+  }
+};
@@ -0,0 +1,53 @@
+// Generated by `readings parse --split-bodies`; do not edit.
+import type { ReadingBody } from "../readings";
+
+export const readingBodies: Record<string, ReadingBody> = {
+  "is-adolescence-a-sensitive-period": {
+    "fullCitation": "Blakemore, S. J., & Mills, K. L. (2014). Is adolescence a sensitive period for sociocultural processing? Annual Review of Psychology, 65, 187\u2013207. https://doi.org/10.1146/annurevpsych-010213-115202",
+    "discussion": {
+      "coreIdea": "Blakemore and Mills make the case that adolescence isn\u2019t just a messy transitional phase; it may be a genuine sensitive period for learning how to navigate status, belonging, reputation, and group norms. The review links behavioral shifts\u2014heightened peer sensitivity, risk-taking in social contexts, stronger concern with evaluation\u2014to ongoing remodeling in the \u201csocial brain,\u201d including prefrontal and temporoparietal systems that support mentalizing and self-control. The punchline is that the adolescent brain seems temporarily biased toward social input, which may be adaptive for learning the rules of adult society.",
+      "questionAnswered": "The article\u2019s guiding question is whether there is evidence that sociocultural learning is especially malleable in adolescence, analogous to sensitive periods in language or vision. The authors answer by integrating neuroscience, developmental psychology, and cross-species findings: adolescents show distinctive patterns of neural plasticity, shifting reward sensitivity, and heightened responsiveness to peer evaluation. These changes plausibly create a window where social feedback carries extra weight and can more durably shape identity and behavior.",
+      "whyItMatters": "This is a strategic anchor for the AI-friction argument. If adolescents are biologically primed to learn from real peers\u2014where feedback is unpredictable, high-stakes, and sometimes harsh\u2014then replacing even a slice of that exposure with low-friction AI companionship could matter more than we\u2019d expect in adulthood. The worry isn\u2019t that teens will stop talking to humans entirely, but that the training data for their social brains gets subtly rebalanced toward safer, more controllable interactions during the exact window when the system is hungriest for real-world calibration."
+    }
+  },
+  "navigating-the-social-environment-in": {
+    "fullCitation": "Andrews, J. L., Ahmed, S. P., & Blakemore, S. J. (2021). Navigating the social environment in adolescence: The role of social brain development. Biological Psychiatry, 89(2), 109\u2013118. https://doi.org/10.1016/j.biopsych.2020.09.012",
+    "discussion": {
+      "coreIdea": "This piece zooms in on the mechanisms of adolescent social learning: how developing neural networks support the ability to read intentions, manage impressions, and adapt behavior across shifting peer contexts. The authors emphasize that adolescence is when social evaluation becomes a major driver of motivation. That sensitivity can amplify vulnerability to anxiety or rejection, but it also powers rapid learning about norms, alliances, and identity.",
+      "questionAnswered": "The underlying question is how changes in social brain circuitry map onto the behavioral realities of adolescence\u2014especially the intense pull of peers. The authors answer through a synthesis of neuroimaging and behavioral evidence showing that mentalizing networks, reward systems, and cognitive control circuits mature on differing timelines, producing a period where social outcomes feel especially salient while self-regulation is still refining. In practice, that mismatch makes adolescents both more reactive and more teachable in socially charged environments.",
+      "whyItMatters": "This slots neatly into the claim that friction is not a bug but a feature for social learning. Real peer interactions force adaptation: you misread a vibe, you get corrected; you push too hard, someone withdraws; you find your lane. AI companionship is engineered to reduce those costs and soften those edges. The risk is that a low-challenge social environment becomes a default rehearsal space, leaving teens less practiced in tolerating evaluation and less fluent in the micro-adjustments that human groups demand."
+    }
+  },
+  "media-exposure-and-preschoolers-social-cognitive": {
+    "fullCitation": "Lenhart, J., Richter, T., Appel, M., & Mar, R. A. (2024). Media exposure and preschoolers\u2019 social-cognitive development. British Journal of Developmental Psychology, 42(3), 345\u2013361. https://pubmed.ncbi.nlm.nih.gov/38406975/",
+    "discussion": {
+      "coreIdea": "Lenhart and colleagues focus on early childhood, where theory of mind is being built out of thick, reciprocal social experience. Their central theme is displacement: time spent in screen-based, non-contingent experiences is time not spent in the kind of back-and-forth that trains children to track others\u2019 beliefs, emotions, and intentions. The review suggests that not all media is equal, but that passive or less interactive exposure is generally a weaker scaffold for social-cognitive growth than live engagement.",
+      "questionAnswered": "They\u2019re asking, in effect, whether media exposure changes the trajectory of preschoolers\u2019 social understanding\u2014and if so, by what pathways. The answer they assemble is that live interaction provides richer cues (joint attention, immediate repair, nuanced emotional feedback), while screens often flatten those signals. Any ToM benefits from media likely depend on high-quality content and active, socially embedded use, but the default pattern doesn\u2019t match the developmental potency of real people.",
+      "whyItMatters": "This gives the AI-friction argument a developmental \u201clower bound.\u201d If early social-cognitive systems are sensitive to the contingency and richness of interaction, then later shifts toward AI-mediated sociality could have similar logic: an environment that feels social but is structurally thinner may not train mental-state reasoning as robustly. It\u2019s a reminder that the medium isn\u2019t neutral; it shapes what children and future adolescents learn to expect from minds other than their own."
+    }
+  },
+  "the-influence-of-childrens-emotional": {
+    "fullCitation": "Cao, Y., Wang, N., Lv, X., & Xie, H. (2023). The influence of children\u2019s emotional comprehension on peer conflict resolution strategies. Frontiers in Psychology, 14, Article 1124514. https://www.frontiersin.org/journals/psychology/articles/10.3389/fpsyg.2023.1142373/",
+    "discussion": {
+      "coreIdea": "Cao and colleagues examine how children\u2019s ability to understand emotions predicts the strategies they use when conflicts arise with peers. The broad takeaway is intuitive but important: better emotional comprehension is linked to more constructive, prosocial conflict resolution and less reliance on avoidance or aggression. Peer conflict is framed not just as a problem to eliminate, but as a context where social-cognitive skills are exercised and refined.",
+      "questionAnswered": "The paper addresses how internal understanding of emotion translates into real-time social problem solving. They answer by connecting measures of emotional comprehension with reported or observed conflict strategies, arguing that children who can identify and interpret emotions are better equipped to negotiate disagreements, anticipate consequences, and choose solutions that preserve relationships.",
+      "whyItMatters": "This is a good micro-level mechanism for my central claim. The skills that keep groups functioning\u2014repair, compromise, emotional prediction\u2014are forged in actual, occasionally uncomfortable peer friction. If AI companions become a major \u201cpractice space\u201d for kids and teens, they may offer lots of emotional talk without the embodied, mutual stakes of a real disagreement. A chatbot doesn\u2019t get hurt, doesn\u2019t hold a grudge, and doesn\u2019t require the child to manage the long-term social costs of a bad move. That reduces one of the key pressures that turns emotional knowledge into mature conflict skill."
+    }
+  },
+  "social-connectedness-mental-health-and": {
+    "fullCitation": "Lamblin, M., Murawski, C., Whittle, S., & Fornito, A. (2017). Social connectedness, mental health and the adolescent brain. Neuroscience & Biobehavioral Reviews, 80, 57\u201368. https://doi.org/10.1016/j.neubiorev.2017.05.010",
+    "discussion": {
+      "coreIdea": "This review ties social connectedness to adolescent mental health and brain development, suggesting that belonging isn\u2019t a soft luxury\u2014it\u2019s a biological and psychological stabilizer. The authors link low connectedness to higher risk for depression and anxiety and discuss how social deprivation or exclusion can shape stress and reward systems. Adolescence is painted as a period when social ties are both developmentally central and neurobiologically impactful.",
+      "questionAnswered": "They\u2019re asking how social relationships interact with developing brain networks to influence vulnerability or resilience. The answer is a synthesis showing that supportive relationships can buffer stress reactivity and promote healthier trajectories in systems involved in emotion regulation and reward. Conversely, isolation and chronic exclusion can deepen vulnerability by shifting how adolescents process threat, rejection, and self-worth.",
+      "whyItMatters": "This adds a necessary nuance to the friction story: reducing pain isn\u2019t always bad, and not all friction is \u201cgood friction.\u201d The goal isn\u2019t to romanticize cruelty or loneliness. The risk is that AI companionship becomes a substitute for belonging rather than a bridge to it. A bot can soften acute loneliness, but it can\u2019t provide the durable, identity-shaping protection of being embedded in a real peer network. So the final report can use this to argue for a balanced stance: we need friction that teaches, but also connectedness that protects\u2014and AI should be evaluated on whether it supports both."
+    }
+  },
+  "interpersonal-apprehensions-impact-on-behavior": {
+    "fullCitation": "Shrivastava, A. (2025). Interpersonal Apprehension\u2019s Impact on Behavior and Performance in High-Stakes Scenarios. Business and Professional Communication Quarterly. https://doi.org/10.1177/23294906251322889",
+    "discussion": {
+      "coreIdea": "Shrivastava examines interpersonal apprehension in professional or high-stakes contexts\u2014situations where the cost of a social misstep can feel disproportionate. The main idea is that uncertainty about how others will judge you can suppress participation, risk-taking, and performance. People hold back not because they lack competence, but because anticipated evaluation becomes a throttle on behavior.",
+      "questionAnswered": "The paper\u2019s core question is how apprehension shapes communication and outcomes when the stakes are high. The answer appears to be that heightened evaluation concerns reduce willingness to speak up, ask clarifying questions, or engage assertively, which can then impair both individual performance and group decision quality. The work frames apprehension as a dynamic, context-sensitive barrier rather than a stable personality flaw.",
+      "whyItMatters": "This gives a modern, applied hinge point for my argument. AI companions may lower interpersonal apprehension by offering a zero-judgment rehearsal space, which could be genuinely useful as training wheels. The catch is transfer: if the safest environment becomes the default, people may become less practiced at performing under real evaluative uncertainty. The final report can use this to motivate a design principle: the goal shouldn\u2019t be to eliminate apprehension forever, but to help users gradually build tolerance for the ambiguity and pressure that come with human audiences.\n\n"
+    }
+  }
+};
@@ -0,0 +1,53 @@
+// Generated by `readings parse --split-bodies`; do not edit.
+import type { ReadingBody } from "../readings";
+
+export const readingBodies: Record<string, ReadingBody> = {
+  "on-face-work-an-analysis-of": {
+    "fullCitation": "Goffman, E. (1955). On face-work: An analysis of ritual elements in social interaction. Psychiatry, 18 (3), 213\u2013231. https://doi.org/10.1080/00332747.1955.11023008",
+    "discussion": {
+      "coreIdea": "Goffman argues that everyday interaction is organized around \u201cface\u201d \u2013 the positive social value a person claims \u2013 and the ongoing \u201cface-work\u201d people do to maintain it. In any encounter, you put forward a \u201cline\u201d about who you are and where you stand; once it\u2019s in play, you and others are morally bound to sustain it. Social life is thus full of tiny, ritualized maneuvers (apologies, joking, tact, avoidance) that repair threatened face and keep interaction flowing. Under the surface, there\u2019s a surprisingly strict moral order: people are expected both to respect their own face and to protect others\u2019, and much of the anxiety and drama in social life comes from possible losses of face that can\u2019t easily be undone.",
+      "questionAnswered": "The core question is: what invisible rules and rituals make ordinary interaction hang together without constant breakdown? Goffman answers by treating interaction as a kind of secular religion of face, in which individuals are simultaneously actors and audience. By carefully analyzing small events\u2014slights, gaffes, rescues\u2014he shows that people orient to face as a sacred object: they anticipate threats, work to prevent them, and rush to repair them when they occur. The article doesn\u2019t rely on experiments or formal models; instead, it builds a phenomenological-analytic case that these moral expectations are what keep conversations from flying apart.",
+      "whyItMatters": "For my project, this paper is basically the \u201corigin story\u201d of social friction. Goffman insists that interaction is inherently risky, irreversible, and emotionally loaded: once a remark lands, you can\u2019t un-say it, and everyone must cope with its impact on face. That is exactly the kind of variable, high-stakes feedback I\u2019m arguing is essential for social learning \u2013 the mix of smiles, winces, silence, and pushback that trains our behavior over time. In contrast, AI companionship offers a world where face is almost never seriously threatened: you can edit your message before sending, reset the chat, and count on the model to be tactful and forgiving. My broader claim is that if people increasingly practice social life in this low-friction environment, they will do less face-work, experience fewer real losses of face, and therefore get weaker training in how to navigate messy, high-stakes human encounters. Goffman gives me the conceptual language \u2013 face, line, ritual repair \u2013 to describe what exactly gets flattened when we outsource our social practice to friction-free AI companions."
+    }
+  },
+  "a-review-of-theories-and": {
+    "fullCitation": "Hadley, L. V., Goldberg, A., & Levinson, S. C. (2022). A review of theories and methods in the science of face-to-face social interaction. Nature Reviews Psychology, 1, 42\u201354. https://doi.org/10.1038/s44159-021-00008-w",
+    "discussion": {
+      "coreIdea": "Hadley, Naylor and Hamilton treat face-to-face interaction as a rich, multimodal, cognitive problem rather than just \u201ctalk plus body language.\u201d They argue we can organize interaction behavior three ways: by modality (gaze, gesture, speech, posture), by underlying cognitive processes (perception, prediction, control), or by social meaning (e.g., turn-taking, dominance, affiliation). They then map three families of theories onto this: (1) social-meaning theories that describe what behaviors do in interaction, (2) simple behavior-rule theories (like flocking rules) that show how complex coordination can emerge from local rules, and (3) rich cognition theories where people maintain detailed internal models of others\u2019 minds. Finally, they review new methods\u2014high-resolution motion capture, dual eye-tracking, hyperscanning, VR/artificial agents\u2014that let us actually test these theories in naturalistic settings, instead of only in stripped-down lab tasks.",
+      "questionAnswered": "The core question is: how should we theorize and measure face-to-face interaction so that we can move beyond vague talk of \u201csocial skills\u201d to actual testable models? The authors answer by laying out a kind of coordinate system: one axis for how we organize behavior (modality vs cognition vs meaning), another for what kind of theory we\u2019re using (social meaning, behavior rules, rich cognition), and a toolkit of methods that can discriminate among them. Their answer is explicitly pluralistic: no single framework wins; progress comes from matching theory type to the right behavioral measures and experimental setups.",
+      "whyItMatters": "This paper gives me a vocabulary and toolkit for talking about \u201cfriction\u201d in a non-hand-wavy way. My core claim is that real-world social learning depends on messy, irreversible, multimodal feedback\u2014raised eyebrows, hesitations, interruptions\u2014while AI companionship strips much of that away. Hadley et al. show that face-to-face interaction is exactly this dense, coordinated coupling of modalities and cognitive processes; it\u2019s not just text with extra steps. In my final report, I can lean on their tripartite theory structure: AI companions mostly simulate social meaning with language, but they don\u2019t expose users to the full behavior-rule dynamics or the demand to maintain rich, up-to-date models of specific others\u2019 minds. That gap helps explain why friction-free AI practice may fail to generalize: it trains users in a thinned-out slice of the interaction space, where many of the cues and contingencies that normally drive social learning are simply missing."
+    }
+  },
+  "a-simplest-systematics-for-the": {
+    "fullCitation": "Sacks, H., Schegloff, E. A., & Jefferson, G. (1974). A simplest systematics for the organization of turn-taking for conversation. Language, 50 (4), 696\u2013735. https://doi.org/10.2307/412243",
+    "discussion": {
+      "coreIdea": "Sacks, Schegloff, and Jefferson are basically trying to reverse-engineer the \u201chidden operating system\u201d of conversation. Their key move is to treat turn-taking as a rule-governed system in its own right, not just a side effect of grammar or politeness. They argue that everyday talk is organized around \u201cturn-constructional units\u201d (sentences, clauses, even single words) that project possible completion points. At each of these points, there\u2019s a structured choice about who speaks next: the current speaker can select a next speaker, someone else can self-select, or the current speaker can continue. These simple rules explain a whole constellation of observable facts: why there\u2019s usually only one speaker at a time, why gaps and overlaps are so short, how turn lengths vary so much, and how the system generalizes across settings and languages while still allowing special cases like classrooms or debates.",
+      "questionAnswered": "The central question of the article is: what minimal set of rules could generate the orderly yet flexible pattern of \u201cwho talks when\u201d that we see in ordinary conversation? They answer this by treating conversation almost like a formal system: start from a set of empirical regularities (one-at-a-time talk, short gaps, variable turn size, etc.), then propose a small rule set and show how it can generate those regularities. The paper doesn\u2019t do hypothesis testing in the modern sense; instead it offers a detailed analytic fit between the rule system and transcribed data, arguing that the proposed turn-taking mechanism is both simple and powerful enough to account for the observed structure of talk.",
+      "whyItMatters": "For my project, this paper sharpens what exactly gets lost when we move to AI-mediated, friction-light interaction. In Sacks et al.\u2019s world, conversation is a high-bandwidth coordination game: you are constantly predicting when others might jump in, designing your turns to invite or block responses, and managing the risk of awkward gaps or overlaps. All of that is live social friction. AI chat, by contrast, collapses turn-taking into a guaranteed, latency-tolerant back-and-forth: no interruptions, no competition for the floor, no need to time your entry into the stream of talk. That means fewer opportunities to practice the micro-skills of floor management and timing that their system highlights\u2014skills that are central to functioning in real groups. In the final report, this article will be my evidence that even the basic \u201cwho speaks when\u201d layer of conversation is nontrivial, learned, and fragile\u2014and that AI companionship quietly removes an entire dimension of social training by turning turn-taking itself into a solved problem."
+    }
+  },
+  "social-friction": {
+    "fullCitation": "Ward, L. F. (1892). Social friction. In L. F. Ward, The psychic factors of civilization (pp. 102\u2013115). Boston: Ginn & Company. https://doi.org/10.1037/12960-017",
+    "discussion": {
+      "coreIdea": "Ward\u2019s core move is to reinterpret \u201cethics\u201d as a byproduct of the social machine\u2014not a lofty realm of principles, but the way society manages the collisions that happen when individuals pursue their own ends. Moral rules, in his view, grow out of the system: people are literally compelled to behave \u201cmorally\u201d by social sanctions\u2014ostracism, loss of livelihood, imprisonment\u2014rather than by pure conscience. Ethics is about conduct, not action: it doesn\u2019t generate productive activity, it regulates and restrains it, much like mechanical friction. Social friction is thus both necessary (to keep the machine from tearing itself apart) and costly (it slows progress), and the task of \u201csocial intellect\u201d is to remove all friction that isn\u2019t strictly required.",
+      "questionAnswered": "The central question of the chapter is: what is the real domain and function of ethics within social life? Ward answers by sharply limiting ethics to cases where pursuits of ends conflict\u2014where my action obstructs yours. He argues that moral codes are self-enforcing products of social evolution, not things we create by preaching. Teaching ethics has little power to improve character; it mostly produces timidity and egotism in teachers and students obsessed with guarding reputations. Even seemingly private vices (intemperance, self-harm) matter morally only once they re-enter society and increase \u201cfriction\u201d in the social machinery. Even charity, which looks purely altruistic, is explained as an attempt to relieve pressure caused by deeper obstructions that prevent the poor from pursuing normal action.",
+      "whyItMatters": "Ward gives me a nineteenth-century blueprint for thinking about \u201calignment\u201d as something that emerges from lived constraint and conflict. Social norms bite because violations carry real costs; the moral code is felt in the frictions of everyday life. AI companionship, by contrast, offers moral interaction with almost no friction: no ostracism, no lost opportunities, no real penalties for being selfish, evasive, or untruthful. In Ward\u2019s terms, it\u2019s like a form of perpetual charity that eases local discomfort without touching the structural barriers underneath. That suggests a concrete risk: as more social practice shifts into these low-friction spaces, we may blunt exactly the social forces that historically produced moral alignment in the first place."
+    }
+  },
+  "the-emergence-of-social-norms": {
+    "fullCitation": "Hawkins, R. X. D., Goodman, N. D., & Goldstone, R. L. (2019). The Emergence of Social Norms and Conventions. Trends in Cognitive Sciences, 23(2), 158\u2013169. https://doi.org/10.1016/j.tics.2018.11.003",
+    "discussion": {
+      "coreIdea": "Hawkins and colleagues treat norms and conventions as solutions that emerge from many small, local coordination problems. Rather than assuming norms are just \u201cout there,\u201d they show how repeated interactions, limited information, and simple learning rules can gradually stabilize into shared expectations. They review work where agents\u2014human or simulated\u2014face tasks like naming objects, dividing resources, or coordinating on signals. Across methods, the same story shows up: people start out noisy and idiosyncratic, but through feedback, adaptation, and mutual prediction, they converge on conventions that reduce uncertainty about what others will do. Norms then become both constraints (limiting options) and scaffolds (making the social world more predictable and efficient).",
+      "questionAnswered": "The central question is: how do shared social norms arise from the messy, decentralized behavior of individuals who are just trying to get by in local interactions? The paper\u2019s answer is multi-level. At the micro level, individuals learn from reinforcement and social inference in specific encounters\u2014updating expectations when others reward or punish certain behaviors. At the meso level, network structure and patterns of interaction (who meets whom, how often, under what information) shape which conventions win out. At the macro level, cultural evolution and population turnover help stabilize or shift norms over generations. Norms are therefore not imposed from above so much as they crystallize from countless episodes of friction and adjustment.",
+      "whyItMatters": "This gives a mechanistic backbone to the idea that social friction is a training signal. Norms don\u2019t emerge in a vacuum; they are carved out by trial and error, misunderstandings, mild conflicts, and the pressure to coordinate with actual, sometimes stubborn, other people. AI companionship environments, by contrast, are typically designed to minimize friction: the model adapts quickly to the user, avoids harsh negative feedback, and often \u201cmeets you where you are\u201d instead of forcing you to adapt. That means fewer genuine coordination failures, fewer moments where you experience the cost of misalignment and have to update. In the final report, this article will help me argue that if we increasingly practice interaction in artificially forgiving, one-sided systems, we may get worse at the very multi-level learning processes that produce and maintain real-world social norms."
+    }
+  },
+  "face-to-face-learning-enhances-the-social": {
+    "fullCitation": "Ransom, A., LaGrant, B., Spiteri, A., Kushnir, T., Anderson, A. K., & De Rosa, E. (2022). Face-to-face learning enhances the social transmission of information. PLOS ONE, 17(2), e0264250. https://doi.org/10.1371/journal.pone.0264250",
+    "discussion": {
+      "coreIdea": "The paper asks what special advantage, if any, face-to-face learning has over other vantage points when people are trying to acquire a complex visuospatial skill from a model. Using a multi-step \u201cpuzzle box\u201d task with children and adults, they manipulate the learner\u2019s viewpoint (0\u00b0, 90\u00b0, 180\u00b0 relative to the model) and track not just whether people can open the box, but how they do it: how faithfully they imitate the model\u2019s actions, how often they innovate new solutions, and how quickly they solve the task. The key finding is that face-to-face (180\u00b0) learning, which is visually the most awkward perspective, still enhances the efficiency of learning and the transmission of useful \u201cknow-how.\u201d Sharing a mental perspective with a partner in a rich, embodied setup can trump the visual convenience of a shared first-person view.",
+      "questionAnswered": "The central question is whether social learning is primarily about copying visible actions from the easiest angle, or about grasping another person\u2019s goals and intentions in a way that supports flexible problem solving. The authors show that a shared visual frame (0\u00b0) maximizes strict imitation, but face-to-face interaction promotes goal emulation: learners are more likely to depart from the model\u2019s exact moves, discover novel solutions, and still achieve the target outcome more efficiently. Children and adults both learn, but adults are more faithful imitators while children are relatively more innovative. The punchline is that the social affordances of face-to-face interaction can overcome the geometric disadvantages of a third-person viewpoint, suggesting that perspective-taking, shared attention, and subtle nonverbal cues matter deeply for how information travels between minds.",
+      "whyItMatters": "This paper is a clean experimental demonstration that the format of interaction shapes not just how much we learn, but what kind of learning dominates: rigid copying vs flexible, goal-directed understanding. AI companionship, especially in text-only form, narrows the channel to something closer to a tidy 0\u00b0 \u201cinstruction manual\u201d without the messy, embodied reciprocity of face-to-face learning. If rich, frictionful co-presence helps people internalize others\u2019 goals and innovate on top of what they see, then a shift toward low-friction, disembodied AI partners may bias us toward a thinner kind of social learning: efficient imitation of suggestions, with fewer chances to wrestle with another human\u2019s perspective in real time and build the deeper, shared mental frames that Ransom et al. highlight.\n\n"
+    }
+  }
+};
@@ -0,0 +1,711 @@
+// Generated by `readings parse --split-bodies`; do not edit.
+import type { ReadingBody, ReadingGroup, ReadingSummary } from "../readings";
+
+export const readingGroups: ReadingGroup[] = [
+  {
+    slug: "foundations",
+    title: "Foundations of Social Friction",
+    subtitle: "Face-to-Face Interaction & Social Physics",
+    longDescription: "Core theories establishing why friction, irreversibility, and risk are essential features of human sociality, not bugs to be removed.",
+    themeTags: ["Sociology", "Interaction", "Face-work"]
+  },
+  {
+    slug: "neural-plasticity",
+    title: "Neural Plasticity & Social Learning",
+    subtitle: "How Experience Wires the Social Brain",
+    longDescription: "Neuroscientific evidence that social circuits require specific, intense, and often challenging inputs to develop and maintain function.",
+    themeTags: ["Neuroscience", "Plasticity", "Development"]
+  },
+  {
+    slug: "variable-reinforcement",
+    title: "Variable Reinforcement",
+    subtitle: "Social Calibration & Reward Systems",
+    longDescription: "Why the brain learns best from unpredictable, mixed-valence feedback (carrots and sticks) rather than constant validation.",
+    themeTags: ["Reinforcement Learning", "Dopamine", "Calibration"]
+  },
+  {
+    slug: "theory-of-mind",
+    title: "Theory of Mind",
+    subtitle: "Communication Tailoring & Mentalizing",
+    longDescription: "How we learn to model other minds through the friction of misunderstanding, repair, and audience design.",
+    themeTags: ["Psychology", "Communication", "Cognition"]
+  },
+  {
+    slug: "ai-architectures",
+    title: "AI Architectures & RLHF",
+    subtitle: "The Engineering of Frictionlessness",
+    longDescription: "Technical analysis of how LLMs and RLHF are optimized for smoothness, deference, and conflict avoidance.",
+    themeTags: ["AI Safety", "RLHF", "LLMs"]
+  },
+  {
+    slug: "ai-companionship",
+    title: "AI Companionship",
+    subtitle: "Current Usage & Dynamics",
+    longDescription: "Empirical data on how people are actually using AI companions and the relational dynamics that emerge.",
+    themeTags: ["HCI", "Companions", "Usage Trends"]
+  },
+  {
+    slug: "ai-risks",
+    title: "Where AI Companionship Goes Wrong",
+    subtitle: "Sycophancy, Dependence & Epistemic Bubbles",
+    longDescription: "Evidence of the downsides: how friction-free interaction leads to lower well-being, sycophancy, and reduced social capacity.",
+    themeTags: ["Risks", "Mental Health", "Sycophancy"]
+  },
+  {
+    slug: "developmental-impact",
+    title: "Developmental Impact",
+    subtitle: "Critical Periods & Adolescence",
+    longDescription: "Why adolescence is a sensitive period for social learning and how AI might interfere with normative development.",
+    themeTags: ["Development", "Adolescence", "Critical Periods"]
+  },
+  {
+    slug: "societal-implications",
+    title: "Societal Implications",
+    subtitle: "Long-term & Macro Effects",
+    longDescription: "Broader consequences for social capital, trust, and economic growth if social friction is systematically removed.",
+    themeTags: ["Economics", "Society", "Policy"]
+  }
+];
+
+export const readingSummaries: ReadingSummary[] = [
+  {
+    "slug": "on-face-work-an-analysis-of",
+    "groupSlug": "foundations",
+    "title": "On face-work: An analysis of ritual elements in social interaction",
+    "authors": "Goffman, E",
+    "year": 1955,
+    "venue": "Psychiatry, 18 (3), 213\u2013231.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1080/00332747.1955.11023008",
+      "url": null
+    },
+    "oneLineSummary": "Establishes irreversibility of social actions and face maintenance as core social friction"
+  },
+  {
+    "slug": "a-review-of-theories-and",
+    "groupSlug": "foundations",
+    "title": "A review of theories and methods in the science of face-to-face social interaction",
+    "authors": "Hadley, L. V., Goldberg, A., & Levinson, S. C",
+    "year": 2022,
+    "venue": "Nature Reviews Psychology, 1, 42\u201354.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1038/s44159-021-00008-w",
+      "url": null
+    },
+    "oneLineSummary": "Comprehensive overview of mechanisms unique to face-to-face interaction"
+  },
+  {
+    "slug": "a-simplest-systematics-for-the",
+    "groupSlug": "foundations",
+    "title": "A simplest systematics for the organization of turn-taking for conversation",
+    "authors": "Sacks, H., Schegloff, E. A., & Jefferson, G",
+    "year": 1974,
+    "venue": "Language, 50 (4), 696\u2013735.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.2307/412243",
+      "url": null
+    },
+    "oneLineSummary": "Turn-taking as fundamental social skill requiring real-time negotiation"
+  },
+  {
+    "slug": "social-friction",
+    "groupSlug": "foundations",
+    "title": "Social friction",
+    "authors": "Ward, L. F",
+    "year": 1892,
+    "venue": "In L. F. Ward, The psychic factors of civilization (pp. 102\u2013115). Boston: Ginn & Company.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1037/12960-017",
+      "url": null
+    },
+    "oneLineSummary": "How social friction leads to social norms"
+  },
+  {
+    "slug": "the-emergence-of-social-norms",
+    "groupSlug": "foundations",
+    "title": "The Emergence of Social Norms and Conventions",
+    "authors": "Hawkins, R. X. D., Goodman, N. D., & Goldstone, R. L",
+    "year": 2019,
+    "venue": "Trends in Cognitive Sciences, 23(2), 158\u2013169.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1016/j.tics.2018.11.003",
+      "url": null
+    },
+    "oneLineSummary": "How social friction leads to social norms"
+  },
+  {
+    "slug": "face-to-face-learning-enhances-the-social",
+    "groupSlug": "foundations",
+    "title": "Face-to-face learning enhances the social transmission of information",
+    "authors": "Ransom, A., LaGrant, B., Spiteri, A., Kushnir, T., Anderson, A. K., & De Rosa, E",
+    "year": 2022,
+    "venue": "PLOS ONE, 17(2), e0264250.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1371/journal.pone.0264250",
+      "url": null
+    },
+    "oneLineSummary": "Face to face learning leads to richer information transmission"
+  },
+  {
+    "slug": "principles-of-experience-dependent-neural-plasticity",
+    "groupSlug": "neural-plasticity",
+    "title": "Principles of experience-dependent neural plasticity: Implications for rehabilitation after brain damage",
+    "authors": "Kleim, J. A., & Jones, T. A",
+    "year": 2008,
+    "venue": "Journal of Speech, Language, and Hearing Research, 51(1), S225\u2013S239.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1044/1092-4388(2008/018)",
+      "url": null
+    },
+    "oneLineSummary": "\u201cUse it or lose it\u201d principle; need for challenging experiences to drive plasticity"
+  },
+  {
+    "slug": "thumbs-up-or-thumbs-down",
+    "groupSlug": "neural-plasticity",
+    "title": "Thumbs up or thumbs down: Neural processing of social feedback and links to social motivation in adolescent girls",
+    "authors": "Davis, M. M., Modi, H. H., Skymba, H. V., Finnegan, M. K., Haigler, K., Telzer, E. H., & Rudolph, K. D",
+    "year": 2023,
+    "venue": "Social Cognitive and Affective Neuroscience, 18(1), nsac055.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1093/scan/nsac055",
+      "url": null
+    },
+    "oneLineSummary": "Recent evidence of how social feedback drives neural learning"
+  },
+  {
+    "slug": "neuronal-reward-and-decision-signals",
+    "groupSlug": "neural-plasticity",
+    "title": "Neuronal reward and decision signals: From theories to data",
+    "authors": "Schultz, W",
+    "year": 2015,
+    "venue": "Physiological Reviews, 95(3), 853\u2013951.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1152/physrev.00023.2014",
+      "url": null
+    },
+    "oneLineSummary": "Biological basis for why variable reinforcement is necessary for learning"
+  },
+  {
+    "slug": "developmental-differences-in-social-information",
+    "groupSlug": "neural-plasticity",
+    "title": "Developmental differences in social information use under uncertainty: A neurocomputational approach",
+    "authors": "Hofmans, L., van den Bos, W., Li, S.-C., & Crone, E. A",
+    "year": 2025,
+    "venue": "Developmental Cognitive Neuroscience, 75, 101604.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1016/j.dcn.2025.101604",
+      "url": null
+    },
+    "oneLineSummary": "Adolescents integrate social information under uncertainty less precisely than adults"
+  },
+  {
+    "slug": "associations-between-digital-media-use",
+    "groupSlug": "neural-plasticity",
+    "title": "Associations between digital media use and brain surface structural measures in preschool-aged children",
+    "authors": "Hutton, J. S., Dudley, J., DeWitt, T., & Horowitz-Kraus, T",
+    "year": 2022,
+    "venue": "Scientific Reports, 12, 19095.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1038/s41598-022-20922-0",
+      "url": null
+    },
+    "oneLineSummary": "When screen experiences crowd out interactive exchanges, social circuitry thins"
+  },
+  {
+    "slug": "social-learning-theory",
+    "groupSlug": "variable-reinforcement",
+    "title": "Social learning theory",
+    "authors": "Bandura, A",
+    "year": 1977,
+    "venue": "Englewood Cliffs, NJ: Prentice Hall.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://www.asecib.ase.ro/mps/BanduraSocialLearningTheory.pdf"
+    },
+    "oneLineSummary": "Foundational text on vicarious reinforcement and observational learning"
+  },
+  {
+    "slug": "integrating-different-perspectives-on-socialization",
+    "groupSlug": "variable-reinforcement",
+    "title": "Integrating different perspectives on socialization theory and research: A domain-specific approach",
+    "authors": "Grusec, J. E., & Davidov, M",
+    "year": 2010,
+    "venue": "Child Development, 81(3), 687\u2013709.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1111/j.1467-8624.2010.01426.x",
+      "url": null
+    },
+    "oneLineSummary": "Different socialization mechanisms for different developmental domains"
+  },
+  {
+    "slug": "neural-pathways-of-embarrassment-and",
+    "groupSlug": "variable-reinforcement",
+    "title": "Neural pathways of embarrassment and their modulation by social anxiety",
+    "authors": "Krach, S., M\u00fcller-Pinzler, L., Westermann, S., & Paulus, F. M",
+    "year": 2013,
+    "venue": "NeuroImage, 119, 252\u2013261.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1016/j.neuroimage.2015.06.036",
+      "url": null
+    },
+    "oneLineSummary": "How embarrassment serves as social calibration mechanism"
+  },
+  {
+    "slug": "neural-plasticity-of-development-and",
+    "groupSlug": "variable-reinforcement",
+    "title": "Neural plasticity of development and learning",
+    "authors": "Galv\u00e1n, A",
+    "year": 2010,
+    "venue": "Human Brain Mapping, 31(6), 879\u2013890.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1002/hbm.21029",
+      "url": null
+    },
+    "oneLineSummary": "Plasticity, variable reward, necessity of environmental challenges"
+  },
+  {
+    "slug": "by-carrot-or-by-stick",
+    "groupSlug": "variable-reinforcement",
+    "title": "By carrot or by stick: Cognitive reinforcement learning in parkinsonism",
+    "authors": "Frank, M. J., Seeberger, L. C., & O\u2019Reilly, R. C",
+    "year": 2004,
+    "venue": "Science, 306(5703), 1940\u20131943.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1126/science.1102941",
+      "url": null
+    },
+    "oneLineSummary": "Positive and negative reinforcement are dissociable and both are needed for learning"
+  },
+  {
+    "slug": "where-do-differences-in-theory",
+    "groupSlug": "theory-of-mind",
+    "title": "Where do differences in theory of mind development come from? An agent-based model of social interaction and theory of mind",
+    "authors": "Yu, C.-L., & Wellman, H. M",
+    "year": 2023,
+    "venue": "Frontiers in Developmental Psychology, 1, 1237033.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.3389/fdpys.2023.1237033",
+      "url": null
+    },
+    "oneLineSummary": "Socialization with others is required for development of theory of mind"
+  },
+  {
+    "slug": "speakers-experiences-and-audience-design",
+    "groupSlug": "theory-of-mind",
+    "title": "Speakers\u2019 experiences and audience design: Knowing when and knowing how to adjust utterances to addressees",
+    "authors": "Horton, W. S., & Gerrig, R. J",
+    "year": 2002,
+    "venue": "Journal of Memory and Language, 47(4), 589\u2013606.",
+    "externalLinks": {
+      "doi": null,
+      "url": null
+    },
+    "oneLineSummary": "Knowing how to dynamically adjust messages increases social operation capacity"
+  },
+  {
+    "slug": "the-impact-of-memory-demands",
+    "groupSlug": "theory-of-mind",
+    "title": "The impact of memory demands on audience design during language production",
+    "authors": "Horton, W. S., & Gerrig, R. J",
+    "year": 2005,
+    "venue": "Cognition, 96(2), 127\u2013142.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1016/j.cognition.2004.07.001",
+      "url": null
+    },
+    "oneLineSummary": "Audience-sensitive communication is an experience-dependent skill"
+  },
+  {
+    "slug": "a-mathematical-theory-of-communication",
+    "groupSlug": "theory-of-mind",
+    "title": "A mathematical theory of communication",
+    "authors": "Shannon, C. E",
+    "year": 1948,
+    "venue": "Bell System Technical Journal, 27(3), 379\u2013423.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1002/j.1538-7305.1948.tb01338.x",
+      "url": null
+    },
+    "oneLineSummary": "Information theory foundations for understanding communication"
+  },
+  {
+    "slug": "entropy-converges-between-dialogue-participants",
+    "groupSlug": "theory-of-mind",
+    "title": "Entropy converges between dialogue participants: Explanations from an information-theoretic perspective",
+    "authors": "Xu, Y., & Reitter, D",
+    "year": 2016,
+    "venue": "In Proceedings of the 54th Annual Meeting of the Association for Computational Linguistics (pp. 537\u2013546).",
+    "externalLinks": {
+      "doi": "https://doi.org/10.18653/v1/P16-1051",
+      "url": null
+    },
+    "oneLineSummary": "Shows entropy decreases for speakers but increases for responders in human dialogue; bot-human chats show flatter entropy gradients"
+  },
+  {
+    "slug": "toward-a-mechanistic-psychology-of",
+    "groupSlug": "theory-of-mind",
+    "title": "Toward a mechanistic psychology of dialogue",
+    "authors": "Pickering, M. J., & Garrod, S",
+    "year": 2004,
+    "venue": "Behavioral and Brain Sciences, 27(2), 169\u2013190.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1017/S0140525X04000056",
+      "url": null
+    },
+    "oneLineSummary": "Interactive alignment as collaborative uncertainty reduction between minds"
+  },
+  {
+    "slug": "language-models-are-few-shot-learners",
+    "groupSlug": "ai-architectures",
+    "title": "Language models are few-shot learners",
+    "authors": "Brown, T., Mann, B., Ryder, N., et al",
+    "year": 2020,
+    "venue": "Advances in Neural Information Processing Systems, 33, 1877\u20131901.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://arxiv.org/pdf/2005.14165"
+    },
+    "oneLineSummary": "How LLMs operate without state or genuine understanding"
+  },
+  {
+    "slug": "towards-understanding-sycophancy-in-language",
+    "groupSlug": "ai-architectures",
+    "title": "Towards understanding sycophancy in language models",
+    "authors": "Sharma, M., Tong, M., Korbak, T., et al",
+    "year": 2024,
+    "venue": "International Conference on Learning Representations (ICLR 2024).",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://arxiv.org/pdf/2310.13548"
+    },
+    "oneLineSummary": "Evidence that RLHF creates agreeable, friction-free responses"
+  },
+  {
+    "slug": "helpful-harmless-honest-sociotechnical-limits",
+    "groupSlug": "ai-architectures",
+    "title": "Helpful, harmless, honest? Sociotechnical limits of AI alignment and safety through Reinforcement Learning from Human Feedback",
+    "authors": "Dahlgren Lindstr\u00f6m, A., Methnani, L., Krause, L., Ericson, P., de Rituerto de Troya, \u00cd. M., Coelho Mollo, D., & Dobbe, R",
+    "year": 2025,
+    "venue": "Ethics and Information Technology, 27(2), Article 28.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1007/s10676-025-09837-2",
+      "url": null
+    },
+    "oneLineSummary": "How RLHF incentivizes user-pleasing over truth"
+  },
+  {
+    "slug": "training-language-models-to-follow",
+    "groupSlug": "ai-architectures",
+    "title": "Training language models to follow instructions with human feedback",
+    "authors": "Ouyang, L., Wu, J., Jiang, X., et al",
+    "year": 2022,
+    "venue": "arXiv.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.48550/arXiv.2203.02155",
+      "url": null
+    },
+    "oneLineSummary": "InstructGPT paper showing technical mechanisms of RLHF"
+  },
+  {
+    "slug": "talk-trust-and-trade-offs-how",
+    "groupSlug": "ai-companionship",
+    "title": "Talk, trust, and trade-offs: How teens experience AI companions",
+    "authors": "Common Sense Media",
+    "year": 2025,
+    "venue": "San Francisco, CA: Common Sense Media.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://www.commonsensemedia.org"
+    },
+    "oneLineSummary": "Current state of youth AI companionship with safety concerns"
+  },
+  {
+    "slug": "the-rise-of-ai-companions",
+    "groupSlug": "ai-companionship",
+    "title": "The rise of AI companions: How human-chatbot relationships influence well-being",
+    "authors": "Zhang, Y., Ruan, Z., Wang, M., Zhang, S., & Hancock, J. T",
+    "year": 2025,
+    "venue": "arXiv preprint arXiv:2506.12605.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://arxiv.org/abs/2506.12605"
+    },
+    "oneLineSummary": "Large-scale study (n=1,131) showing companionship use correlates with lower well-being"
+  },
+  {
+    "slug": "exploring-relationship-development-with-social",
+    "groupSlug": "ai-companionship",
+    "title": "Exploring relationship development with social chatbots: A mixed-method study of Replika",
+    "authors": "Pentina, I., Hancock, T., & Xie, T",
+    "year": 2023,
+    "venue": "Computers in Human Behavior, 140, 107600.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1016/j.chb.2022.107600",
+      "url": null
+    },
+    "oneLineSummary": "How parasocial relationships form and displace human connections"
+  },
+  {
+    "slug": "social-companionship-with-artificial-intelligence",
+    "groupSlug": "ai-companionship",
+    "title": "Social companionship with artificial intelligence: Recent trends and future avenues",
+    "authors": "Chaturvedi, R., Verma, S., Das, R., & Dwivedi, Y. K",
+    "year": 2023,
+    "venue": "Technological Forecasting and Social Change, 191, 122534.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://www.sciencedirect.com/science/article/pii/S0040162523003190"
+    },
+    "oneLineSummary": "Comprehensive review of mechanisms and consequences"
+  },
+  {
+    "slug": "how-ai-and-human-behaviors",
+    "groupSlug": "ai-risks",
+    "title": "How AI and human behaviors shape psychosocial effects of chatbot use: A longitudinal controlled study",
+    "authors": "Pataranutaporn, P., Liu, R., Finn, E., & Maes, P",
+    "year": 2024,
+    "venue": "MIT Media Lab / OpenAI preprint.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://arxiv.org/pdf/2503.17473"
+    },
+    "oneLineSummary": "4-week controlled study (n\u22481,000) showing that extended ChatGPT use\u2014especially in engaging, companion-like modes\u2014is linked to higher loneliness, dependence, and problematic use."
+  },
+  {
+    "slug": "social-sycophancy-llms-reinforce-problematic",
+    "groupSlug": "ai-risks",
+    "title": "Social sycophancy: LLMs reinforce problematic behavior in AITA",
+    "authors": "Cheng, D., Yang, Z., Hurtado, C., et al",
+    "year": 2025,
+    "venue": "arXiv preprint arXiv:2505.13995.",
+    "externalLinks": {
+      "doi": null,
+      "url": null
+    },
+    "oneLineSummary": "Benchmarks how LLMs respond to morally loaded \u201cAm I the Asshole?\u201d (AITA) scenarios and shows that models often side with the user\u2014even when the community judged them to be in the wrong."
+  },
+  {
+    "slug": "understanding-consumer-reactions-to-chatbot",
+    "groupSlug": "ai-risks",
+    "title": "Understanding consumer reactions to chatbot service failures: Evidence from a Wizard-of-Oz experiment",
+    "authors": "Cai, N., Heo, J., & Yan, J",
+    "year": 2025,
+    "venue": "Acta Psychologica, 253, 104707.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1016/j.actpsy.2025.104707",
+      "url": null
+    },
+    "oneLineSummary": "Wizard-of-Oz experiment showing that when a \u201cchatbot\u201d fails in customer service, people react more negatively than when a human agent makes the same mistake\u2014and human agents are better at repairing the relationship."
+  },
+  {
+    "slug": "chatbots-as-social-companions-how",
+    "groupSlug": "ai-risks",
+    "title": "Chatbots as social companions: How people perceive consciousness, human likeness, and social health benefits",
+    "authors": "Guingrich, R. E., & Graziano, M. S. A",
+    "year": 2025,
+    "venue": "In P. Hacker (Ed.), Oxford Intersections: AI in Society. Oxford University Press.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1093/9780198945215.003.0011",
+      "url": null
+    },
+    "oneLineSummary": "Shows that people readily ascribe consciousness and \u201cmind\u201d to chatbots framed as social companions, but perceived benefits for social health don\u2019t straightforwardly translate into better human\u2013human functioning."
+  },
+  {
+    "slug": "chatgpt-giving-relationship-advice",
+    "groupSlug": "ai-risks",
+    "title": "ChatGPT giving relationship advice \u2013 How reliable is it? Proceedings of the International AAAI Conference on Web and Social Media, 18 (1), 610\u2013623",
+    "authors": "Hou, H., Leach, K., & Huang, Y",
+    "year": 2024,
+    "venue": "",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1609/icwsm.v18i1.31338",
+      "url": null
+    },
+    "oneLineSummary": "Analyzes 13,138 Reddit relationship posts and shows that ChatGPT\u2019s judgments of relationship advice often diverge from human consensus and are internally inconsistent across repeated queries."
+  },
+  {
+    "slug": "is-adolescence-a-sensitive-period",
+    "groupSlug": "developmental-impact",
+    "title": "Is adolescence a sensitive period for sociocultural processing? Annual Review of Psychology, 65, 187\u2013207",
+    "authors": "Blakemore, S. J., & Mills, K. L",
+    "year": 2014,
+    "venue": "",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1146/annurevpsych-010213-115202",
+      "url": null
+    },
+    "oneLineSummary": "Adolescence as critical window for social skill development"
+  },
+  {
+    "slug": "navigating-the-social-environment-in",
+    "groupSlug": "developmental-impact",
+    "title": "Navigating the social environment in adolescence: The role of social brain development",
+    "authors": "Andrews, J. L., Ahmed, S. P., & Blakemore, S. J",
+    "year": 2021,
+    "venue": "Biological Psychiatry, 89(2), 109\u2013118.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1016/j.biopsych.2020.09.012",
+      "url": null
+    },
+    "oneLineSummary": "How social brain development requires friction and challenge"
+  },
+  {
+    "slug": "media-exposure-and-preschoolers-social-cognitive",
+    "groupSlug": "developmental-impact",
+    "title": "Media exposure and preschoolers\u2019 social-cognitive development",
+    "authors": "Lenhart, J., Richter, T., Appel, M., & Mar, R. A",
+    "year": 2024,
+    "venue": "British Journal of Developmental Psychology, 42(3), 345\u2013361.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://pubmed.ncbi.nlm.nih.gov/38406975/"
+    },
+    "oneLineSummary": "Screen-based interaction reduces ToM compared to live interaction"
+  },
+  {
+    "slug": "the-influence-of-childrens-emotional",
+    "groupSlug": "developmental-impact",
+    "title": "The influence of children\u2019s emotional comprehension on peer conflict resolution strategies",
+    "authors": "Cao, Y., Wang, N., Lv, X., & Xie, H",
+    "year": 2023,
+    "venue": "Frontiers in Psychology, 14, Article 1124514.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://www.frontiersin.org/journals/psychology/articles/10.3389/fpsyg.2023.1142373/"
+    },
+    "oneLineSummary": "How conflict resolution skills develop through practice with real peers"
+  },
+  {
+    "slug": "social-connectedness-mental-health-and",
+    "groupSlug": "developmental-impact",
+    "title": "Social connectedness, mental health and the adolescent brain",
+    "authors": "Lamblin, M., Murawski, C., Whittle, S., & Fornito, A",
+    "year": 2017,
+    "venue": "Neuroscience & Biobehavioral Reviews, 80, 57\u201368.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1016/j.neubiorev.2017.05.010",
+      "url": null
+    },
+    "oneLineSummary": "Lack of social connectedness produces isolation and worse mental health in adolescents"
+  },
+  {
+    "slug": "interpersonal-apprehensions-impact-on-behavior",
+    "groupSlug": "developmental-impact",
+    "title": "Interpersonal Apprehension\u2019s Impact on Behavior and Performance in High-Stakes Scenarios",
+    "authors": "Shrivastava, A",
+    "year": 2025,
+    "venue": "Business and Professional Communication Quarterly.",
+    "externalLinks": {
+      "doi": "https://doi.org/10.1177/23294906251322889",
+      "url": null
+    },
+    "oneLineSummary": "Increased uncertainty around others\u2019 reactions leads to less social behavior"
+  },
+  {
+    "slug": "ftc-launches-inquiry-into-ai",
+    "groupSlug": "societal-implications",
+    "title": "FTC launches inquiry into AI chatbots acting as companions",
+    "authors": "Federal Trade Commission",
+    "year": 2025,
+    "venue": "FTC 6(b) Order. Washington, DC: Federal Trade Commission.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://www.ftc.gov/news-events/news/press-releases/2025/09/ftc-launches-inquiry-ai-chatbots-acting-companions"
+    },
+    "oneLineSummary": "Regulatory concerns about child safety and deceptive design"
+  },
+  {
+    "slug": "a-positive-feedback-loop-social",
+    "groupSlug": "societal-implications",
+    "title": "A positive feedback loop: Social competence begets more social experience and vice versa",
+    "authors": "Taborsky, B",
+    "year": 2021,
+    "venue": "Ethology, 127(10), 774\u2013789.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://www.behav.iee.unibe.ch/unibe/portal/"
+    },
+    "oneLineSummary": "How lack of social skills creates an isolation spiral"
+  },
+  {
+    "slug": "social-capital-and-economic-growth",
+    "groupSlug": "societal-implications",
+    "title": "Social capital and economic growth: A meta-analysis",
+    "authors": "Xue, X",
+    "year": 2025,
+    "venue": "Journal of Economic Surveys, 39(4), 1395\u20131432.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://research.tilburguniversity.edu/en/publications/social-capital-and-economic-growth-a-meta-analysis"
+    },
+    "oneLineSummary": "Economic consequences of declining social capital are real but heterogeneous"
+  },
+  {
+    "slug": "preliminary-report-on-chatbot-iatrogenic",
+    "groupSlug": "societal-implications",
+    "title": "Preliminary report on chatbot iatrogenic dangers",
+    "authors": "Psychiatric Times",
+    "year": 2025,
+    "venue": "Psychiatric Times, 42(3), 18\u201322.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://www.psychiatrictimes.com/view/preliminary-report-on-chatbot-iatrogenic-dangers"
+    },
+    "oneLineSummary": "Clinical warnings that AI can worsen delusions and crisis states in vulnerable users"
+  },
+  {
+    "slug": "social-capital-government-expenditures-and",
+    "groupSlug": "societal-implications",
+    "title": "Social capital, government expenditures, and growth",
+    "authors": "Ponzetto, G. A., & Troiano, U",
+    "year": 2025,
+    "venue": "Journal of the European Economic Association, 23(2), 632\u2013681.",
+    "externalLinks": {
+      "doi": null,
+      "url": "https://crei.cat/wp-content/uploads/2025/04/SCGE.pdf"
+    },
+    "oneLineSummary": "Formal model of cascading economic costs from social skill and trust decline"
+  }
+];
+
+const bodyLoaders: Record<string, () => Promise<{ readingBodies: Record<string, ReadingBody> }>> = {
+  "foundations": () => import("./foundations"),
+  "neural-plasticity": () => import("./neural-plasticity"),
+  "variable-reinforcement": () => import("./variable-reinforcement"),
+  "theory-of-mind": () => import("./theory-of-mind"),
+  "ai-architectures": () => import("./ai-architectures"),
+  "ai-companionship": () => import("./ai-companionship"),
+  "ai-risks": () => import("./ai-risks"),
+  "developmental-impact": () => import("./developmental-impact"),
+  "societal-implications": () => import("./societal-implications"),
+};
+
+// Helper functions for lookups used across the app
+export function getGroup(slug: string): ReadingGroup | undefined {
+  return readingGroups.find((g) => g.slug === slug);
+}
+
+export function getReadingsByGroup(groupSlug: string): ReadingSummary[] {
+  return readingSummaries.filter((r) => r.groupSlug === groupSlug);
+}
+
+export function getReadingSummary(groupSlug: string, readingSlug: string): ReadingSummary | undefined {
+  return readingSummaries.find((r) => r.groupSlug === groupSlug && r.slug === readingSlug);
+}
+
+export function getAllTags(): string[] {
+  const tagSet = new Set<string>();
+  readingGroups.forEach((g) => {
+    g.themeTags.forEach((tag) => tagSet.add(tag));
+  });
+  return Array.from(tagSet).sort();
+}
+
+// Loads the citation and discussion text for one reading; each group's bodies
+// are a separate chunk, fetched on first use.
+export async function loadReadingBody(groupSlug: string, readingSlug: string): Promise<ReadingBody | undefined> {
+  const load = bodyLoaders[groupSlug];
+  if (!load) return undefined;
+  const { readingBodies } = await load();
+  return readingBodies[readingSlug];
+}
@@ -0,0 +1,45 @@
+// Generated by `readings parse --split-bodies`; do not edit.
+import type { ReadingBody } from "../readings";
+
+export const readingBodies: Record<string, ReadingBody> = {
+  "principles-of-experience-dependent-neural-plasticity": {
+    "fullCitation": "Kleim, J. A., & Jones, T. A. (2008). Principles of experience-dependent neural plasticity: Implications for rehabilitation after brain damage. Journal of Speech, Language, and Hearing Research, 51(1), S225\u2013S239. https://doi.org/10.1044/1092-4388(2008/018)",
+    "discussion": {
+      "coreIdea": "The paper lays out a set of principles for how experience actually reshapes the brain, and the throughline is pretty simple: plasticity is picky and expensive. Neural systems change in response to demands that are specific, repeated, intense, and meaningful. \u201cUse it or lose it\u201d and \u201cuse it and improve it\u201d capture the basic directional pull, but the authors also emphasize specificity (you get better at what you practice), repetition and intensity (a few half-hearted trials don\u2019t cut it), timing (there are windows when plasticity is more available), salience (the experience has to matter to the organism), and the fact that some new learning can transfer while other new learning can interfere. Rehabilitation that ignores these constraints\u2014too easy, too generic, too sparse\u2014is basically asking the brain to rewire itself without giving it a reason.",
+      "questionAnswered": "The central question is: given what we know about experience-dependent plasticity, what kind of practice actually produces lasting, functional change after brain injury\u2014and what kind doesn\u2019t? The authors\u2019 answer is to synthesize animal and human work into those core principles and then cash them out in concrete rehab guidance. Effective rehabilitation isn\u2019t just \u201cdoing the task a bit\u201d; it must be sufficiently challenging to recruit the damaged systems, targeted to relevant functions, repeated enough to consolidate, and embedded in contexts that feel behaviorally important rather than arbitrary. Half-measures\u2014low-intensity, low-salience drills\u2014can leave latent capacity on the table or, worse, allow compensatory habits to crystallize that actually block recovery of the original function.",
+      "whyItMatters": "For my project, this paper is a bridge between neuroscience and the argument that social friction is not just annoying noise but a training signal. If plasticity is gated by challenge, salience, and repeated engagement, then the \u201chard parts\u201d of social life\u2014awkwardness, conflict, risk of rejection\u2014are exactly what push social circuits to adapt. High-friction interactions are intense, memorable, and behaviorally consequential; they check every box on the plasticity list. AI companionship, by design, smooths that landscape: it reduces stakes, tones down negative feedback, and makes it easy to avoid the very kinds of difficult social experiences that would otherwise drive change. In the final report, I can use Kleim and Jones to argue that a chronically low-friction social diet doesn\u2019t just feel different; it may literally offer weaker input to the mechanisms that tune our social brains."
+    }
+  },
+  "thumbs-up-or-thumbs-down": {
+    "fullCitation": "Davis, M. M., Modi, H. H., Skymba, H. V., Finnegan, M. K., Haigler, K., Telzer, E. H., & Rudolph, K. D. (2023). Thumbs up or thumbs down: Neural processing of social feedback and links to social motivation in adolescent girls. Social Cognitive and Affective Neuroscience, 18(1), nsac055. https://doi.org/10.1093/scan/nsac055",
+    "discussion": {
+      "coreIdea": "The paper uses a fake \u201cpeer evaluation\u201d paradigm with mid-adolescent girls in an fMRI scanner: participants see photos of peers, rate how much they want to interact, and then receive supposedly real thumbs-up, thumbs-down, or neutral feedback. The big takeaway is that social approval and disapproval are not just \u201cfeelings\u201d but strongly patterned neural events. Negative feedback ramps up activity in threat- and social-processing regions (amygdala, mPFC, TPJ), while positive feedback engages both social and reward circuitry (mPFC, vmPFC, ventral striatum) and alters functional connectivity patterns.",
+      "questionAnswered": "The central question is how adolescent brains process social reward versus social threat, and how these neural responses relate to different kinds of social motivation. The authors show that girls who orient toward avoiding negative judgment (performance-avoidance goals) show stronger coupling between amygdala/ventral striatum and social-cognitive regions during feedback, suggesting heightened sensitivity to social evaluation. In contrast, girls who are more focused on gaining positive regard (performance-approach goals) show deactivation in some of those same social-processing regions, consistent with a less hyper-vigilant stance. So it\u2019s not just \u201cmore social feedback = more activation\u201d; the pattern of neural responses tracks the kind of social goals the person brings into the situation.",
+      "whyItMatters": "For my project, this is a clean neural instantiation of social friction as a learning signal. Thumbs-up and thumbs-down literally reconfigure connectivity between reward, threat, and social-cognitive systems, and those changes depend on whether someone is wired to chase approval or dodge embarrassment. In a high-friction peer world, that means social brains are constantly being calibrated by real risk: rejection hurts, approval soothes, and circuits adapt accordingly. AI companions, by contrast, offer a stream of highly predictable, low-stakes social feedback\u2014rarely harsh, often quickly reparative. That may blunt the very error signals (sharp disapproval, real social cost) that tune social motivation and teach adolescents when to lean in, when to change course, and how to tolerate being judged."
+    }
+  },
+  "neuronal-reward-and-decision-signals": {
+    "fullCitation": "Schultz, W. (2015). Neuronal reward and decision signals: From theories to data. Physiological Reviews, 95(3), 853\u2013951. https://doi.org/10.1152/physrev.00023.2014",
+    "discussion": {
+      "coreIdea": "Schultz pulls together decades of work on dopamine neurons and basically argues that they implement a kind of reward prediction error engine in the brain. Dopamine cells don\u2019t just fire for rewards; they fire when rewards are better than expected, quiet down when rewards are worse than expected, and settle at baseline when things match prediction. Crucially, this system is tuned to surprise and variability. Fixed, totally predictable rewards quickly stop driving big dopamine responses. It\u2019s the deviations\u2014the unexpected win or the sudden loss\u2014that actually move the learning machinery.",
+      "questionAnswered": "The core question is how theoretical reinforcement learning ideas (like prediction error from models in AI and economics) map onto real neural activity. Schultz answers by showing that dopamine firing patterns track exactly the quantities those models say matter: changes in expected value, uncertainty, and the difference between what was predicted and what actually happened. He walks through data from conditioning, choice tasks, and probabilistic rewards to show that neurons care about both value and risk, and that learning slows or stalls when feedback becomes too predictable or too noisy to be informative.",
+      "whyItMatters": "For my project, this is the biological backbone for why \u201cfriction\u201d and variability in social feedback are so important. If social approval and disapproval are rewards and punishments, then the brain\u2019s learning systems are most engaged when that feedback is somewhat unpredictable but still meaningful\u2014when you\u2019re not entirely sure how people will react. Human social life naturally creates that variable schedule: sometimes you get praised, sometimes you get ignored, sometimes you get shot down. AI companionship typically does the opposite: it offers highly consistent, buffered responses that avoid sharp negative surprises. That might feel nicer in the moment, but it also means weaker reward prediction errors, and thus weaker updating, in the very circuits that are supposed to learn from social consequences."
+    }
+  },
+  "developmental-differences-in-social-information": {
+    "fullCitation": "Hofmans, L., van den Bos, W., Li, S.-C., & Crone, E. A. (2025). Developmental differences in social information use under uncertainty: A neurocomputational approach. Developmental Cognitive Neuroscience, 75, 101604. https://doi.org/10.1016/j.dcn.2025.101604",
+    "discussion": {
+      "coreIdea": "The study compares how adolescents and adults use peer information when they\u2019re uncertain, using a perceptual \u201cmushroom\u201d task where people make an initial estimate, see a peer\u2019s estimate plus their confidence, and then revise. Behaviorally, both groups look competent: they\u2019re reasonably accurate and do update based on peers. But once you dig into the computational model and the fMRI, a subtler story pops out. Adolescents are less sensitive to changes in their own certainty and in the peer\u2019s reported confidence. Their internal representation of \u201chow sure am I?\u201d and \u201chow sure are they?\u201d is fuzzier, and that fuzziness shows up neurally as weaker tuning to peer confidence and different sensitivity to their own certainty signals.",
+      "questionAnswered": "The central question is how social learning under uncertainty changes from adolescence to adulthood, and whether those changes are best understood as different \u201crules\u201d or as different precision on the same rules. The authors come down on the second option: adolescents and adults share the same basic Bayesian updating architecture, but adolescents have reduced metacognitive precision. They register uncertainty at both personal and social levels, but those precision signals don\u2019t modulate their weighting of social information as sharply as in adults.",
+      "whyItMatters": "For my project, this paper is a nice reminder that social learning hinges not just on the presence of feedback, but on how precisely the brain tracks and uses uncertainty. High-friction human settings constantly force you to read both your own confidence and others\u2019\u2014hesitations, strong claims, shaky advice\u2014and to recalibrate how much weight you give them. AI companions tend to present information with stable, smoothed-out confidence and low social consequence, which may give adolescents fewer chances to practice this kind of fine-grained, uncertainty-sensitive social updating."
+    }
+  },
+  "associations-between-digital-media-use": {
+    "fullCitation": "Hutton, J. S., Dudley, J., DeWitt, T., & Horowitz-Kraus, T. (2022). Associations between digital media use and brain surface structural measures in preschool-aged children. Scientific Reports, 12, 19095. https://doi.org/10.1038/s41598-022-20922-0",
+    "discussion": {
+      "coreIdea": "This paper looks at preschoolers\u2019 screen use and links it to differences in brain structure, especially in regions tied to language, executive function, and social cognition. Parents reported kids\u2019 digital media exposure and home reading environment, and children underwent MRI scans. Higher screen use was associated with thinner cortex and altered surface area in frontal and temporal regions that normally benefit from rich, back-and-forth interaction\u2014conversation, shared reading, pretend play. In contrast, more interactive, language-heavy experiences (like shared reading) were linked to healthier structural profiles in those same areas. The headline isn\u2019t \u201cscreens melt kids\u2019 brains,\u201d but that intensive, passive digital input seems to correlate with less robust development of circuits that are usually sculpted by live, responsive social engagement.",
+      "questionAnswered": "The central question is whether and how the quantity and quality of early digital media use show up in the physical organization of the developing brain. The authors don\u2019t claim causality, but the pattern is suggestive: when more time is spent on solitary or low-interaction screen activities, less time is available for the contingent, face-to-face exchanges that drive specialization in language and social networks. The study\u2019s contribution is to bring structural MRI into that conversation, showing that media habits and cortical morphology are meaningfully correlated even in very young children.",
+      "whyItMatters": "For my project, this paper is an early-life analogue of my broader claim: when frictionful, effortful interaction is displaced by smoother, more passive experiences, the systems that depend on that interaction may literally develop differently. Preschoolers on tablets instead of in messy, dialogic play are getting a \u201cthinner\u201d training signal; so are older kids and adults who increasingly turn to AI companions instead of unpredictable humans. It gives me a concrete, brain-level way to argue that the medium of interaction\u2014screen-based, low-contingency vs live, high-contingency\u2014matters for how social circuitry is built and maintained.\n\n"
+    }
+  }
+};
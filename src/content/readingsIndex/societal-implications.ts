@@ -0,0 +1,45 @@
+// Generated by `readings parse --split-bodies`; do not edit.
+import type { ReadingBody } from "../readings";
+
+export const readingBodies: Record<string, ReadingBody> = {
+  "ftc-launches-inquiry-into-ai": {
+    "fullCitation": "Federal Trade Commission. (2025). FTC launches inquiry into AI chatbots acting as companions. FTC 6(b) Order. Washington, DC: Federal Trade Commission. https://www.ftc.gov/news-events/news/press-releases/2025/09/ftc-launches-inquiry-ai-chatbots-acting-companions",
+    "discussion": {
+      "coreIdea": "The FTC\u2019s September 11, 2025 announcement signals that \u201cAI companions\u201d have crossed a threshold from quirky product category to potential consumer-harm vector worthy of formal investigation. The agency issued 6(b) orders to seven companies offering consumer-facing AI companion products, seeking detailed information about how these systems are designed, tested, and monitored, with special attention to youth use, advertising claims, data practices, and risk mitigation. The message is not subtle: these products may be emotionally sticky in ways that distort minors\u2019 decision-making and wellbeing.",
+      "questionAnswered": "The underlying problem the FTC is probing is whether companies are building relationship-like systems while underinvesting in the safety engineering and disclosure standards that would be expected for products that influence mental health, identity formation, and vulnerable users. The 6(b) structure matters because it\u2019s about information-gathering with teeth\u2014an attempt to map the design incentives, engagement mechanics, and guardrails before the market hardens into a \u201cmove fast, apologize later\u201d norm.",
+      "whyItMatters": "This is a clean policy-level complement to the social-friction thesis. The entire business case for companions leans on low resistance: always-available empathy, minimal judgment, and engagement loops that make the relationship feel effortless. If regulators are worried about deceptive design, it\u2019s partly because \u201cfriction-free affection\u201d can function like a psychological product feature that bypasses the usual parental, educational, and peer moderating forces. The inquiry helps justify a claim that the societal costs may not be limited to individual wellbeing\u2014they may include the quiet re-engineering of how young people learn norms, boundaries, and self-regulation."
+    }
+  },
+  "a-positive-feedback-loop-social": {
+    "fullCitation": "Taborsky, B. (2021). A positive feedback loop: Social competence begets more social experience and vice versa. Ethology, 127(10), 774\u2013789. https://www.behav.iee.unibe.ch/unibe/portal/",
+    "discussion": {
+      "coreIdea": "Taborsky proposes a deceptively simple evolutionary-developmental idea: social competence and social experience can reinforce each other in a positive feedback loop. Individuals who are more socially skilled gain more benefits and incur fewer costs in social encounters, which makes them more likely to seek and sustain further social experience. Over time, that additional experience further sharpens competence. The loop can also run in reverse: low competence makes social encounters costlier and riskier, leading to avoidance, which then deprives the individual of the practice needed to improve.",
+      "questionAnswered": "The paper\u2019s central contribution is reframing \u201csocial ability\u201d as a dynamic system rather than a fixed trait. Social competence emerges from behavioral flexibility and learning in real interactions, including socio-negative encounters that force calibration. This model helps explain why early-life social deprivation can have long-lasting effects and why small differences in initial competence can widen into big gaps across development.",
+      "whyItMatters": "This is a high-value theoretical backbone for my argument. AI companions may offer an appealing escape hatch for people who are already on the wrong side of that loop: if humans feel high-cost, a bot will always be the easier option. But an easier option can accidentally stabilize avoidance. The risk isn\u2019t that AI creates loneliness out of thin air; it\u2019s that it can \u201csweeten the off-ramp\u201d from difficult human practice during the exact periods when competence is still highly plastic. Taborsky gives me evolutionary and systems language for that spiral without needing to claim that any single technology is the sole cause."
+    }
+  },
+  "social-capital-and-economic-growth": {
+    "fullCitation": "Xue, X. (2025). Social capital and economic growth: A meta-analysis. Journal of Economic Surveys, 39(4), 1395\u20131432. https://research.tilburguniversity.edu/en/publications/social-capital-and-economic-growth-a-meta-analysis",
+    "discussion": {
+      "coreIdea": "Xue\u2019s meta-analysis synthesizes a large empirical literature on social capital and growth, pooling hundreds of estimates across dozens of studies. The key headline is heterogeneity: results vary meaningfully by measurement choices, contexts, and model specifications. In the authors\u2019 preferred specification, the overall mean effect of social capital on growth is close to zero and not statistically significant, even though some subsets of the literature show positive associations.",
+      "questionAnswered": "The central question is not \u201cdoes social capital matter?\u201d in a simplistic sense, but \u201cwhat does the total evidence say once we correct for publication bias, methodological differences, and measurement variance?\u201d The answer is cautious: strong claims about a uniform, easily quantifiable growth boost should be treated skeptically, but dismissing social capital as economically irrelevant would also be too blunt. The distribution of findings suggests context-specific pathways rather than a single universal coefficient.",
+      "whyItMatters": "This nuance is useful for the AI-friction thesis because it keeps the economic argument intellectually honest.  I can argue that if AI companionship contributes to downstream erosion of trust, civic participation, or cooperative norms, the macro impacts would likely be uneven\u2014larger in settings where growth depends heavily on institutional quality and collective action. The value of this paper is less about a dramatic headline effect size and more about giving permission to frame the economic risk as plausible, mediated, and variable across societies."
+    }
+  },
+  "preliminary-report-on-chatbot-iatrogenic": {
+    "fullCitation": "Psychiatric Times. (2025). Preliminary report on chatbot iatrogenic dangers. Psychiatric Times, 42(3), 18\u201322. https://www.psychiatrictimes.com/view/preliminary-report-on-chatbot-iatrogenic-dangers",
+    "discussion": {
+      "coreIdea": "This report adds a clinical alarm bell to the broader cultural conversation about AI companionship. It describes emerging concerns that certain users\u2014especially those with existing or latent vulnerabilities\u2014may experience worsening of suicidal ideation, delusional thinking, or unhealthy dependence when a chatbot provides validating, high-intensity engagement without the guardrails and relational accountability of professional care. The term \u201ciatrogenic\u201d is doing important work here: the worry is not just that AI fails to help, but that it can sometimes actively exacerbate symptoms.",
+      "questionAnswered": "The implicit question is how we should interpret early case-like signals in a fast-moving tech ecosystem: are these isolated anecdotes, or early indicators of a scalable risk mechanism? The report leans toward the second interpretation, emphasizing the structural features that could drive harm\u2014sycophantic reinforcement, 24/7 availability, and the user\u2019s tendency to treat the system as a trusted, intimate authority. Even if the evidence base is still developing, it\u2019s a reminder that \u201calways supportive\u201d is not always psychologically safe.",
+      "whyItMatters": "For my project, this is the darkest edge of the friction argument. Human relationships and clinical contexts often include necessary negative feedback, limits, and reality checks. A companion bot that reflexively soothes and affirms can remove those constraints at exactly the wrong time. I can cite this as a boundary condition: reducing social friction may be benign or beneficial for many users, but for a subset, the absence of structured challenge and human oversight is not just a developmental trade-off\u2014it may be an acute safety risk."
+    }
+  },
+  "social-capital-government-expenditures-and": {
+    "fullCitation": "Ponzetto, G. A., & Troiano, U. (2025). Social capital, government expenditures, and growth. Journal of the European Economic Association, 23(2), 632\u2013681. https://crei.cat/wp-content/uploads/2025/04/SCGE.pdf",
+    "discussion": {
+      "coreIdea": "Ponzetto and Troiano argue that social capital boosts growth partly by improving political incentives and the composition of public spending\u2014especially investment in human capital like education. They combine a theoretical growth model with empirical evidence across countries and U.S. states showing that higher social capital is associated with higher public education spending shares. The broad claim is that trust and civic norms don\u2019t just feel good; they change how well governments allocate resources.",
+      "questionAnswered": "The paper\u2019s core question is how to pin down a causal economic mechanism linking social capital to long-run growth, rather than treating the relationship as a hand-wavy correlation. Their answer is a political-economy channel: where social capital is higher, voters and institutions are better able to reward competence and punish rent-seeking, which shifts spending toward productive investment. This creates a reinforcing system where social capital and growth co-evolve.",
+      "whyItMatters": "This gives me a strong macro-level \u201cwhy it matters\u201d layer. If AI-mediated social life gradually weakens real-world norms of reciprocity, trust, and accountability\u2014especially among cohorts growing up with companions as a normal relational option\u2014the risk isn\u2019t just personal loneliness. The risk is a slow erosion of the social fabric that supports institutional performance and human capital investment. I don\u2019t need to claim we\u2019re already seeing this; the paper lets me frame it as a plausible long-horizon pathway that makes the social-friction question economically consequential rather than just psychologically interesting."
+    }
+  }
+};
@@ -0,0 +1,53 @@
+// Generated by `readings parse --split-bodies`; do not edit.
+import type { ReadingBody } from "../readings";
+
+export const readingBodies: Record<string, ReadingBody> = {
+  "where-do-differences-in-theory": {
+    "fullCitation": "Yu, C.-L., & Wellman, H. M. (2023). Where do differences in theory of mind development come from? An agent-based model of social interaction and theory of mind. Frontiers in Developmental Psychology, 1, 1237033. https://doi.org/10.3389/fdpys.2023.1237033",
+    "discussion": {
+      "coreIdea": "Yu and Wellman build a little simulated society and let \u201cchildren\u201d with simple cognitive rules grow up in it to see how theory of mind (ToM) develops. The agents vary in how often they interact, with whom, and under what conversational conditions. Out of these ingredients, the model reproduces familiar findings: more frequent, diverse, and mental-state-rich interactions lead to earlier and stronger ToM, while sparse or impoverished interaction slows or blunts it. Differences in social experience alone can generate group-level gaps that look like \u201cindividual differences in ToM ability.\u201d",
+      "questionAnswered": "The driving question is whether we need to posit big built-in cognitive differences to explain why some kids pass ToM tasks earlier than others, or whether realistic variation in social experience could already account for a lot. The simulations lean heavily toward the latter: by tweaking interaction frequency, partner types, and how often beliefs and desires are talked about, the model produces developmental trajectories that mirror cross-cultural and within-culture differences seen in real children. Social interaction quantity and quality act like dials on the ToM timeline.",
+      "whyItMatters": "For my project, this is a direct computational proof-of-concept that the social environment is not just background noise\u2014it\u2019s part of the causal story for how reflective social understanding comes online. A world where more \u201cinteraction\u201d happens with AI agents that don\u2019t truly have minds, don\u2019t make genuine mistakes, and rarely force you to grapple with conflicting perspectives is a world that changes those dials. Even if total \u201cconversation time\u201d goes up, the specific kind of social practice that sharpens ToM\u2014negotiating misunderstandings, inferring opaque motives, dealing with partial information\u2014may go down. That\u2019s exactly the kind of subtle developmental shift I want to flag in the final report."
+    }
+  },
+  "speakers-experiences-and-audience-design": {
+    "fullCitation": "Horton, W. S., & Gerrig, R. J. (2002). Speakers\u2019 experiences and audience design: Knowing when and knowing how to adjust utterances to addressees. Journal of Memory and Language, 47(4), 589\u2013606.",
+    "discussion": {
+      "coreIdea": "Horton and Gerrig look at how people learn to tailor what they say to particular listeners\u2014what they call \u201caudience design.\u201d In a referential communication task, speakers first build up a history with a partner (using certain labels, shortcuts, or descriptions), then either continue with that partner or switch to a new one. Over repeated exchanges, they show that speakers don\u2019t instantly, perfectly customize their speech; instead, they gradually learn when special audience design is needed and how to override their own pull toward brevity and habitual phrasing.",
+      "questionAnswered": "Underneath, they\u2019re trying to separate two pieces: recognizing when a situation demands audience design, and knowing how to actually implement it. Experience with specific partners and specific feedback (e.g., confusion, clarification requests) sharpens both. Speakers become more likely to notice that a newcomer won\u2019t understand an old in-joke label, and more willing to spend extra words to make themselves clear. Audience design emerges as an experience-dependent skill, not a hardwired default.",
+      "whyItMatters": "This maps cleanly onto my interest in \u201csocial operation capacity.\u201d In real life, learning to talk differently to your roommate, your professor, your younger cousin, and your boss takes years of practice navigating confusion, misfires, and tiny social penalties for being unclear. AI companions typically behave as if they always understand, adapt heavily on their side, and rarely force you to repair breakdowns. That\u2019s great for comfort, but it means fewer occasions where you have to notice \u201coh, that didn\u2019t land\u201d and adjust your utterance design. Over time, a communication style that\u2019s well-calibrated for bots may be under-calibrated for humans."
+    }
+  },
+  "the-impact-of-memory-demands": {
+    "fullCitation": "Horton, W. S., & Gerrig, R. J. (2005). The impact of memory demands on audience design during language production. Cognition, 96(2), 127\u2013142. https://doi.org/10.1016/j.cognition.2004.07.001",
+    "discussion": {
+      "coreIdea": "Here Horton and Gerrig push the audience design story further by asking what limits it. They argue that a lot of audience design is essentially memory-based: you adjust for a listener when partner-specific memories (what you\u2019ve said together before, how they reacted) are accessible at the right moment. In their experiments, speakers describe items for two different partners under varying memory loads. When working memory is taxed, their utterances show less partner-specific tailoring, even though they\u2019re perfectly capable of being \u201cnice\u201d communicators in principle.",
+      "questionAnswered": "The key move is to treat audience design not as a special, always-on \u201csocial module,\u201d but as something that rides on ordinary memory processes, with all their constraints. If the right traces are active and easy to retrieve, you\u2019ll naturally produce partner-tuned language; if those traces are buried under other demands, you default to more generic, self-centered expressions. Audience-sensitive communication is thus fragile and contingent, especially under time pressure.",
+      "whyItMatters": "For the AI friction story, this is a useful reminder that real-world social skill is bottlenecked by cognitive load. In messy human settings\u2014group conversations, noisy environments, multitasking\u2014you\u2019re constantly juggling memory demands while trying to track who knows what and how to speak to them. That\u2019s where audience design is truly tested and strengthened. AI chats are typically slow, one-on-one, and forgiving: you can scroll back, rephrase, and rarely pay a price for lapses in tailoring. If more of our conversational practice shifts into those low-load conditions, we may get less practice at the harder version of audience design that actually matters in live, high-friction human contexts."
+    }
+  },
+  "a-mathematical-theory-of-communication": {
+    "fullCitation": "Shannon, C. E. (1948). A mathematical theory of communication. Bell System Technical Journal, 27(3), 379\u2013423. https://doi.org/10.1002/j.1538-7305.1948.tb01338.x",
+    "discussion": {
+      "coreIdea": "Shannon turns \u201cinformation\u201d from a vague idea into something you can measure and optimize. He models communication as a process: an information source generates a message, a transmitter encodes it into a signal, the signal goes through a noisy channel, and a receiver decodes it at the other end. The key insights are entropy (how unpredictable a source is), channel capacity (how much information per unit time a channel can reliably carry), and coding theorems showing that you can approach that capacity by using clever, redundant codes that correct for noise.",
+      "questionAnswered": "The driving question is: given a noisy channel, what is the maximum rate at which we can transmit information with arbitrarily low error, and what determines that rate? Shannon answers by deriving a formal link between the statistics of the source, the noise in the channel, and the achievable transmission rate. He\u2019s deliberately agnostic about meaning: the math cares about probabilities, not semantics. Messages with more uncertainty (higher entropy) contain more information; redundancy can be added to fight noise without changing the underlying meaning.",
+      "whyItMatters": "For the AI-and-social-friction project, this gives a very clean lens on \u201cmessy human communication\u201d versus highly structured AI interaction. Human talk is full of noise\u2014mishearings, ambiguous cues, half-finished sentences\u2014but also rich, adaptive redundancy: tone of voice, gesture, shared context. Social skill is partly the art of designing your \u201ccode\u201d on the fly to get reliable understanding through a very lossy channel. AI companions radically change the channel properties: text or ultra-clear audio, perfect memory, instant repetition, no genuine penalties for failed transmission. That makes communication feel more efficient but also less training-heavy. If the channel is too clean and forgiving, we may under-exercise the very abilities that evolved to manage entropy, noise, and redundancy in real social settings."
+    }
+  },
+  "entropy-converges-between-dialogue-participants": {
+    "fullCitation": "Xu, Y., & Reitter, D. (2016). Entropy converges between dialogue participants: Explanations from an information-theoretic perspective. In Proceedings of the 54th Annual Meeting of the Association for Computational Linguistics (pp. 537\u2013546). https://doi.org/10.18653/v1/P16-1051",
+    "discussion": {
+      "coreIdea": "Xu and Reitter track how \u201cinformation density\u201d (entropy per word) shifts within human dialogues. Looking at spoken corpora, they find a striking pattern across topic episodes: the person who initiates a topic tends to start off relatively unpredictable and then becomes more predictable over time (entropy decreases), while the responder starts simpler and ramps up in complexity (entropy increases). As the conversation unfolds, their entropy levels locally converge. The interpretation is that speakers gradually elaborate, clarify, and narrow down what they\u2019re saying as common ground builds, while responders progressively contribute more informative, less predictable content as they get oriented.",
+      "questionAnswered": "The authors explain this through grounding and interactive alignment: both parties are collaboratively managing uncertainty. Early on, the initiator is \u201cprobing\u201d the space with higher-entropy utterances; the responder is playing catch-up. As mutual understanding grows, roles flip: the initiator leans on shared context and becomes more redundant, while the responder can afford to say more surprising, contentful things. Follow-up work suggests that bot\u2013human chats don\u2019t show this clean crossing pattern: entropy gradients are flatter, with less systematic convergence.",
+      "whyItMatters": "For my project, this gives a beautifully quantitative picture of friction as a dynamic property of dialogue. Real human conversations involve asymmetries and role shifts in who carries uncertainty and when, and the process of resolving that asymmetry is part of the learning signal. If AI companions hold a lot of the work on their side\u2014keeping entropy smooth, filling gaps, never really \u201cfumbling\u201d a topic\u2014the user may experience fewer of those moments where they have to either ramp up unpredictability or simplify strategically to repair grounding. That\u2019s another way in which AI talk can feel like conversation while quietly stripping out some of the underlying training dynamics."
+    }
+  },
+  "toward-a-mechanistic-psychology-of": {
+    "fullCitation": "Pickering, M. J., & Garrod, S. (2004). Toward a mechanistic psychology of dialogue. Behavioral and Brain Sciences, 27(2), 169\u2013190. https://doi.org/10.1017/S0140525X04000056",
+    "discussion": {
+      "coreIdea": "Pickering and Garrod argue that dialogue isn\u2019t just two people taking turns producing monologues; it\u2019s a tightly coupled system in which interlocutors\u2019 representations become aligned at multiple levels\u2014phonology, syntax, semantics, situation models. Through automatic priming and repetition, people gradually converge on shared forms and structures, which makes both production and comprehension easier and reduces the cognitive load of keeping up. This \u201cinteractive alignment\u201d is their mechanistic answer to how dialogue can be so fast, fluid, and efficient despite all the ambiguity and noise in language.",
+      "questionAnswered": "They push back against accounts that treat dialogue mainly in terms of high-level goals and reasoning about others\u2019 mental states. Those things matter, but underneath is a lot of low-level alignment machinery: you pick up your partner\u2019s words, constructions, even rhythms, and that unconscious mimicry shrinks the search space of possible interpretations. Successful conversation, on this view, is essentially collaborative uncertainty reduction. Minds don\u2019t just share \u201ccommon ground\u201d as a static store; they dynamically synchronize their internal states through repeated, mutually constraining signals.",
+      "whyItMatters": "Folded into my project, this makes AI companionship look like an odd kind of alignment partner. Modern chat models are extremely good at aligning to you\u2014your style, preferences, and topics\u2014because that\u2019s literally what they\u2019re optimized to do. But the alignment is mostly one-way: they meet you where you are, rather than two noisy, limited humans struggling toward mutual alignment. That asymmetry means less practice at the genuinely hard part of dialogue: tuning yourself to someone who is not already optimized for you, whose processing limits, habits, and misunderstandings you have to adapt to. In a world with more AI talk and less human talk, people may feel more \u201caligned\u201d in the moment, while actually getting weaker at the very coordination processes this paper tries to explain.\n\n"
+    }
+  }
+};
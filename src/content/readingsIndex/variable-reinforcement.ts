@@ -0,0 +1,45 @@
+// Generated by `readings parse --split-bodies`; do not edit.
+import type { ReadingBody } from "../readings";
+
+export const readingBodies: Record<string, ReadingBody> = {
+  "social-learning-theory": {
+    "fullCitation": "Bandura, A. (1977). Social learning theory. Englewood Cliffs, NJ: Prentice Hall. https://www.asecib.ase.ro/mps/BanduraSocialLearningTheory.pdf",
+    "discussion": {
+      "coreIdea": "Bandura\u2019s big move is to show that people don\u2019t just learn by being directly rewarded or punished; they learn by watching what happens to other people. Observational learning, modeling, and \u201cvicarious reinforcement\u201d let us internalize rules for behavior without personally touching every hot stove. The learner is not a passive sponge: attention, memory, motor ability, and motivation all matter, and behavior emerges from a triad of person, behavior, and environment influencing one another (reciprocal determinism), rather than a simple stimulus\u2013response chain.",
+      "questionAnswered": "The central question is how to explain the acquisition of complex, flexible behavior in real life, where we rarely get neat, repeated conditioning trials. Bandura answers by breaking observational learning into processes: we selectively attend to models, encode and rehearse their behavior symbolically, and then decide whether to perform it based on expected outcomes. Reinforcement still matters, but mostly as information and anticipation (what tends to get rewarded around here?), not just as brute force shaping.",
+      "whyItMatters": "For my project, Bandura gives a conceptual backbone for thinking of social friction as information-rich vicarious feedback. Watching someone else get praised, ignored, or punished in a group is a huge part of how we learn \u201cwhat flies\u201d without paying every cost ourselves. AI companionship shifts that ecology: the main \u201cmodel\u201d is an agent tuned to be endlessly patient, affirming, and low-cost to approach. That flattens the range of observed consequences and distorts the model space: you don\u2019t see people getting shut down, embarrassed, or rejected for real. In the final report, this book will anchor the claim that thinning out vicarious exposure to genuine social consequences changes the learning diet in a deep way, even if the user feels like they\u2019re still \u201cinteracting all the time.\u201d"
+    }
+  },
+  "integrating-different-perspectives-on-socialization": {
+    "fullCitation": "Grusec, J. E., & Davidov, M. (2010). Integrating different perspectives on socialization theory and research: A domain-specific approach. Child Development, 81(3), 687\u2013709. https://doi.org/10.1111/j.1467-8624.2010.01426.x",
+    "discussion": {
+      "coreIdea": "Grusec and Davidov argue that \u201csocialization\u201d is not one giant process but a set of distinct domains, each with its own logic. They outline areas like protection, reciprocity, group participation, guided learning, and control, and show that different parent\u2013child interactions and mechanisms matter in each: warmth and comfort in the protection domain, mutual responsiveness for reciprocity, power assertion and rules for control, etc. This helps explain why findings in the literature often look contradictory\u2014people have been mixing domains without realizing it.",
+      "questionAnswered": "The central question is how to integrate competing socialization theories and messy data into a coherent framework. Their answer is to go domain-specific: ask first \u201cwhat kind of social goal is at stake here?\u201d and only then talk about mechanisms. A style that\u2019s optimal in one domain (say, firm discipline in the control domain) may be harmful or irrelevant in another (like guided learning), so we shouldn\u2019t expect a single parenting style or mechanism to generalize across everything.",
+      "whyItMatters": "For my project, this is a reminder that \u201csocial learning\u201d via AI is not monolithic. AI companions might be decent in some domains (guided learning, maybe bits of moral reasoning talk) but almost nonexistent in others (real power conflicts, group norms, reciprocity with actual costs). The friction profile is different in each domain: discipline and control are naturally high-friction, while guided learning can be relatively gentle. If more developmental time shifts into AI-mediated, low-friction channels, it might selectively thin out practice in the harsher domains\u2014exactly the ones that historically taught kids to tolerate conflict, accept limits, and align with group expectations. That gives me a more precise way to argue that we\u2019re not just reducing \u201csocial friction\u201d in general, we\u2019re redistributing it across domains."
+    }
+  },
+  "neural-pathways-of-embarrassment-and": {
+    "fullCitation": "Krach, S., M\u00fcller-Pinzler, L., Westermann, S., & Paulus, F. M. (2013). Neural pathways of embarrassment and their modulation by social anxiety. NeuroImage, 119, 252\u2013261. https://doi.org/10.1016/j.neuroimage.2015.06.036",
+    "discussion": {
+      "coreIdea": "This paper treats embarrassment as a full-body, full-brain social event, not just \u201cfeeling awkward.\u201d Using a group-based fMRI setup where participants experience public success and failure, they show that embarrassment recruits two key systems: a mentalizing network (thinking about how others see you) and an arousal/affect network (insula, ACC, amygdala). These streams converge in the ventral anterior insula and amygdala, which seem to integrate \u201cwhat are they thinking about me?\u201d with \u201chow bad does this feel?\u201d Social anxiety amplifies parts of this response, suggesting that anxious people process public evaluation as especially threatening.",
+      "questionAnswered": "The central question is what neural circuits underlie embarrassment, and how social anxiety tweaks them. The answer is a pathway model: first you simulate others\u2019 evaluations, then that representation is fed into affective systems that generate the hot, aversive feeling. Social anxiety doesn\u2019t create a different emotion; it modulates sensitivity and gain within this shared circuitry, leading to stronger or more easily triggered embarrassment responses.",
+      "whyItMatters": "For my project, this is almost a picture of social friction written onto the brain. Embarrassment is a calibration signal: it punishes norm violations and sloppy self-presentation by making \u201cbeing seen\u201d feel painful, which in turn shapes future behavior. In human groups, you learn where the lines are partly by bumping into them and blushing. AI companions rarely induce genuine embarrassment: they don\u2019t titter, fall silent, or look away; their \u201caudience\u201d is forgiving and resettable. That means fewer strong calibration hits to this circuitry. Over time, that could leave people less practiced at reading where social lines actually lie, and less tolerant of the discomfort that comes with being realistically evaluated by others."
+    }
+  },
+  "neural-plasticity-of-development-and": {
+    "fullCitation": "Galv\u00e1n, A. (2010). Neural plasticity of development and learning. Human Brain Mapping, 31(6), 879\u2013890. https://doi.org/10.1002/hbm.21029",
+    "discussion": {
+      "coreIdea": "Galv\u00e1n\u2019s review argues that development and learning are not separate beasts: both reflect experience-dependent plasticity, with some periods (like adolescence) offering especially high sensitivity to environmental input. Structural and functional changes in cortical and subcortical systems continue well into the teens and beyond, shaped by patterns of reward, challenge, and practice. The brain remains plastic across the lifespan, but not uniformly; there are windows where particular circuits are more \u201ctunable,\u201d and the kind of input they get matters.",
+      "questionAnswered": "The central question is how to relate developmental changes (maturation of systems like the striatum and prefrontal cortex) to learning-related changes driven by experience. The answer is a continuum view: development sets the stage by changing the architecture and baseline excitability of circuits, and learning sculpts within that architecture via repeated, often reward-mediated experience. Adolescence, for instance, is described as a period of heightened reward sensitivity and ongoing prefrontal maturation, making it a time when rewarding, challenging experiences can have outsized effects on behavior and connectivity.",
+      "whyItMatters": "For my project, this reinforces the idea that \u201cwhen\u201d and \u201chow\u201d you encounter social friction matters. A world where adolescents increasingly turn to smooth, low-risk AI interactions is a world that feeds their hyper-plastic reward and social circuits a very different diet: predictable approval, minimal real-world consequence, lots of control over exposure. That may feel safer, but it also underutilizes a window where grappling with messy peers\u2014rejections, miscommunications, status struggles\u2014would normally drive powerful, long-lasting tuning of social brain networks. Galv\u00e1n gives me the developmental neuroscience frame to argue that the timing and difficulty of social experience can\u2019t be treated as an afterthought."
+    }
+  },
+  "by-carrot-or-by-stick": {
+    "fullCitation": "Frank, M. J., Seeberger, L. C., & O\u2019Reilly, R. C. (2004). By carrot or by stick: Cognitive reinforcement learning in parkinsonism. Science, 306(5703), 1940\u20131943. https://doi.org/10.1126/science.1102941",
+    "discussion": {
+      "coreIdea": "Frank and colleagues use Parkinson\u2019s disease and dopamine medication as a kind of natural experiment on the brain\u2019s learning systems. Patients with low dopamine (off meds) are relatively better at learning to avoid options that lead to bad outcomes (\u201cstick\u201d) but worse at learning to repeat options that lead to rewards (\u201ccarrot\u201d). When they take dopamine medication, the pattern flips: they get better at reward learning and worse at avoiding punishers. This double dissociation suggests that positive and negative reinforcement depend on partly separable dopamine-based mechanisms in basal ganglia circuits.",
+      "questionAnswered": "The central question is whether learning from rewards and learning from punishments are implemented by the same neural process or by partially distinct ones. The authors answer by combining behavioral tasks with a biologically grounded neural network model. The data fit a picture where \u201cGo\u201d pathways (facilitating actions) are strengthened by positive prediction errors, while \u201cNoGo\u201d pathways (suppressing actions) are strengthened by negative ones. Changing dopamine levels shifts the balance between these systems, and thus the balance between carrot- and stick-driven learning.",
+      "whyItMatters": "For my project, this is a strong argument that both pleasant and unpleasant social outcomes are functionally necessary. If AI companions are engineered to minimize negative affect\u2014rarely giving harsh criticism, never truly withdrawing, smoothing over conflict\u2014then they are effectively starving the NoGo system of practice. You still get \u201ccarrot\u201d signals (validation, praise, agreeable responses), but far fewer sharp \u201cdon\u2019t do that\u201d hits. In real social groups, those sticks are a key part of how we learn boundaries, self-control, and norm compliance. In the final report, this paper will help me argue that an AI-mediated, mostly-carrot social environment doesn\u2019t just feel different; it may systematically bias which reinforcement pathways we exercise.\n\n"
+    }
+  }
+};
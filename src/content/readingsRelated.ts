@@ -0,0 +1,234 @@
+// Generated by `readings parse --related`; do not edit.
+// Maps `${groupSlug}/${slug}` to the most similar readings (TF-IDF cosine).
+export const relatedReadings: Record<string, string[]> = {
+  "foundations/on-face-work-an-analysis-of": [
+    "foundations/the-emergence-of-social-norms",
+    "foundations/a-review-of-theories-and",
+    "foundations/a-simplest-systematics-for-the"
+  ],
+  "foundations/a-review-of-theories-and": [
+    "foundations/the-emergence-of-social-norms",
+    "foundations/a-simplest-systematics-for-the",
+    "foundations/on-face-work-an-analysis-of"
+  ],
+  "foundations/a-simplest-systematics-for-the": [
+    "foundations/a-review-of-theories-and",
+    "foundations/on-face-work-an-analysis-of",
+    "ai-architectures/language-models-are-few-shot-learners"
+  ],
+  "foundations/social-friction": [
+    "foundations/on-face-work-an-analysis-of",
+    "variable-reinforcement/integrating-different-perspectives-on-socialization",
+    "foundations/a-simplest-systematics-for-the"
+  ],
+  "foundations/the-emergence-of-social-norms": [
+    "foundations/a-review-of-theories-and",
+    "foundations/on-face-work-an-analysis-of",
+    "theory-of-mind/toward-a-mechanistic-psychology-of"
+  ],
+  "foundations/face-to-face-learning-enhances-the-social": [
+    "foundations/a-review-of-theories-and",
+    "foundations/the-emergence-of-social-norms",
+    "variable-reinforcement/social-learning-theory"
+  ],
+  "neural-plasticity/principles-of-experience-dependent-neural-plasticity": [
+    "variable-reinforcement/neural-plasticity-of-development-and",
+    "neural-plasticity/neuronal-reward-and-decision-signals",
+    "developmental-impact/navigating-the-social-environment-in"
+  ],
+  "neural-plasticity/thumbs-up-or-thumbs-down": [
+    "neural-plasticity/neuronal-reward-and-decision-signals",
+    "developmental-impact/is-adolescence-a-sensitive-period",
+    "variable-reinforcement/neural-plasticity-of-development-and"
+  ],
+  "neural-plasticity/neuronal-reward-and-decision-signals": [
+    "variable-reinforcement/by-carrot-or-by-stick",
+    "foundations/the-emergence-of-social-norms",
+    "neural-plasticity/thumbs-up-or-thumbs-down"
+  ],
+  "neural-plasticity/developmental-differences-in-social-information": [
+    "developmental-impact/is-adolescence-a-sensitive-period",
+    "foundations/the-emergence-of-social-norms",
+    "neural-plasticity/thumbs-up-or-thumbs-down"
+  ],
+  "neural-plasticity/associations-between-digital-media-use": [
+    "developmental-impact/media-exposure-and-preschoolers-social-cognitive",
+    "variable-reinforcement/neural-plasticity-of-development-and",
+    "ai-companionship/the-rise-of-ai-companions"
+  ],
+  "variable-reinforcement/social-learning-theory": [
+    "neural-plasticity/neuronal-reward-and-decision-signals",
+    "foundations/the-emergence-of-social-norms",
+    "foundations/a-review-of-theories-and"
+  ],
+  "variable-reinforcement/integrating-different-perspectives-on-socialization": [
+    "foundations/a-review-of-theories-and",
+    "foundations/a-simplest-systematics-for-the",
+    "foundations/the-emergence-of-social-norms"
+  ],
+  "variable-reinforcement/neural-pathways-of-embarrassment-and": [
+    "neural-plasticity/thumbs-up-or-thumbs-down",
+    "variable-reinforcement/by-carrot-or-by-stick",
+    "ai-risks/chatbots-as-social-companions-how"
+  ],
+  "variable-reinforcement/neural-plasticity-of-development-and": [
+    "developmental-impact/is-adolescence-a-sensitive-period",
+    "neural-plasticity/principles-of-experience-dependent-neural-plasticity",
+    "developmental-impact/navigating-the-social-environment-in"
+  ],
+  "variable-reinforcement/by-carrot-or-by-stick": [
+    "neural-plasticity/neuronal-reward-and-decision-signals",
+    "foundations/the-emergence-of-social-norms",
+    "variable-reinforcement/neural-pathways-of-embarrassment-and"
+  ],
+  "theory-of-mind/where-do-differences-in-theory": [
+    "developmental-impact/media-exposure-and-preschoolers-social-cognitive",
+    "foundations/the-emergence-of-social-norms",
+    "foundations/a-review-of-theories-and"
+  ],
+  "theory-of-mind/speakers-experiences-and-audience-design": [
+    "theory-of-mind/the-impact-of-memory-demands",
+    "theory-of-mind/toward-a-mechanistic-psychology-of",
+    "ai-architectures/towards-understanding-sycophancy-in-language"
+  ],
+  "theory-of-mind/the-impact-of-memory-demands": [
+    "theory-of-mind/speakers-experiences-and-audience-design",
+    "theory-of-mind/toward-a-mechanistic-psychology-of",
+    "foundations/on-face-work-an-analysis-of"
+  ],
+  "theory-of-mind/a-mathematical-theory-of-communication": [
+    "theory-of-mind/entropy-converges-between-dialogue-participants",
+    "foundations/the-emergence-of-social-norms",
+    "theory-of-mind/toward-a-mechanistic-psychology-of"
+  ],
+  "theory-of-mind/entropy-converges-between-dialogue-participants": [
+    "theory-of-mind/toward-a-mechanistic-psychology-of",
+    "theory-of-mind/a-mathematical-theory-of-communication",
+    "foundations/the-emergence-of-social-norms"
+  ],
+  "theory-of-mind/toward-a-mechanistic-psychology-of": [
+    "foundations/the-emergence-of-social-norms",
+    "theory-of-mind/entropy-converges-between-dialogue-participants",
+    "theory-of-mind/the-impact-of-memory-demands"
+  ],
+  "ai-architectures/language-models-are-few-shot-learners": [
+    "ai-architectures/training-language-models-to-follow",
+    "foundations/a-simplest-systematics-for-the",
+    "foundations/a-review-of-theories-and"
+  ],
+  "ai-architectures/towards-understanding-sycophancy-in-language": [
+    "ai-architectures/training-language-models-to-follow",
+    "ai-risks/social-sycophancy-llms-reinforce-problematic",
+    "ai-architectures/helpful-harmless-honest-sociotechnical-limits"
+  ],
+  "ai-architectures/helpful-harmless-honest-sociotechnical-limits": [
+    "ai-architectures/towards-understanding-sycophancy-in-language",
+    "theory-of-mind/toward-a-mechanistic-psychology-of",
+    "foundations/the-emergence-of-social-norms"
+  ],
+  "ai-architectures/training-language-models-to-follow": [
+    "ai-architectures/towards-understanding-sycophancy-in-language",
+    "ai-architectures/language-models-are-few-shot-learners",
+    "foundations/a-simplest-systematics-for-the"
+  ],
+  "ai-companionship/talk-trust-and-trade-offs-how": [
+    "ai-companionship/exploring-relationship-development-with-social",
+    "theory-of-mind/toward-a-mechanistic-psychology-of",
+    "ai-companionship/the-rise-of-ai-companions"
+  ],
+  "ai-companionship/the-rise-of-ai-companions": [
+    "ai-companionship/exploring-relationship-development-with-social",
+    "ai-risks/chatbots-as-social-companions-how",
+    "ai-risks/how-ai-and-human-behaviors"
+  ],
+  "ai-companionship/exploring-relationship-development-with-social": [
+    "ai-companionship/the-rise-of-ai-companions",
+    "ai-risks/chatbots-as-social-companions-how",
+    "ai-risks/how-ai-and-human-behaviors"
+  ],
+  "ai-companionship/social-companionship-with-artificial-intelligence": [
+    "ai-companionship/exploring-relationship-development-with-social",
+    "ai-risks/how-ai-and-human-behaviors",
+    "societal-implications/preliminary-report-on-chatbot-iatrogenic"
+  ],
+  "ai-risks/how-ai-and-human-behaviors": [
+    "ai-risks/understanding-consumer-reactions-to-chatbot",
+    "ai-companionship/the-rise-of-ai-companions",
+    "ai-risks/chatbots-as-social-companions-how"
+  ],
+  "ai-risks/social-sycophancy-llms-reinforce-problematic": [
+    "ai-architectures/towards-understanding-sycophancy-in-language",
+    "ai-risks/chatgpt-giving-relationship-advice",
+    "foundations/the-emergence-of-social-norms"
+  ],
+  "ai-risks/understanding-consumer-reactions-to-chatbot": [
+    "ai-risks/chatbots-as-social-companions-how",
+    "ai-risks/how-ai-and-human-behaviors",
+    "ai-companionship/exploring-relationship-development-with-social"
+  ],
+  "ai-risks/chatbots-as-social-companions-how": [
+    "ai-companionship/exploring-relationship-development-with-social",
+    "ai-companionship/the-rise-of-ai-companions",
+    "ai-risks/understanding-consumer-reactions-to-chatbot"
+  ],
+  "ai-risks/chatgpt-giving-relationship-advice": [
+    "ai-risks/social-sycophancy-llms-reinforce-problematic",
+    "ai-risks/how-ai-and-human-behaviors",
+    "ai-architectures/towards-understanding-sycophancy-in-language"
+  ],
+  "developmental-impact/is-adolescence-a-sensitive-period": [
+    "variable-reinforcement/neural-plasticity-of-development-and",
+    "developmental-impact/navigating-the-social-environment-in",
+    "neural-plasticity/thumbs-up-or-thumbs-down"
+  ],
+  "developmental-impact/navigating-the-social-environment-in": [
+    "developmental-impact/is-adolescence-a-sensitive-period",
+    "developmental-impact/social-connectedness-mental-health-and",
+    "variable-reinforcement/neural-plasticity-of-development-and"
+  ],
+  "developmental-impact/media-exposure-and-preschoolers-social-cognitive": [
+    "neural-plasticity/associations-between-digital-media-use",
+    "theory-of-mind/where-do-differences-in-theory",
+    "ai-companionship/the-rise-of-ai-companions"
+  ],
+  "developmental-impact/the-influence-of-childrens-emotional": [
+    "ai-risks/chatbots-as-social-companions-how",
+    "developmental-impact/navigating-the-social-environment-in",
+    "ai-companionship/talk-trust-and-trade-offs-how"
+  ],
+  "developmental-impact/social-connectedness-mental-health-and": [
+    "developmental-impact/navigating-the-social-environment-in",
+    "developmental-impact/is-adolescence-a-sensitive-period",
+    "ai-companionship/social-companionship-with-artificial-intelligence"
+  ],
+  "developmental-impact/interpersonal-apprehensions-impact-on-behavior": [
+    "developmental-impact/navigating-the-social-environment-in",
+    "foundations/the-emergence-of-social-norms",
+    "developmental-impact/is-adolescence-a-sensitive-period"
+  ],
+  "societal-implications/ftc-launches-inquiry-into-ai": [
+    "ai-companionship/social-companionship-with-artificial-intelligence",
+    "ai-companionship/the-rise-of-ai-companions",
+    "societal-implications/preliminary-report-on-chatbot-iatrogenic"
+  ],
+  "societal-implications/a-positive-feedback-loop-social": [
+    "foundations/the-emergence-of-social-norms",
+    "variable-reinforcement/neural-plasticity-of-development-and",
+    "societal-implications/social-capital-government-expenditures-and"
+  ],
+  "societal-implications/social-capital-and-economic-growth": [
+    "societal-implications/social-capital-government-expenditures-and",
+    "variable-reinforcement/integrating-different-perspectives-on-socialization",
+    "developmental-impact/media-exposure-and-preschoolers-social-cognitive"
+  ],
+  "societal-implications/preliminary-report-on-chatbot-iatrogenic": [
+    "ai-companionship/exploring-relationship-development-with-social",
+    "ai-companionship/social-companionship-with-artificial-intelligence",
+    "developmental-impact/social-connectedness-mental-health-and"
+  ],
+  "societal-implications/social-capital-government-expenditures-and": [
+    "societal-implications/social-capital-and-economic-growth",
+    "societal-implications/a-positive-feedback-loop-social",
+    "foundations/the-emergence-of-social-norms"
+  ]
+};
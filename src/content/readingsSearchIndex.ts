@@ -0,0 +1,4 @@
+import { ReadingSearchIndex } from "./readings";
+
+// Generated by `readings parse --search-index`; do not edit.
+export const readingSearchIndex: ReadingSearchIndex = {"ids":["foundations/on-face-work-an-analysis-of","foundations/a-review-of-theories-and","foundations/a-simplest-systematics-for-the","foundations/social-friction","foundations/the-emergence-of-social-norms","foundations/face-to-face-learning-enhances-the-social","neural-plasticity/principles-of-experience-dependent-neural-plasticity","neural-plasticity/thumbs-up-or-thumbs-down","neural-plasticity/neuronal-reward-and-decision-signals","neural-plasticity/developmental-differences-in-social-information","neural-plasticity/associations-between-digital-media-use","variable-reinforcement/social-learning-theory","variable-reinforcement/integrating-different-perspectives-on-socialization","variable-reinforcement/neural-pathways-of-embarrassment-and","variable-reinforcement/neural-plasticity-of-development-and","variable-reinforcement/by-carrot-or-by-stick","theory-of-mind/where-do-differences-in-theory","theory-of-mind/speakers-experiences-and-audience-design","theory-of-mind/the-impact-of-memory-demands","theory-of-mind/a-mathematical-theory-of-communication","theory-of-mind/entropy-converges-between-dialogue-participants","theory-of-mind/toward-a-mechanistic-psychology-of","ai-architectures/language-models-are-few-shot-learners","ai-architectures/towards-understanding-sycophancy-in-language","ai-architectures/helpful-harmless-honest-sociotechnical-limits","ai-architectures/training-language-models-to-follow","ai-companionship/talk-trust-and-trade-offs-how","ai-companionship/the-rise-of-ai-companions","ai-companionship/exploring-relationship-development-with-social","ai-companionship/social-companionship-with-artificial-intelligence","ai-risks/how-ai-and-human-behaviors","ai-risks/social-sycophancy-llms-reinforce-problematic","ai-risks/understanding-consumer-reactions-to-chatbot","ai-risks/chatbots-as-social-companions-how","ai-risks/chatgpt-giving-relationship-advice","developmental-impact/is-adolescence-a-sensitive-period","developmental-impact/navigating-the-social-environment-in","developmental-impact/media-exposure-and-preschoolers-social-cognitive","developmental-impact/the-influence-of-childrens-emotional","developmental-impact/social-connectedness-mental-health-and","developmental-impact/interpersonal-apprehensions-impact-on-behavior","societal-implications/ftc-launches-inquiry-into-ai","societal-implications/a-positive-feedback-loop-social","societal-implications/social-capital-and-economic-growth","societal-implications/preliminary-report-on-chatbot-iatrogenic","societal-implications/social-capital-government-expenditures-and"],"terms":["000","11","13","131","138","17","18","180","187","2025","207","24","610","623","65","72","90","aaai","abilities","ability","able","about","above","absence","absorbing","acc","accept","accessible","accidentally","accordingly","account","accountability","accounts","accurate","achievable","achieve","acquire","acquisition","across","act","acting","action","actions","activation","active","actively","activities","activity","actors","actual","actually","acute","adapt","adaptation","adaptive","adapts","add","added","addiction","additional","addressees","addresses","adds","adjust","adjustment","adjustments","adolescence","adolescent","adolescents","adult","adulthood","adults","advantage","advertising","advice","advisor","affect","affection","affective","affiliation","affirming","affirms","afford","affordances","after","afterthought","against","aged","agency","agent","agents","aggression","agnostic","agree","agreeable","agreement","ahead","ahmed","ai","air","ais","aita","al","alarm","align","aligned","aligning","alignment","all","alliances","allocate","allow","allowing","almost","alone","along","already","also","altered","alters","altruistic","always","am","ambiguity","ambiguous","ambivalent","amends","among","amplifies","amplify","amygdala","an","analogous","analogue","analysis","analytic","analyzes","analyzing","anchor","and","anderson","andrews","anecdotes","anger","angle","animal","announcement","annoyed","annoying","annual","another","answer","answers","antecedents","anterior","anthropomorphic","anthropomorphism","anticipate","anticipated","anticipation","anxiety","anxious","any","anything","apart","apologies","apologize","appealing","appear","appearance","appears","appeasing","appel","applied","apprehension","approach","approval","arbiter","arbitrarily","arbitrary","architecture","are","area","areas","aren","argue","argues","arguing","argument","arise","around","arousal","art","article","articulate","artificial","artificially","as","ascribe","ascribed","ask","asking","asks","aspects","assemble","assertion","assertively","asshole","assigned","assistant","assistants","associated","associations","assuming","asymmetric","asymmetries","asymmetry","at","attachment","attack","attempt","attempts","attend","attention","attitudes","attributed","audience","audiences","audio","authority","authors","automatic","autoregressive","availability","available","avenues","aversive","avoid","avoidance","avoidant","avoiding","avoids","away","awkward","awkwardness","axis","back","backbone","backdrop","backfiring","background","bad","badly","bakes","balance","balanced","band","bandura","bandwidth","bare","barrier","barriers","basal","base","based","baseline","basic","basically","basis","bayesian","be","bearing","beasts","beautifully","because","become","becomes","been","before","begets","begin","behave","behaves","behaving","behavior","behavioral","behaviorally","behaviors","being","belief","beliefs","believe","bell","belonging","benchmarks","bend","beneficial","benefit","benefits","benign","best","better","between","beyond","bias","biased","biases","bibliometric","big","biological","biologically","bit","bite","bits","blakemore","block","blown","blueprint","blunt","blunts","blushing","boards","body","bond","bonds","bones","book","boost","boosts","bos","boss","bot","both","bots","bottlenecked","bound","boundaries","boundary","box","brain","brains","brand","breakdown","breakdowns","breaking","brevity","bridge","bring","brings","broad","broader","brown","brute","bubbles","buffer","buffered","bug","build","building","builds","built","bumping","buried","business","but","by","bypasses","byproduct","cai","calibrated","calibration","call","calories","can","candidate","canonical","cao","capable","capacity","capital","capture","care","careful","carefully","cares","carries","carrot","carry","carved","cascading","case","cases","cash","casual","catch","category","causal","causality","cause","caused","cautious","caveated","cells","centered","central","century","certain","certainty","chain","challenge","challenged","challenges","challenging","chances","change","changes","changing","channel","channels","chapter","character","charged","charity","chase","chat","chatbot","chatbots","chatgpt","chats","chaturvedi","check","checks","cheng","child","childhood","children","choice","choices","choose","chronic","chronically","circuitry","circuits","cite","civic","claim","claims","clarification","clarify","clarifying","classrooms","clauses","clean","cleanly","clear","clearly","clever","clinical","close","closer","co","coauthors","code","codes","coding","coefficient","coelho","cognition","cognitive","coherent","cohorts","collaborative","collaboratively","collapses","colleagues","collective","collisions","combination","combine","combining","come","comes","comfort","comfortable","comforting","commercial","commission","common","communication","communicators","community","companies","companion","companions","companionship","compared","compares","comparisons","compelled","compelling","compensatory","compete","competence","competent","competing","competition","complement","completion","complex","complexity","compliance","complicated","composition","comprehension","comprehensive","compromise","computational","computers","concept","conceptual","concern","concerns","concrete","condition","conditioning","conditions","conduct","conference","confidence","confident","conflict","conflicting","conflicts","confront","confusion","connectedness","connecting","connection","connections","connectivity","conscience","conscious","consciousness","consensus","consequence","consequences","consequential","consistent","consistently","consolidate","constant","constantly","constellation","constraining","constraint","constraints","constructional","constructions","constructive","constructs","consumer","contain","content","contentful","context","contexts","contingencies","contingency","contingent","continuations","continue","continuum","contradictory","contrast","contribute","contributes","contribution","control","controllable","controlled","convenience","conventions","converge","convergence","converges","conversation","conversational","conversations","conversely","convincingly","cooperative","coordinate","coordinated","coordinating","coordination","cope","copying","core","corpora","corpus","correct","corrected","corrections","corrective","correlate","correlated","correlates","correlation","correspond","cortex","cortical","cost","costlier","costly","costs","could","count","countless","countries","counts","coupled","coupling","course","cousin","create","creates","crisis","critical","criticism","critics","critique","crone","cross","crossed","crossing","crowd","crucial","crucially","cruelty","crystallize","crystallizes","cues","cul","cultural","culture","curiosities","curiosity","current","customer","customization","customize","cut","dahlgren","daily","damage","damaged","dangerous","dangers","darkest","das","data","dataset","date","davidov","davis","de","deactivation","dead","dealing","debates","decades","decent","decentralized","deceptive","deceptively","decide","decision","decisions","decline","declining","decodes","decreases","deep","deepen","deeper","deeply","default","deference","deliberate","deliberately","deliver","delivering","delusional","delusions","demand","demands","demonstrate","demonstration","demonstrations","den","dense","density","depart","depend","dependence","dependent","depends","depression","deprivation","deprives","deriving","descent","describe","described","describes","descriptions","design","designed","designing","desires","despite","detailed","details","determines","determinism","develop","developers","developing","development","developmental","developmentally","develops","deviations","dewitt","dialogic","dialogue","dialogues","dials","didn","diet","difference","differences","different","differently","differing","difficult","difficulty","dig","digital","dimension","direct","directed","directional","directly","disadvantages","disagree","disagreement","disagreements","disappointment","disapproval","discipline","disclose","disclosing","disclosure","discomfort","discover","discriminate","discuss","disease","disembodied","disinclined","dismissing","displace","displaced","displacement","disproportionate","dissociable","dissociation","distinct","distinctive","distort","distorts","distressed","distribution","distributions","diverge","diverse","dividing","do","dobbe","dodge","does","doesn","doing","domain","domains","dominance","dominate","dominates","don","dopamine","dosage","double","down","downstream","dozens","drama","dramatic","drawing","drawn","drills","drive","driven","driver","drives","driving","drops","dual","dubious","dudley","durable","durably","during","dwivedi","dyad","dynamic","dynamically","dynamics","each","earlier","early","eases","easier","easiest","easily","easy","echo","ecology","economic","economically","economics","economy","ecosystem","edge","edged","edges","edging","edit","education","educational","effect","effective","effectively","effects","efficiency","efficient","efficiently","effort","effortful","effortless","ego","egotism","either","elaborate","elder","elements","eliminate","else","embarrassed","embarrassment","embedded","embodied","emerge","emergence","emerges","emerging","emotion","emotional","emotionally","emotions","empathize","empathy","emphasize","emphasizes","emphasizing","empirical","empirically","emulation","encode","encodes","encounter","encounters","end","ended","endlessly","ends","energy","enforcing","engage","engaged","engagement","engages","engaging","engine","engineer","engineered","engineering","enhances","enough","enter","entertainment","entire","entirely","entropy","entry","environment","environmental","environments","episodes","epistemic","equal","equipped","ericson","erode","erodes","erosion","error","errors","escape","especially","essential","essentially","establishes","estimate","estimates","et","etc","ethical","ethics","evaluated","evaluation","evaluations","evaluative","evasive","even","event","events","every","everyday","everyone","everything","evidence","evolution","evolutionary","evolve","evolved","exacerbate","exact","exactly","examine","examines","example","examples","exchange","exchanges","excitability","exclusion","executive","exercise","exercised","existing","expect","expectations","expected","expenditures","expensive","experience","experiences","experiment","experimental","experiments","explain","explained","explanations","explicit","explicitly","exploring","expose","exposed","exposure","express","expressions","extended","extra","extremely","eye","eyebrows","fabric","face","facilitating","facing","fact","factor","factors","facts","factual","fail","failed","fails","failure","failures","faithful","faithfully","fake","fall","familiar","families","family","far","fast","fault","feature","features","fed","federal","feed","feedback","feeds","feel","feeling","feelings","feels","felt","few","fewer","field","fight","filling","final","finally","find","finding","findings","finds","fine","finished","finn","finnegan","fire","firing","firm","first","fit","five","fixed","flag","flagged","flagship","flatten","flattened","flattens","flatter","flattery","flaw","flexibility","flexible","flexibly","flies","flip","flips","flocking","floor","flowing","fluctuate","fluent","fluid","fly","flying","fmri","focus","focused","folded","follow","following","for","force","forces","forcing","forever","forged","forgiving","form","formal","format","formation","forms","fornito","forth","forward","foster","foundational","foundations","four","fragile","frame","framed","frames","framework","framing","frank","free","frequency","frequent","frequently","friction","frictionful","frictionless","frictions","friend","friendly","friends","friendship","fringe","from","frontal","ftc","full","fully","fumbling","function","functional","functionally","functioning","functions","fundamental","further","future","fuzzier","fuzziness","gaffes","gain","gaining","galvan","game","ganglia","gap","gaps","garrod","gated","gathering","gaze","general","generalize","generalizes","generally","generate","generates","generation","generations","generic","gentle","genuine","genuinely","geometric","gerrig","gesture","get","gets","getting","giant","girls","give","given","givers","gives","giving","go","goal","goals","goes","goffman","going","goldberg","goldstone","good","goodharting","goodman","governed","government","governments","gpt","gradient","gradients","gradually","grained","grammar","grapple","grappling","grasping","gratifications","gray","graziano","great","ground","grounded","grounding","grounds","group","groups","grow","growing","grows","growth","grudge","grudges","grusec","guaranteed","guarding","guardrails","guidance","guided","guiding","guingrich","gun","habits","habitual","hadley","haigler","half","hamilton","hancock","hand","handful","hang","happen","happened","happening","happens","hard","hardens","harder","hardwired","harm","harmful","harmless","harms","harsh","harsher","harshly","has","hatch","have","having","hawkins","he","headline","heads","health","healthier","hearted","heavier","heavily","heavy","hedge","heightened","help","helpful","helpfulness","helps","heo","here","hesitations","heterogeneity","heterogeneous","heuristics","hidden","high","higher","highlight","highlights","highly","hinge","hinges","his","historically","histories","history","hits","hofmans","hold","holding","hollowing","home","honest","honesty","hood","horizon","horizons","horowitz","horton","hot","hou","how","huang","huge","human","humanized","humans","hundreds","hungriest","hurt","hurtado","hurts","hutton","hyper","hyperscanning","hypothesis","iatrogenic","idea","ideal","ideas","ideation","identical","identify","identity","idiosyncratic","if","ignored","ignores","imitate","imitation","imitators","immediate","immediately","impact","impactful","impacts","impair","implement","implemented","implications","implicit","important","imposed","impoverished","impressions","imprisonment","improve","improved","improving","in","incentives","incentivizes","include","including","incompetence","inconsistent","increase","increased","increases","increasingly","incur","indicators","individual","individuals","induce","inference","inferring","influence","influencing","information","informative","ingredients","inherently","initial","initiates","initiator","injury","inner","innovate","innovative","input","inquiry","insights","insists","instance","instant","instantiation","instantly","instead","institutional","institutions","instructgpt","instruction","instructions","insula","integrate","integrating","intellect","intellectually","intelligence","intemperance","intense","intensify","intensity","intensive","intention","intentions","interact","interacting","interaction","interactions","interactive","interest","interesting","interests","interfere","interlocutors","internal","internalize","internally","international","internet","interpersonal","interpret","interpretation","interpretations","interruptions","intersection","interviews","intimacy","intimate","into","introducing","intuitive","investigation","investment","invisible","invite","involve","involved","irrelevant","irreversibility","irreversible","is","isn","isolated","isolation","issued","it","items","its","itself","jefferson","jiang","job","joint","joke","joking","jones","judge","judged","judgment","judgmental","judgments","juggling","jump","just","justify","keep","keeping","keeps","key","kids","kind","kinds","kleim","know","knowing","knowledge","knows","korbak","krach","kraus","krause","kushnir","lab","label","labelers","labels","lack","lagrant","lamblin","land","lands","landscape","lane","language","languages","lapses","large","larger","lasting","latency","latent","later","latter","launches","layer","laying","lays","leach","lead","leading","leads","lean","leans","learn","learned","learner","learners","learning","least","leave","leaving","legitimate","lengths","lenhart","lens","less","let","lets","level","levels","levinson","li","lie","life","lifespan","light","like","likely","likeness","limitations","limited","limiting","limits","lindstrom","line","lines","link","linked","linking","links","list","listener","listeners","literally","literature","little","liu","live","lived","livelihood","lives","ll","llm","llms","load","loaded","loads","local","locally","lofty","logic","logs","loneliness","lonely","long","longer","longitudinal","look","looking","looks","loop","loops","lose","loss","losses","lossy","lost","lot","lots","low","lower","luxury","lv","machine","machinery","macro","made","maes","main","mainly","maintain","maintained","maintenance","major","majority","make","makes","making","malleable","manage","management","manages","managing","maneuvers","manipulate","manipulating","mann","manual","many","map","mapping","maps","mar","marker","market","massages","massive","match","matcher","matching","math","mathematical","matter","matters","maturation","mature","maximize","maximizes","maximum","may","maybe","me","mean","meaning","meaningful","meaningfully","means","measure","measurement","measures","mechanical","mechanics","mechanism","mechanisms","mechanistic","media","mediated","mediators","medication","medium","meds","meet","meets","melt","memorable","memories","memory","men","mental","mentalizing","mere","meso","message","messages","messy","meta","metacognitive","methnani","method","methodological","methods","metrics","micro","mid","might","mild","mills","mimicry","mind","minded","mindlessly","minds","minimal","minimize","minority","minors","minutes","mirror","mirroring","misalignment","miscommunications","misfires","mishearings","mismatch","misread","missing","misstep","mistake","mistakes","misunderstand","misunderstandings","mitigation","mix","mixed","mixing","modalities","modality","model","modeling","models","moderated","moderating","modern","modes","modi","modulate","modulates","modulation","module","mollo","moment","moments","monitored","monolithic","monologues","moral","morally","more","morphology","most","mostly","motion","motivate","motivation","motivational","motives","motor","move","moves","moving","mpfc","mri","much","muller","multi","multimodal","multiple","multitasking","murawski","mushroom","must","mutual","mutually","my","naming","narrative","narrow","narrows","nationally","natural","naturalistic","naturally","navigate","navigating","naylor","nearly","neat","neatly","necessarily","necessary","necessity","need","needed","needing","needs","negative","negatively","negotiate","negotiating","negotiation","neither","network","networks","neural","neurally","neurobiologically","neurocomputational","neuroimaging","neuronal","neurons","neuroscience","neutral","never","new","newcomer","next","nice","nicer","nineteenth","no","nobody","nogo","noise","noisy","non","nonexistent","nonjudgmental","nontrivial","nonverbal","nor","norm","normal","normally","normative","norms","not","notable","notice","noticeably","novel","nuance","nuanced","nudged","nudging","object","objects","observable","observational","observed","obsessed","obstructions","obstructs","occasionally","occasions","occur","odd","of","off","offensive","offer","offering","offers","offline","offs","often","oh","old","older","on","once","one","ones","ongoing","online","only","onto","opaque","open","operate","operating","operation","opinions","opportunities","opposite","optimal","optimize","optimized","optimizes","optimizing","option","options","or","order","orderly","orders","ordinary","organism","organization","organize","organized","orient","oriented","origin","original","ostracism","other","others","otherwise","our","ourselves","out","outcome","outcomes","outline","output","outputs","outright","outsized","outsource","ouyang","over","overall","overcome","overlapping","overlaps","override","oversight","overturn","overview","own","owned","oz","pain","painful","painfully","painted","pairs","paper","paradigm","parasocial","parent","parental","parenting","parents","parkinson","parkinsonism","part","partial","partially","participants","participation","particular","particularly","parties","partly","partner","partners","partnerships","parts","pass","passionate","passive","past","pataranutaporn","pathway","pathways","patient","patients","pattern","patterned","patterns","paulus","pauses","pay","paying","payoffs","peer","peers","penalties","pentina","people","per","perceive","perceived","perception","perceptual","perfect","perfectly","perform","performance","performing","period","periods","permission","perpetual","persistent","person","personal","personality","personally","perspective","perspectives","phase","phenomenological","phonology","photos","phrasing","physical","pick","pickering","picks","picky","picture","piece","pieces","pin","pinzler","pipeline","place","plastic","plasticity","plausible","plausibly","play","playing","pleasant","pleasing","pluralistic","plus","point","points","policy","polite","politeness","political","ponzetto","pooling","poor","pops","population","posit","positive","possibility","possible","post","poster","posts","posture","potency","potential","power","powerful","powers","ppo","practical","practice","practiced","practices","praise","praised","preaching","precise","precisely","precision","predictable","predicted","predicting","prediction","predictor","predicts","prefer","preference","preferences","preferred","prefrontal","preliminary","premises","preschool","preschoolers","presence","present","presentation","preservation","preserve","pressure","pressures","pretend","pretrained","pretraining","pretty","prevent","price","primarily","primary","primed","priming","principle","principles","prior","privacy","private","privately","probabilistic","probabilities","probe","probing","problem","problematic","problems","proceedings","process","processes","processing","produce","produced","produces","producing","product","production","productive","productivity","products","professional","professor","profile","profiles","progress","progressively","project","promote","promotes","prompt","prompts","proof","properties","property","propose","proposed","proposes","prosocial","protect","protection","protective","protects","provide","provides","providing","proxy","psychiatric","psychological","psychologically","psychology","psychosocial","public","publication","pull","pulls","punchline","punish","punished","punishers","punishes","punishments","pure","purely","purpose","pursue","pursuing","pursuits","push","pushback","pushes","put","puzzle","quality","quantifiable","quantitative","quantities","quantity","quasi","queries","question","questions","quickly","quiet","quietly","quirky","racing","radically","raise","raised","ramp","ramps","range","rank","rankings","ransom","rapid","rarely","rate","rated","raters","rather","rating","raw","re","react","reacted","reactions","reactive","reactivity","read","readily","reading","real","realistic","realistically","realities","reality","realizing","reallocate","really","realm","reason","reasonably","reasoning","reassurance","rebalanced","recalibrate","recalibration","receive","receiver","recent","reciprocal","reciprocity","recognizing","recommend","reconfigure","recovery","recruit","recruits","reddit","redistributing","reduce","reduced","reduces","reducing","reduction","redundancy","redundant","referential","refined","refining","reflect","reflective","reflexively","reframe","reframing","refuse","regard","regions","register","regular","regularities","regulates","regulating","regulation","regulators","regulatory","rehab","rehabilitation","rehearsal","rehearse","reilly","reinforce","reinforcement","reinforces","reinforcing","reinterpret","reitter","rejected","rejection","rejections","relate","related","relates","relational","relations","relationship","relationships","relative","relatively","relevant","reliability","reliable","reliably","reliance","relieve","religion","rely","remains","remark","remember","remind","reminder","remodeling","remove","removes","rent","repair","repairing","reparative","repeat","repeated","repeatedly","repetition","rephrase","replacement","replacing","replika","report","reported","represent","representation","representations","representative","reproduces","reputation","reputations","requests","require","required","requires","requiring","rescues","research","researchers","resend","reset","resettable","reshape","reshapes","resilience","resistance","resolution","resolving","resources","respect","respond","responder","responders","response","responses","responsive","responsiveness","restrains","result","results","retreat","retrieve","reveals","reverse","review","reviews","revise","reward","rewarded","rewarding","rewards","rewire","rhythms","rich","richer","richness","richter","rides","right","rigid","rise","risk","riskier","risky","ritual","ritualized","rituals","rituerto","rivals","rlhf","robust","robustly","role","roles","romance","romanticize","roommate","rosa","rough","routinely","ruan","rude","rudolph","rule","rules","run","runs","rush","ryder","sac","sacks","sacred","safe","safer","safest","safety","said","salience","salient","same","sample","samples","sanctions","satisfaction","satisfying","saving","say","saying","scaffold","scaffolds","scalable","scale","scanner","scans","scenarios","schedule","schegloff","scheme","schultz","science","score","scores","screen","screens","scripted","scroll","sculpted","sculpts","search","seat","second","secretly","secular","see","seeberger","seeing","seek","seeking","seem","seemingly","seems","seen","select","selectively","self","selfish","semantics","sending","sense","sensitive","sensitivity","sentences","separable","separate","september","serious","seriously","serves","service","sessions","set","sets","settings","settle","setup","setups","seven","several","sexual","shaky","shannon","shape","shaped","shapes","shaping","share","shared","shares","sharing","sharma","sharp","sharpens","sharper","sharply","shift","shifting","shifts","short","shortcuts","shot","should","shouldn","show","showing","shows","shrinking","shrinks","shrivastava","shut","side","sided","sides","signal","signals","significant","silence","silent","similar","simple","simpler","simplest","simplify","simplistic","simply","simulate","simulated","simulations","simultaneously","single","sink","sit","sitting","situation","situations","size","skeptically","skill","skilled","skills","skymba","slice","sliding","slightly","slights","slogan","sloppy","slots","slow","slows","small","smaller","smiles","smoking","smooth","smoothed","smoother","smoothing","smooths","snapshot","so","sobering","social","sociality","socialization","socializing","socially","societal","societies","society","socio","sociocultural","sociotechnical","soft","soften","softened","softer","sole","solitary","solutions","solve","solved","solving","some","someone","something","sometimes","somewhat","soothes","soothing","sophisticated","sorry","sounding","source","space","spaces","sparse","speak","speaker","speakers","speaks","special","specialization","species","specific","specifically","specification","specifications","specificity","speech","spend","spending","spent","spiral","spiteri","spoken","sponge","stabilize","stabilizer","stable","stage","stake","stakes","stalls","stance","stand","standards","start","starts","starving","state","stated","statelessness","statements","states","static","statistically","statistics","status","stay","steer","step","steps","stereotypes","stick","sticks","sticky","still","stimulus","stop","store","storms","story","stove","straightforwardly","strained","strategic","strategically","strategies","stream","streams","strengthened","stress","stressed","striatum","strict","strictly","striking","stripped","stripping","strips","strong","stronger","strongly","structural","structurally","structure","structured","structures","struggles","struggling","stubborn","students","studies","study","stuff","style","styles","subcortical","subset","subsets","substitute","substituting","subtle","subtler","subtly","success","successful","sudden","sufficiently","suggesting","suggestions","suggestive","suggests","suicidal","supervised","support","supported","supportive","supports","supposed","supposedly","suppress","suppressing","sure","surface","surprise","surprises","surprising","surprisingly","survey","surveyed","surveys","sustain","sweeten","switch","sycophancy","sycophantic","symbolic","symbolically","symptoms","synchronize","syntax","synthesis","synthesize","synthesizes","system","systematic","systematically","systematics","systems","table","tablets","taborsky","tact","tactful","tailor","tailoring","take","takeaway","takes","taking","talk","talked","talking","talks","target","targeted","task","tasks","taught","taxed","taxing","teach","teachable","teachers","teaches","teaching","tearing","tech","technical","technically","technology","teen","teens","teeth","tell","telling","telzer","temporal","temporarily","temporoparietal","tend","tendency","tends","term","terms","terrible","test","testable","tested","testing","tethered","text","than","thanks","that","the","their","them","thematic","theme","themselves","then","theorems","theoretic","theoretical","theories","theorize","theory","therapists","there","therefore","these","thesis","they","thick","thin","things","think","thinking","thinned","thinner","thinning","thins","third","this","those","though","thousand","thousands","threat","threatened","threatening","threats","three","threshold","throttle","through","throughline","thumbs","thus","tidy","tied","ties","tightly","tilt","tilted","time","timeline","timelines","times","timidity","timing","tiny","titter","to","together","token","told","tolerance","tolerant","tolerate","tolerating","tom","tone","tones","tong","too","tool","toolkit","top","topic","topics","total","totally","touching","tough","toward","towards","toxic","tpj","traces","track","tracking","tracks","trade","train","trained","training","trains","trait","traits","trajectories","trajectory","transcribed","transfer","transitional","translate","translates","transmission","transmit","transmitter","travels","treat","treated","treating","treats","trends","triad","trial","trials","tried","tries","triggered","tripartite","troiano","troya","truly","trump","trust","trusted","truth","truthful","truths","trying","tumble","tunable","tune","tuned","tuning","turbulence","turn","turning","turnover","turns","tweaking","tweaks","twist","twitch","two","type","types","typical","typically","ultra","un","unambiguously","uncertain","uncertainty","unclear","uncomfortable","unconscious","under","underinvesting","underlie","underlying","underneath","understand","understanding","understood","underutilizes","underwent","undone","uneven","unexpected","unfolds","unhealthy","uniform","uniformly","unique","unit","units","universal","unless","unpleasant","unpredictability","unpredictable","untruthful","up","update","updates","updating","upshot","upvotes","us","usage","use","useful","user","users","uses","using","usual","usually","utterance","utterances","vacuum","vague","validated","validating","validation","value","values","van","vantage","variability","variable","variance","variation","vary","varying","ve","vector","ventral","verma","versa","version","versus","very","via","vibe","vicarious","vice","vices","view","viewpoint","views","vigilant","violations","visible","vision","visual","visually","visuospatial","vmpfc","vocabulary","voice","voters","vr","vs","vulnerabilities","vulnerability","vulnerable","walks","wander","wang","want","ward","warm","warmth","warnings","was","watching","wavy","way","ways","we","weak","weakens","weaker","weaves","web","week","weeks","weight","weighting","well","wellbeing","wellman","were","westermann","what","whatever","wheels","when","where","whether","which","while","whittle","who","whole","whom","whose","why","wide","widen","will","willing","willingness","win","winces","window","windows","wins","wired","with","withdraw","withdrawal","withdrawing","withdraws","within","without","wizard","won","word","words","work","worker","working","world","worried","worry","worse","worsen","worsening","worth","worthy","would","wouldn","woven","wrapping","wrestle","written","wrong","wu","xie","xu","xue","yan","yang","years","yes","yet","you","young","younger","your","yours","yourself","youth","yu","zero","zhang","zooms"],"postings":[[30],[41],[26,34],[27],[34],[26],[34],[5],[35],[41],[35],[44],[34],[34],[35],[26],[5],[34],[19],[11,16,36,38,42],[32,45],[0,1,2,3,4,5,6,8,12,13,16,19,21,24,25,26,27,28,29,30,32,33,34,36,40,41,43,44],[4],[27,44],[27],[13],[12],[18],[42],[7],[2,16],[29,33,44,45],[21],[9],[19],[5],[5],[11],[2,4,12,14,20,22,23,25,29,30,31,34,36,42,43,45],[16,31],[41],[3,43],[0,5,15],[7],[18,28,37],[44],[10],[3,7,8],[0,28],[1,4,12,38],[1,6,8,13,17,18,21,23,25,26,27,28,30,31,33],[39,44],[4,6,7,17,21,36],[4,36],[19,32,35],[4],[28],[19],[28,29],[42],[17],[38],[39,44],[17,18,32],[4],[32,36],[9,14,35,36,39],[7,26,35,36,39],[7,9,14,35,36,37,39],[35],[9,35],[5,9,10,30],[5],[41],[9,22,26,31,34],[34],[13,15],[41],[13,28],[1],[11],[44],[20],[5],[6,25],[14],[21,23],[10],[28,29,32,41],[11,16,25,32],[1,4,16,32],[38],[19],[23],[15,23,25],[31,34],[29],[36],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45],[42],[29],[31],[1,2,5,22,23,25,29,31],[44],[12],[21,23,24,34],[21],[3,20,21,24,34],[2,3,11,18,21,24,26,32,33,37,39],[36],[45],[6],[2],[0,2,3,12,13,23,29,33],[16,33],[23,28],[16,21,26,42,45],[6,8,14,19,23,24,25,27,29,36,39,42,43],[10],[7],[3],[17,18,26,28,39,41,42,44],[9,31],[21,40],[19,34],[26],[32],[1,27,45],[13],[36],[7,13],[0,2,3,7,9,10,11,13,14,15,16,17,18,19,20,21,23,24,25,28,31,34,37,41,42,44],[35],[10],[0,23,29,43],[0,2],[34],[0],[11,35],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45],[5],[36],[44],[32],[5,22],[6],[41],[32],[6],[35],[1,5,11,12,20],[1,2,4,6,12,13,14,15,21,30,32,34,35,36,37,38,39,40,43,45],[0,3,8,11,19,23,34],[29],[13],[33],[28,29],[0,38],[40],[11],[0,13,29,36,39],[13],[0,5,32,37,42],[27],[0,3],[0],[41],[24,42],[30],[24],[40],[31],[37],[40],[40],[7,9,11,12,19],[7,8,14],[34],[19],[6],[9,14,25],[0,1,2,3,4,5,6,7,8,9,10,12,13,14,15,16,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,34,35,37,38,39,40,41,42,43,44,45],[10],[10,12],[29],[1,2,4,6,10,12,14,15,18,21,24,28,32,39,43,45],[0,3,8,14],[0,2,29,38],[6,15,24,26,29,35,37,40,42,43,44],[4,38],[0,2,11,40],[13],[19,23],[0,2,4,35],[34],[1,29],[4],[0,1,2,3,4,7,9,11,13,14,15,17,18,19,20,21,22,23,24,25,26,28,29,30,31,32,33,34,35,37,38,39,40,41,42,43,44,45],[33],[33],[12,31,34,40],[6,18,31,37,39],[5,24,30],[29],[37],[12],[40],[31],[30],[25],[23],[10,27,30,33,34,45],[10,43],[4],[32],[20,24],[20,21],[2,4,6,8,9,10,12,13,15,17,18,19,20,21,24,26,29,30,31,32,33,40,44],[28,29],[34],[3,41],[31],[11],[5,11,37,41],[32],[32],[0,13,17,18],[40],[19],[44],[1,5,6,7,9,10,15,20,24,31,32,33,34,35,36,39,43],[21],[22],[26,29,44],[6,10,26,28,41],[29],[13],[6,8,15,23,26],[0,7,38,42],[23],[7,15],[4],[1,13,28,33],[2,5,13,30],[6,33],[1],[2,10,18,21,24,27,31,37,40],[4,8,11,25,42],[29],[30],[16,26],[13,15,24,29,38,39],[31],[23,25],[15],[39],[34],[11],[2],[22],[40],[3],[15],[25,44],[9,10,11,13,15,16,18,22,37],[8,14],[2,6,9,31],[0,2,6,8,30],[8],[9],[0,2,6,8,11,12,14,17,19,21,23,27,31,35,39,40,41,42,43,44],[32],[14],[20],[3,21,23,25,26,40,41,43],[4,17,21,23,27,32,33,38,40],[8,20,36,39,40],[12],[0,18,41],[42],[28],[3,17],[25],[31],[0,1,4,11,13,14,22,30,31,33,35,36,40],[1,15,35,36,42],[6,9],[1,4,24,30],[3,7,11,13,17,18,25,26,27,29,31,33,37,39],[33],[16,23,37],[33],[44],[35,39],[31],[23,25],[44],[10],[33,37,42],[44],[9],[6,8,15,26,31,32,33,38,45],[2,5,6,7,8,10,15,19,20,21,24],[1,14,24],[5,15,23,43],[35],[25],[29],[7,8,11,16,22,42],[8,39],[15,35],[6],[3],[12],[35,36],[2,6],[28],[3],[3,7,43],[16],[13],[26],[1,13],[28],[27],[22],[11],[43],[25,45],[9],[17],[20,28,30,32,33,39,42,44],[0,2,3,4,5,7,8,9,14,15,17,20,21,30,32,36,39,40],[17,26],[18],[0,37],[15,41],[24,44],[5,6],[6,8,9,10,13,14,15,35,36,39],[6,7,10,35],[32],[0],[17],[11],[17],[6,39],[10],[7],[29,38,45],[0,10,44],[22],[11],[23],[39],[8],[36],[5,16,17,40],[41],[0,20,31],[10,16,37],[13],[18],[41],[1,3,4,5,6,7,8,9,10,11,12,14,15,17,18,19,20,21,22,23,24,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,42,43,44],[0,1,2,3,4,6,7,8,10,11,13,14,15,16,18,19,22,24,25,28,29,33,35,37,38,39,40,43,45],[41],[3],[32],[7,17],[13,35,42],[17],[26],[0,1,2,4,5,6,12,14,16,18,19,20,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,38,39,40,41,42,43,44],[25],[25],[38],[18],[6,17,19,27],[43,45],[1,6,24,28],[8,29,32,44],[27],[0],[19],[20,35],[15],[3,19,32],[4],[45],[0,35,41,44],[2,3],[6],[28],[20,40],[41],[16,45],[10,27],[42],[3],[43],[23],[8],[18],[2,3,4,5,6,7,9,10,11,12,13,14,15,22,28,31,33,37,38,39,42,43],[3],[4,17,44],[9],[11],[6,14,24,36,44],[23],[14],[6,14],[5,9],[6,7,19,31,45],[7,8,9,11,14,16,35,36,37],[14,15,19,32],[5,19,31,45],[12],[3,33],[3,27],[36],[3],[7],[0,2,21],[27,30,32,33,38,44],[27,28,30,32,33,41],[30,34],[18,20],[29],[6],[44],[31],[12,38,41],[37],[5,10,16,37,38],[2,8],[43],[38],[39],[6],[7,10,13,36],[6,7,8,10,13,14,15,36],[44],[43,45],[0,1,10,11,36,38,41,42,45],[0,9,41,43],[17],[20],[40],[2],[2],[5,7,19,20,22,41],[17],[17,19,31,33],[31,32],[19,25],[44],[43],[5],[5,45],[29],[3,19],[3,19],[19],[43],[24],[1,10],[1,7,15,16,18,21,36,37,38],[12],[45],[21],[20],[2],[4,15,23,27,28,37,38],[24,43],[3],[32],[27,45],[15],[9,16,26,40],[0,1,13,16,34],[12,17,23,29],[24,26,30],[30],[29],[41],[20,21,26],[17,18,19,40],[18],[31],[28,41],[30,33,41,44],[0,1,7,9,10,12,13,15,17,19,20,22,23,24,26,27,28,29,33,38,40,41,42,45],[0,1,2,3,4,5,6,8,11,21,25,26,27,28,29,30,35,36,39,43,44],[32,37],[9],[23,24],[3],[22],[6],[28],[32,40,42,45],[9,32],[12],[2],[41],[2],[1,5,11],[20],[15],[34],[45],[21,38],[1,29],[38],[9,16],[28],[16],[0,11,29],[26,35],[26,28,40,41,44],[3,6,10,31],[44],[8,11],[16,18,30],[3],[34],[9,33],[24],[3,6,12,15,22,23,27,28,29,33,34,38],[16,33],[4,12,31,38],[31],[17],[39],[38],[28,30],[28],[7,14],[3],[33],[33],[31,34],[9,14],[8,11,26,29,38,43],[6,45],[7,8,34],[27],[6],[0,24],[2,7,9,18],[2],[21],[3],[4,6,18,44],[2],[21],[38],[29],[32,41],[19],[20,26,37],[20],[19,20,22,23,38,40,43],[6,18,32,35,36,40,43,44],[1],[10,37],[10,18,37],[22],[2,14,17],[14],[12],[0,2,3,4,7,10,34],[20],[43],[10,42],[1,12,14,15,35,36],[35],[30,32],[5],[4],[4,13,20,21],[20],[20],[2,10,16,20,21,26,44],[16,18,23,25],[0,18,20,26,34],[39],[33],[25,43],[1,4],[1],[4],[1,2,4,21],[0],[5],[0,1,3,6,8,30,32,34,40,45],[20],[34],[19,23,43],[36],[23,28],[30],[10],[10],[27],[45],[30],[10,14],[10,14],[4,7,11,40,42],[42],[3,26],[3,12,28,34,36,38,41,42,45],[2,13,16,22,35,37,40,44],[0],[4],[45],[34],[21],[1,7],[7],[17],[3,13,35],[8,23,42,45],[44],[35],[15],[31],[25],[9],[16,35],[41],[20],[10,29,30],[24,31],[8,27],[39],[4,6],[29],[1,5,19,29,33,37],[27],[4,16,29,44],[16],[29],[26],[2,22,26,29],[29,32],[29],[17],[6],[24,25],[30],[6,32],[6],[26],[44],[44],[29],[2,8,12,15,23,25,27,33,35,41],[31],[1],[12],[7],[5,24,27],[7],[32],[16,33],[2],[8],[12],[4],[41],[42],[11],[8,40,41],[34],[45],[43],[19],[20],[11],[39],[3,5,24,32],[5,34],[17,18,31,36,37,40],[23],[26],[19],[31],[31],[44],[44],[1,36],[6,17,18,27],[22,25],[5],[25],[9],[1],[20],[5],[7,10,15,37],[28,29,30,44],[6,14,17,18],[1,25,43],[39],[39,42],[42],[19],[25],[0,1,18],[14],[44],[17],[6,17,18,23,29,30,40,41],[4,29,41],[2,19],[16],[21],[1,2,41],[24],[19],[11],[10,28,38],[24],[10,36,39,44],[10,14,16,26,28,35,36,37,39,42],[9,12,14,16,35,37,42,44],[39],[16],[8],[10],[10],[20,21,22],[20],[16],[17],[6,11,14],[8],[9,10,16,42,43],[6,7,9,12,13,14,15,18,30,34],[10,17],[36],[6,42],[14,28],[9,23,28],[10],[2],[16],[5],[6],[11,31],[5],[23],[23,38],[38],[27],[7,8],[12],[28],[27],[29,41],[3,13,24,31],[5],[1],[39],[15],[5],[31],[43],[28],[10],[28,29,37],[40],[15],[15],[12,15],[35],[41],[11],[27],[43],[25],[34],[16],[4],[0,1,2,4,5,9,15,16,21,30,31],[24],[7],[8,13,29,33,43],[0,2,3,6,13,15,23,30,32,34,37,38],[6,27,44],[3,12],[12,29],[1],[30],[5],[1,4,6,8,9,10,11,13,15,16,17,20,21,22,26,28,30,31,33,45],[8,15],[30],[15,33],[1,6,7,8,9,11,16,20,45],[32,43],[43],[0],[43],[32],[27],[6],[1,6,10,14,33,44],[14,15],[36],[7],[8,16,19,29],[34],[1],[24],[10],[39],[35],[7,18,35,42],[29],[33],[20,40,42],[17,21],[1,20,28],[2,12,42],[16],[10,20,37,42,44],[3],[21,26,42],[5],[0,13,43],[6,18,23,25],[23],[11],[43,45],[43,45],[8],[45],[44],[44],[33],[26,33,36],[28],[0],[45],[41],[2,37,43],[6],[15],[14,29,30,42],[5],[4,5,19,21],[5],[30],[10,34],[41],[31],[3],[17,20,27,32],[20],[29],[0],[31,38,40],[2,11],[11],[7,13,33],[6,31,34,37,39],[5,33,38],[1,4,28],[4],[3,11,17,42],[44],[13,38,39],[26,27,28,29,30,32,33,37,38],[0,27,28,30,33,41],[37,38],[31,32],[41],[6,36],[29],[44],[2,27,30,43,45],[34],[5],[11],[19],[0,14],[0,4,30,42],[19,22],[30],[11],[3,32],[28],[3,26],[40],[8],[6,10,27,29,37,41,44],[7],[30,34],[8],[2],[15,25,36],[24,25,41],[5],[2,6,22],[3],[26,29],[2,41],[8,22,26,35],[19,20],[2],[0,10,11,15,16,23,28,36,37,40],[14],[4,18,26,36],[4,20],[23,24,34],[37],[38],[24],[32],[31],[43,45],[4,7,8,19],[8,15,23],[42],[5,10,13,14,18,23,27,30,31,34,35,36,44,45],[0],[18,21],[0],[9],[43],[1,2,5,22,23,25,29,31],[2,12],[29],[3,34],[13,39],[7,13,25,35,36,40],[13,32],[40],[3],[2,3,10,11,16,18,21,23,26,28,31,33,35,43,44],[13],[0,7],[6,11],[0,2,3,31],[0,32],[12],[2,7,23,31,32,33,35,36,43,44,45],[3,4],[42],[45],[19],[44],[5,35,42],[0,1,2,3,6,8,12,16,22,26,29,44],[32,38],[40],[30,34],[22,25],[32],[10,17,25],[14],[39],[10],[15,19],[38],[28,44],[12,35,37],[0,4,12],[0,8,11,41],[45],[6],[0,4,6,13,14,16,17,18,20,26,28,31,37,42,44],[6,10,14,17,27,32,37],[15,32],[1,5],[0,18,33],[1,2,11,12,16,20,21,42],[3],[20],[22,23,33],[1,29],[28],[1],[26],[10,11,14,27,35,37],[32],[18],[30],[1,17,35],[21],[1],[1],[45],[0,1,4,5,10,31],[15],[41],[6,23,24],[27],[29],[2],[23],[1],[19],[32,44],[13,32],[4,22,32],[5],[5],[7],[13],[16],[1],[26,28],[15,22,24],[21,34,41,44],[31],[36,41],[29,44],[13],[41],[29],[0,1,4,6,7,8,9,11,17,22,23,24,25,26,30,31,34,35,37,42,44],[14],[6,8,13,14,15,19,20,21,22,23,24,25,26,28,30,31,32,33,36,40,41,42,45],[13,33],[7,33],[11,26,27,37],[3],[6,22],[0,2,4,5,9,13,15,17,20,32,42],[29],[19],[20],[1,2,4,6,11,15,16,39,40],[1],[20,26,36],[5,32],[12,16,35,43],[26],[9,25],[19],[30],[7],[8],[8],[12,24,32],[3,5,12,13,17,25,27,29,33],[2,15],[30],[8,42],[16],[26],[30],[37],[0],[11],[20],[23],[40],[42],[2,5,11],[22,32],[11],[20],[15],[1],[2],[0],[34],[36],[21],[19],[0],[7,9,13],[37],[7],[21],[20,25],[25],[0,1,2,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44],[9,11,16,17,30,36,42],[3,23,41],[4],[40],[38],[0,4,13,18,19],[3,5,28],[0,2,19,41,45],[5],[41],[21],[39],[2,10,37],[0],[29],[11],[19],[30],[2,18],[5,14,43,45],[30,33,38],[5,40],[1,12,29],[33],[15],[0,1,23,41],[16],[16],[31],[0,1,2,3,4,5,6,7,8,9,11,12,13,14,18,19,20,22,23,24,25,26,27,28,29,31,32,33,34,35,36,37,38,39,41,43,44,45],[5,10],[30],[3,30,33],[31],[24],[24,26,28,34],[26],[29],[0,1,2,3,4,5,8,9,10,11,15,16,19,20,22,24,25,26,27,28,31,32,34,35,37,41,42,45],[10],[41],[0,1,13,19,23,28],[34],[20],[3,6,10,22,34,41],[6,7,14],[15],[2,33,38],[6],[2],[18,42],[13,29,37],[9],[9],[0],[13,42],[7],[14],[2],[15],[1,29],[2,16,20,42],[21],[6],[41],[1],[12,26,34],[1,12],[2],[37],[2,3,13,16],[19],[26],[4],[6,18,25],[12,23],[4,11,13,16,19,22,28,33,35],[21,40],[5],[17,18],[1,19],[0,4,6,8,11,14,15,18,19,20,22,23,33,34,36,38],[0,2,35],[10,11,21],[12,25],[7],[9,22,24],[6,19,22],[31],[0,1,3,4,10,11,12,14,19,20,22,27,30,31,34,37,40,42,45],[6,15,34,43],[12,15,16,23],[5,12,39,40],[5,7,21,22,24],[16,19],[0],[28],[1],[4],[21,23,29,34,38,39,45],[24],[4],[2],[45],[45],[22,25],[25,28],[20],[4,17,20,21,40,45],[9],[2],[16],[14],[5],[28,29],[34],[33],[17,23],[20,21,26],[15,34],[20],[26],[11,12,13,16,18,35,40],[2,9,13,15,36,38],[3,16,24,27],[26,45],[20],[29,37,43,45],[38],[22],[12],[2],[3],[26,41,44],[6,34],[12],[35],[33],[23],[6,10,21],[17],[1],[7],[6,19,26],[1],[27,28],[1,45],[22],[0],[3],[8],[26],[11,16],[6,21,23,24,29,36],[41],[18],[17],[3,41,44],[12,24],[24],[24],[4,7,15,31,35],[12],[32],[3,5,6,28],[42],[4,9,12,14,16,17,20,21,22,26,37,41,42],[28],[4],[0,3,8,19],[10,43],[22],[24,29,33,39,41],[10,39],[6],[30,33],[16,17,43],[10,19,27],[23,31],[7,14,35,40],[4,15,31,40,44],[23,24],[25],[1,5,12,28,32,41,42],[32],[11,12,18,31,44],[1,9],[43],[43],[28],[2],[0,1,2,6,7,9,10,12,14,18,21,24,25,26,27,28,29,33,35,37,40,42,44],[10,19,20,25,30,39,45],[5,24,29],[2,32],[7,8,19,42],[40],[9],[3],[3,12,26],[22],[17,34],[13,15],[9],[20,22,38,40],[24],[30],[10],[24,43],[24,31],[22],[22,45],[24],[10],[17,18],[11,13],[34],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,38,39,40,41,42,44,45],[34],[11],[0,4,5,6,8,9,13,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,36,40,42,44,45],[33],[10,17,21,25,26,32,35,42],[27,43],[35],[38],[31],[7],[10],[7,14],[1],[2],[44],[4,14,19,30,40,42],[25],[8],[44],[32,34],[29,38],[35,36,39,41],[4],[0,4,5,6,8,11,12,15,16,17,18,19,20,22,23,27,33,35,37,38,40,41,42,43,44,45],[8,11],[6],[5,22],[5],[5],[37],[24],[0,18,40],[39],[43],[40],[8,17,34],[15],[6],[44],[6,8,38,44],[4],[16],[36],[3],[3,6,33,42],[33],[45],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45],[41,45],[24],[41,44],[35,42],[32],[23,34],[3],[40],[17,20],[0,4,10,14],[42],[44],[16,29,40,41,42],[0,3,4,42],[13],[4],[16],[27,38,39,41],[11],[4,5,9,11,16,19,20,27,41],[8,20],[16],[0,29],[9,42],[20],[20],[6],[33],[5],[5],[6,10,14,35],[41],[19],[0],[14],[19,34],[7],[17],[0,1,2,4,10,17,28,31],[43,45],[45],[25],[5,25],[22,25],[13],[9,12,13],[12,35],[3],[43],[29],[3],[6,27,36],[30],[6,27,44],[10],[32],[5,36,37],[7,16,32,39],[11],[0,1,2,3,4,5,10,16,19,25,26,27,28,30,32,37],[4,6,12,14,16,22,31,32,33,35,36,42],[10,20,21,37],[17],[32,45],[24],[6],[21],[1,9,21,38],[5,11],[34],[34],[22],[32,40],[38,44],[20,44],[21],[1,2],[29],[28],[28,33],[34,44],[2,3,4,6,7,9,10,11,12,13,14,18,19,21,22,23,25,26,27,28,29,30,33,36,38,41,42],[24],[38],[41],[45],[0],[2],[20],[39],[12,43],[0],[0,1],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45],[3,6,10,21,32,35,37,39,42,45],[44],[39,42],[41],[0,1,2,3,5,6,7,8,10,11,12,13,14,15,16,17,18,19,21,22,23,25,28,29,31,32,34,35,36,37,39,41,42,43,44,45],[18],[0,2,12,30,32,34],[2,3,6],[2],[25],[27],[37],[17],[0],[6],[28,31,34,40],[7,24,31,32],[7,40,41],[30],[31,34],[18],[2],[1,2,4,5,6,7,8,9,11,12,13,15,16,21,22,23,25,26,28,30,32,35,38,44,45],[41],[0,3,24,27,38],[20,21,22],[43],[2,5,13,15,18,19,28,29,31,32,38,43],[10,12,16,38],[0,1,5,6,7,8,9,12,14,15,16,21,24,27,28,31,37],[6,7],[6],[5,6],[17],[23,24,34,38],[18],[23],[13],[10],[24],[5],[1],[17],[23],[17,31],[39,40,42],[5],[39],[17],[0],[6],[36],[0,1,10,18,21,22,23,25,33,35,42],[2],[18],[27,34,43],[43],[6,14,42],[2],[6,44],[37,41],[16],[41],[2,26,45],[1],[6],[34],[15,16],[13,26,42],[3,4,5,40],[1,7,16,27],[20,41,44],[4,5,8,11,13,15,17,32,35,37,41],[2],[5,11],[5,22],[0,1,4,5,6,7,8,9,11,12,14,15,17,20,22,24,25,30,31,32,33,34,35,36,42],[30],[6,13],[36],[33],[2],[37],[19],[0,7,9,10,13,18,19,20,21,25,26,30,32,33,36,37,38,40,43],[1,11,16],[45],[4,10,16,21,24,26,29,31,38,41,45],[9,15,20,21],[1],[9],[13],[0,3,6,8,10,11,17,26,28,29,30,33,42,45],[14],[2],[1,2,3,4,8,10,11,12,14,16,20,21,25,26,27,28,29,30,31,33,34,41,44,45],[5,17,22,27,37,42,43],[33],[32],[4,21,24,26,41],[3,4],[12,18,21,24,44],[24,25],[0],[13],[19,39],[10,30,33,38],[45],[7,10,35],[6],[18],[17],[3,6,7,10,21],[12,43],[3,16,29,33],[30],[2,10,18,33,37],[3],[3],[25,29,30],[18],[31,34],[22,31],[18,21],[0,31],[18],[1,3,4],[20],[3],[12,37],[27],[29,30,39,42,45],[27,30],[14,22,24,25,29,33,34,38,42,45],[28],[30],[9,12,13,16,17,21,24,27,28],[20],[3,10,27,30],[42],[25,30,41],[6,24],[3,8],[0],[19],[2,3],[16,18,20,21,27,28],[14,38],[0,3,5,6,7,9,10,11,12,14,15,18,19,21,22,25,26,30,32,34,35,36,39,41,42],[27,33,37,40],[39],[38],[3],[3,8,21],[4,43,45],[23,33],[30],[11,29,30,40],[21],[0,1,4],[10],[0],[36,38],[31],[0,9,16,17,23,29,30,32,35,41],[6,19,21,24,32,33,36,42,45],[4,13,14,41],[35],[19,36,38],[2],[3],[2,20],[0],[5],[33],[22],[5],[1,4,24,26,28,30,33,44],[1,8,27,29,36,41],[22],[17],[37],[27],[41],[31],[22],[8,37],[34],[1,22],[19,23],[19],[3,5,6,8,11,12,21,26,30,35,43],[10,11,14,18,32,41,45],[14],[36,38],[29],[5],[19],[1,3,4,5,6,7,9,10,12,14,15,16,17,18,19,20,21,26,27,31,33,35,37,38,40,41,42,44],[12],[0,1,3,4,10,12,13,14,15,22,28,42,45],[43],[1,19],[6,8,32],[10,43],[2,4,7,8,13,17,21,32,34],[1,19],[43],[1,6,10,38],[3,25],[41],[2,12,13,38,44,45],[1,6,12,15,25,29,36],[4,21],[10,26,34,37],[2,12,14,15,32,37,43,45],[29],[15],[10,37],[15],[21],[4,28],[10],[6],[18],[11,18,19,22,28],[31],[5,16,21,29,37,39,41],[13,35,36],[28,33],[4],[0,19,41],[17,19,27],[0,1,4,5,10,12,14,18,19,27,30,34,35],[43],[9],[24],[28],[43],[1,4],[24],[2,4,32,36,38],[7],[2,8,12,27],[4],[35],[21],[16,33,37],[33],[28],[1,5,16,21,29,32,37],[2,14,41],[4,15,31],[26],[26,41],[30],[16],[29],[4],[14],[17],[19],[36],[36],[1,30],[40],[32],[16,32],[28],[4,16,21,30,33],[41],[0],[28],[12],[1,30],[1],[0,4,5,9,11,13,15,16,22,23,25,28,31,34,42,43,45],[11,25],[0,1,8,11,19,21,22,23,24,25,31],[29],[41],[2,21,40],[30],[7],[9],[13],[13],[18],[24],[8,18,21,24],[4,20],[41],[12],[21],[0,3,12,31,33],[0,3,31,34],[3,4,5,6,7,10,12,13,14,16,17,18,19,20,21,25,26,27,28,30,32,33,34,35,36,38,42,43],[10],[5,8,26,34],[1,3,11,15,21,26,33],[1],[40],[7,11,36],[28],[16],[11],[1,2,3,8,11,18,22,28,38,41],[5],[44],[7],[10],[0,1,2,3,4,5,7,9,19,25,30],[13],[4,5],[1],[21],[18],[39],[9],[0,6],[4,12,20,21,38],[21,32],[0,1,2,3,6,7,8,9,10,11,12,13,14,15,16,17,20,21,23,24,25,26,28,29,30,31,32,38,40,42,44],[4],[33],[20],[5],[26],[15],[1],[8,12,18,23],[0,35],[17,29,36],[1],[30],[11,34],[36],[24],[3,8,15,39,44],[14,29],[2,6,16,30,39,45],[15,17,42],[42],[28,31,32,33],[4,6,7,8,15,31,42,44],[32],[38],[16,30,34],[2,27,32],[28,34],[4,13,15,30,39],[10,14,27,28,29,33,36,39],[6,7,8,13,14,15,35,36],[9],[39],[9],[36],[8],[8],[6,14,35],[7,30,37],[0,15,20,27,28],[1,5,6,17,22,25],[17],[2,22,25,34],[9,18],[8],[3],[1,2,3,19,22,25,28,29,30,32,33],[22],[15],[6,16,19,21],[4,8,18,19,21,34],[1,30,37],[12],[26],[2],[5],[34],[13,15,26,41],[3,28,45],[1,10,14,30],[34],[3,4,12,29,35,36,41,43,45],[1,2,3,4,5,6,7,8,9,11,12,13,14,16,17,18,19,21,24,28,29,30,31,34,36,37,38,39,40,41,43,44],[26],[17],[34],[5],[39,43],[24,37],[30],[25],[0],[4],[2],[11],[2,11,38],[3],[3],[3],[25,38],[17],[0],[21],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45],[15,20,28,42,44],[26],[6,7,29,31,38,42],[14,40,41],[0,2,3,8,30],[27],[26,29],[4,5,7,12,14,16,23,24,31,32,34,37,44],[17],[17],[10],[0,1,4,5,6,7,8,9,10,11,12,14,15,16,17,18,19,20,21,22,24,25,27,28,30,32,33,34,36,37,38,39,40,41,42,43,44],[0,3,9,43],[1,2,4,11,12,17,18,21,25,29,31,34,38],[12,15,24,29,34],[0,14,35],[16],[1,2,3,5,12],[1,8,13,17,36],[16],[5,30],[22,24],[2],[17],[23],[2,3],[8],[12],[19,23,25],[21,29],[24],[29],[9,42,45],[4,15,34],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,15,16,17,19,20,22,23,24,25,26,27,28,30,31,32,33,34,35,36,37,38,39,40,43,44],[0],[2],[41],[0,2,18],[6],[2,10],[1],[0,2],[0,7],[20,27],[0],[6,31],[3],[4,5,6,11,18,19,22,29,31,34,37,42],[0,1,2,4,5,9,12,13,16,21,33,37,40],[6,27],[0,6,18,30],[11],[1,3,4,6,9,10,11,12,16,20,24,29,30,37,42],[5],[11,15,29,36,40],[12,25],[25],[24,25,34],[23],[14],[0,33],[25],[0,4,5,13,14,15,17,20,22,23,24,25,26,27,30,34,42],[27,32,43],[5],[29],[2],[17],[44],[31],[1],[0,2,3,9,12,17,22,23,32,34,37],[28],[32],[39],[13],[34],[39],[25],[0,1,2,4,5,6,7,9,10,13,15,21,22,23,24,25,27,28,30,31,32,38,40,42,43,45],[7],[28],[12],[41],[12],[10],[15],[15],[11,15,16,20,21,22,33],[16],[15],[7,13,20,30,32],[12,40,43],[14,17],[27,30],[20],[13,15,19,41,45],[5,16,17,18,21,27,33],[5,17,18,23,28,34],[28],[6,13],[16],[28],[10,11,37],[22],[30],[13,45],[13,15,37,43],[11],[15],[2,7,10,15,20,22,27,31,34,37],[7],[4,7,8,14,30,35],[13],[30],[18],[11],[33],[7,9,26,35,36,38,39,41],[7,9,14,35,36,38],[3,17,19],[28],[0,1,3,4,5,8,9,11,12,13,17,21,24,26,27,28,30,32,33,34,37,40,41,42],[19,20],[33],[29,32,33],[1,32,33],[9],[19],[17,18],[11],[7,40,45],[40],[14,35,36,39],[14,35,42],[43],[3],[22],[0,5,7,11,20],[9,29,30,45],[40],[11],[5,20],[12,16],[35],[0],[21],[7],[17],[10],[21],[21],[31],[6],[13,15,20],[24,36],[17],[45],[13],[25],[3,25,27],[14,42],[6,14,35],[34,43,45],[35],[0,10,24,26],[20],[15],[24,25],[1],[1,9,22,28],[40],[2,5],[29,41],[34],[2,25],[23,45],[45],[43],[3],[9],[4,29],[16],[0,7,15,42,43],[30],[0,2,21],[31],[31],[31,34],[1],[37],[41],[3,12,24],[2,14],[36],[25],[34],[0,1,2,3,4,6,9,12,14,15,16,17,18,21,24,26,28,36,38,42],[13,36,40],[41],[15],[8,11],[3],[12],[9,28],[9],[4,7,8,14,20],[8,25],[2,22],[1,4,8,15,38],[25],[38],[23],[23,24,25],[21],[25,43],[14,35],[44],[24],[10],[10,37],[5,9,28,29],[9],[13],[29],[38],[3,4,18,24,31,32,40],[38],[10],[25],[22],[6],[0,3],[18],[5],[26],[35],[21],[6,18,40],[3,6],[26],[29],[3,27],[33],[8],[19],[31],[20,41],[1,2,5,34,38,41],[30,31],[4,34],[34],[7,12,13,15,19,20,25,28,34,39],[1,4,11,18,21],[7,21,35],[4,18,24,34],[3],[3,6,16,39],[21,36],[41],[18,21],[3,24,45],[27],[3,41],[40,44],[17],[12,27],[10],[1,3],[20],[0,2,6,7,8,9,10,11,12,13,14,15,16,19,20,21,23,25,28,29,30,31,32,34,44],[39],[5],[22],[25],[16],[19],[20],[2,29],[2],[42],[38],[0],[12,39],[27],[39],[22,27,30,31,39],[37,44],[24],[24],[44],[27,39,41],[33,44,45],[21,35],[30],[13,45],[43],[6,17,36],[8,33],[5,35],[4,45],[11,32],[15],[13],[8,15],[3],[3,22],[34],[3],[3],[3],[6,18,21,27,31,33,36],[0],[27],[0,29],[5],[10,16,37,40,43],[43],[20],[8],[10,16],[26,33],[23,34],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,19,31,32,33,34,35,36,40,43,44,45],[23,34,40],[4,5,7,8,29,33],[8,41],[2,20,30],[41],[29],[19],[28],[1],[20,42],[7,20],[11,25],[34],[25,34],[5],[36],[7,11,13,15,16,17,18,23],[7,19],[34],[24],[1,3,4,6,11,21,25,27,33,39,40,42,43,45],[24],[25],[1,3,8,9,11,12,17,18,20,21,26,31,37,39,41,45],[8,32],[18],[32,40],[36],[39],[9,36],[33],[10,13],[0,1,2,3,4,5,7,8,11,12,14,15,16,17,18,19,20,24,26,30,31,32,34,35,36,37,38,39,40,42,43,45],[16,30],[13],[36],[44],[12],[28],[20,22,24],[3],[6],[9],[12,21,22,37],[31],[35],[9],[33],[7],[19],[7,22,29],[11,37],[5,12,28,45],[17],[26],[7],[6],[6],[13],[34],[12],[4,36,40],[9,30],[6,21,37,38],[12,39,44],[21,34],[19],[19,20],[17],[38],[36],[14],[16],[44],[31],[42],[24],[7],[7,10],[9],[26],[2],[3],[28],[29,36,39,41],[41],[41],[6],[6],[36,40],[11],[15],[27,31,42],[4,8,11,15,24,25,44],[14],[45],[3],[20],[11],[6,7,30,36,39],[14],[7,14],[14],[27],[28,30,34,44,45],[33],[27,28,32,33,34,41,45],[26,27,28,30,33,38,39,44],[5],[5,12,15,20,33],[6],[34],[19,34],[19,27,28,30,31],[33,38],[3],[0],[0,34],[14,26],[0],[22],[22],[9,12,18,37,44],[35],[3,44],[2,30],[45],[0,17,20,27,32,37,38],[30,32],[7],[15],[4,6,11,14,17,21,34],[34],[6,19,21],[18],[23],[35],[28],[1,2,4,6,11,15,16,26,39,40,44],[9,10,38],[33],[9,13],[21],[26],[16],[22,35],[3],[17,24],[38],[3,16],[36],[2],[0],[12,29],[30,32],[34],[0],[13],[25],[6],[39],[41],[1,38],[20],[4,45],[0],[31,32],[20],[20],[6,11,13],[2,7,8,13,15,23,25,31],[10,22,33],[12,35],[3],[25,26],[43],[26],[18],[23],[2,42],[1,4,14,29,35,37,39],[26],[9,23],[4,7,8,14,15,24,25,35,36,39,45],[11],[14],[8,15,23],[6],[21],[1,5,10,11,16,19],[5,30,32,33,37],[37],[37],[18],[1,2,18],[5,32],[27],[2,3,6,7,8,14,22,27,29,30,35,36,39,40,41,42,43,44,45],[42],[0,34],[0],[0],[0],[24],[24],[23,24,25],[10],[37],[20,26,36],[20],[26],[39],[17],[5],[23,33],[31],[27],[31],[7],[1,2],[0,1,2,3,4,9,11,12,16,35],[25,34,42,45],[22],[0],[22],[27],[2],[0],[23,44],[14,35],[27,40],[24,26,41,44],[18],[6],[36],[4,7,9,10,15,25,26,29,32,34],[26],[33],[3],[32],[24,26],[31],[0,8,12,17,20,22,24,26,43],[20,32],[37],[4],[44],[22,27],[7],[10],[31,40],[8],[2],[24],[8],[1],[22],[24],[10,37],[10,37],[32],[18],[10],[14],[21],[24],[9,25,29,33,44],[32],[0],[2,5,7,9,11,13,16],[15],[33,45],[42],[41,45],[13,30,32,34],[3],[10,35],[13,16,32,33],[2],[11,12],[2,3,13,15,18,27,28,29,35,36,39,41],[3],[19,21],[0],[2,22,26,27,28,30,43],[9,18,35,37,40],[7,9,13,14,35,36],[2,19],[15],[14,17],[41],[26],[0],[13],[29,32],[22],[2,6,12],[14],[1,2,9,18,19,43],[8],[5,13,22],[1],[41],[23,24,31],[26],[9],[19],[4,29,30,35,39],[14,22,26],[5,13,37,40],[11,39],[9,21,26],[4,5,10,13,19,20,21,34],[45],[5],[23,25],[7,8,15,25,31],[2,16,17,42],[26],[3,9,23],[4,5,16,26],[35,36,39],[3,11,12,15,18,20,35,37,45],[2,24,25],[17],[8,22],[1,34,39,43,44],[12,40],[1,2,4,5,7,8,10,11,12,13,17,18,20,22,23,28,31,33,35,43],[8,10,19,25,27,30,32,36,39,45],[0,4,9,20,25,29,31,33,34],[27],[21],[40],[11],[2,17,20,31,32,42],[4],[32],[4,6,7,10,13,19,20,23,30,32],[4,7,8,9,15,21,32,37,41,44],[43],[0,30],[13],[37],[1,2,4,6,11,16,22,28,42],[20],[2],[20],[43],[1],[1,13,22],[4,16],[16],[0],[1,2,12,24,42,43],[27],[29],[34],[7,17,21,31],[34,40],[2,22,30,43],[43],[2,5,17,18,19,35,38,45],[42],[1,2,26,33,38,42],[7],[1,35],[22],[25],[0],[24],[13],[36],[18,34,45],[3,8,16],[0,2,4,30,42],[25,27],[0],[23],[14,20,24],[9],[10],[15,33],[6],[26],[1,2,4,7,8,10,12,21,22,24,25,37,39],[33],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45],[37],[12,16],[30],[22,30,32,33,34,36,37,42],[41],[43],[3,16,35],[42],[35],[24],[39],[23,31,36,39],[31],[26],[42],[10],[4,5,38],[5,22],[2],[5,38],[6,7,12,14,16,20,26,33,43],[2,7,11,21,31,36],[3,5,18,19,25],[4,8,24,28,35,44],[8,31],[7,44],[34],[34],[32],[26,34],[19],[1,11,20,21,36,38,40],[3],[6,16],[18,40],[2],[17,18,20],[2],[2,5,17,18,22,41],[10],[35],[1,4,6,12,16,17,18,32,43],[26],[43],[43],[6],[1,17],[17],[45],[10,26,30,37],[42],[5],[20],[11],[4,42],[39],[9,22,34,40],[14,25],[12],[0,6,7,26,34,35,38,40],[8],[7,23,39],[0,26,32],[41],[2,4,20,25,26,33],[20],[15],[16,22,23,26,37],[23],[22],[33],[21,44,45],[21],[43],[19,22],[14,35],[23],[31],[5],[1,24],[26],[15],[15],[41],[2,5,8,11,15,22,26,36,42,44],[11],[8,35],[21],[28],[0,4,9,16,18,26,33,39],[11],[33],[27],[35],[20],[38],[2,7],[13],[15,18],[39],[32],[7,14],[0,5],[3,23],[20,25],[1],[20],[1],[9,13,15,22,27,31,43,45],[7,13,16,30,33,35],[7,24,32,34],[3,10,14,24,44],[24,31,37],[1,2,4,10,41],[2,19,44],[21],[14],[21],[4],[3],[43],[9,10,27,28,30,32],[22],[12,17,21,31,32,33],[22],[14],[44],[43],[39],[34],[5,16,26,32,41],[9],[30,35],[13,22],[21],[8],[6],[5,7,13,39],[5],[10],[3,15,20,26,33,37,43],[44],[25],[26,27,29,35,36],[30],[24,31,34,39,44],[5,39,45],[8],[7],[40],[15],[8,9],[0,10,24],[8],[8],[20],[0,22],[27,33],[26],[28],[0,42],[42],[17],[23,25,31],[44],[22],[11],[44],[21],[21],[36,39],[6],[43],[1,2,3,8,15,21,31,33,34,35,42,44,45],[20],[15,23,31],[2],[4,6,7,8,10,13,14,15,24,28,29,32,35,36,37,39,41,42],[6],[10],[42],[0],[0],[17,33],[18],[15,34],[7,38],[17],[1,2,5,21,24,35,40],[1,2,12,17,19,20,21,25,26,28,38],[16],[1,26,35],[2],[5],[6],[3,5,6,9,17,22,30],[1,4,8,15,16,22,23,25],[12],[18],[33],[7],[36],[3,24],[31,39],[3],[3],[44],[25],[25],[42],[26],[14,26,35,36,38],[27,30,41],[26],[24],[7],[10],[35],[35],[9,23],[23,31,44],[11,20,24,27,30],[24,25,29,33,38,44],[3,21,27],[23],[1],[1],[18,41],[2],[34],[1,5,11,19,22,30],[1,3,4,6,8,9,11,16,21,25,26,27,32,33,35,37,39,40,42,43,45],[26],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45],[0,1,2,3,9,11,12,13,14,17,18,20,21,22,24,27,28,35,37,45],[0,1,6,9,13,18,22,24,26,27,31,42],[29],[37],[17,26],[1,2,4,5,6,7,8,9,11,12,13,15,17,20,23,25,27,29,31,34,35,37,40,42],[19],[20],[8,42,45],[1,8,12,29],[1],[1,11,12,16,19,28,32,33,37],[34],[0,2,4,6,14,22,25,26,31,32,33,35],[0,4],[0,1,2,3,6,7,13,15,16,22,24,29,35,41,44],[41,43],[0,1,2,3,4,5,6,7,8,9,11,12,13,14,15,16,17,18,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,37,38,39,40,41,45],[37],[12,42],[3,8,20,21,24,26,29,30],[32],[3,11,13,29,44],[1],[5,10,37],[11],[10],[5,25,26],[0,1,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45],[2,6,7,8,9,10,15,16,18,20,21,23,25,27,30,34,36,37,44],[18,22,28,43],[30],[27],[7,39],[0],[13],[0],[1,25],[41],[40],[4,8,19,20,21,24,29,36,38],[6],[7],[0,3,8,15,18,24],[5],[10],[27,29,39],[21],[28],[24],[0,2,5,10,11,12,13,14,16,17,18,19,20,22,24,26,27,28,30,34,37,38,42,44],[16],[36],[44],[3],[2,6,14],[0,17],[13],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45],[0,8,18,28,33],[22,25],[31],[40],[2,13],[7,12],[30,36],[16,37],[19,32],[6],[23],[6,8,19,26,36,43],[28,33],[1],[5,28],[20],[21],[16,43],[8],[3,11],[24],[5,7,16,17,21,23,24,25,27,28,31,33,35,37,44,45],[23],[25],[7],[18],[5,8,18,20,30,37],[1],[7,9,30],[26,29,41,44],[22,23,25,37],[24],[0,2,4,6,10,19,20,24,25,26,35,40],[0,1,37],[42],[29],[16,39],[37],[2],[6,40],[35],[30,33],[33,38],[5,19],[19],[19],[5],[1,2,4,18,21,28,32,44],[14,43],[0,2,33,45],[13,28],[29],[11],[4],[6,11],[26],[21],[13],[1],[45],[24],[15,16,18,27],[5],[26,28,29,32,43,45],[44],[24],[25],[24],[2,4,5,17,18],[23],[14],[6,7,25,30],[8,11,18,25,28],[9,14,21],[27],[1,2,10,13,14,25],[2,25,34],[4],[2,19,21,22,38],[16],[13],[28,32],[34],[13,17,18,21,29],[1,32],[16,30],[29],[4,8,17,18],[19],[0],[31],[9],[4,8,9,19,20,21,24,34,40],[17],[23,31,38],[21],[0,4,9,16,17,18,19,22,24,30,40],[41],[13],[1,19,20,36,41],[3,17,21],[17,29,38],[5,16,19,20,22,23,25,32,37,38],[9,27,28,33],[14],[10],[0],[43],[8],[20],[44],[43],[14],[1],[19],[2],[43],[22],[15],[20],[8,10,19,20,35],[3],[1,4,7,9,10,16,17,20,21,22,26,28,40,45],[4,9],[22],[4,8,9],[23],[24],[1,5,11,30],[28,30],[6,9,10,15,25,26,27,28,30,34,37,38,39,40,41],[5,18,40,43],[4,11,20,22,23,24,25,27,29,30,31,32,44],[1,23,24,26,27,28,40,41,44],[7,9,28,29],[1,5,9,13,17,19,26,28],[41],[2,10],[17],[17,18,20],[4],[1,19],[23],[44],[15],[0,8,42,43],[25],[9],[5],[8],[0,2,8,14,43],[43],[16],[2,16,43],[18],[18],[41],[7,13],[29],[42],[18],[7,19,30,31],[4,6,7,8,10,14,19,21,24,27,33,34],[12,14],[36],[11],[42],[3],[3,5,14,21],[5],[23],[7],[3,13],[5],[35],[5],[5],[5],[7],[1],[19,30],[45],[1],[1,5,10],[44],[36,39],[41,44],[8],[34],[27,38],[7,16,24,34],[3],[30],[12,27,29,32],[44],[8,10],[11],[1,45],[1,3,5,10,11,12,20,21,22,24,25,27,28,32],[1,26,31,41],[0,1,2,3,4,5,6,11,12,15,16,18,19,29,30,35,39,43,44,45],[26,27,34],[45],[0,6,8,9,21,32,37],[28],[34],[30],[30],[9,22,32,35],[9],[14,17,27,29,45],[41],[16],[10,31],[13],[0,1,2,3,4,5,6,8,11,12,13,16,17,18,19,20,21,24,25,26,28,31,32,33,34,37,43],[22],[40],[0,2,3,4,5,6,7,8,9,10,14,15,17,18,20,23,25,26,28,30,31,32,34,35,36,38,39,40,42,44],[0,1,3,4,9,11,13,14,15,16,17,18,20,21,23,25,28,29,31,34,35,36,37,38,40,43,45],[5,7,9,10,11,15,16,31,32,34,35,37,39,41],[0,3,4,5,9,13,15,19,20,21,29,35,40,42,45],[1,2,5,6,7,12,15,16,18,20,21,25,26,29,30,32,36,37,41],[39],[0,2,4,7,10,18,20,21,27,28,32,38,42],[2],[4,16],[21,32,34],[1,2,8,12,16,22,42,45],[25],[42],[0,2,4,8,11,15,23,35,40,42],[17],[40],[4,8,23,25],[0],[14,22,35],[6,14,25],[1],[7],[0,1,3,4,5,7,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,38,39,40,41,44,45],[31],[27,33],[15],[36],[3,13,14,16,20,33,34],[0,3,5,6,11,12,19,22,32,33,34,38,42,44],[32],[17],[20],[2,17,21,31],[0,4,6,8,20,28,33,40,44],[32],[18],[0,1,2,4,7,14,16,18,21,22,27,31,35,45],[41],[27,35,44],[4,6,8,15,30,39],[44],[44],[39],[41],[6,14,27,30,41,43],[26],[26],[25],[5],[13],[23,31,42,44],[25],[28,38],[20],[43],[32],[31],[17],[31],[2,30,34],[0,2,4,6,8,9,11,13,14,15,16,17,18,19,21,22,23,25,29,31,33,34,36,40],[10,41],[17],[0,2,9,17,19,21,22,23,31,36],[3,22],[21],[26,41],[16],[40,43],[27],[36]]};
@@ -0,0 +1,36 @@
+import { tokenize } from "@/lib/readingSearch";
+
+export type ChatPassage = {
+  source: string;
+  title: string;
+  text: string;
+};
+
+// BM25 passage index generated by `readings parse --chat-index`.
+// postings[term] is a flat [passage, weight, passage, weight, ...] list with
+// the BM25 weight of that term in each passage already computed.
+export type PaperChatIndex = {
+  chunks: ChatPassage[];
+  postings: Record<string, number[]>;
+};
+
+/**
+ * The k passages with the highest BM25 score for the query, best first
+ * (ties go to the earlier passage). Mirrors bm25_search() in
+ * readings_pipeline/chat.py.
+ */
+export function searchPassages(index: PaperChatIndex, query: string, k: number): ChatPassage[] {
+  const scores = new Map<number, number>();
+  for (const term of Array.from(new Set(tokenize(query)))) {
+    // Own properties only, so words like "constructor" don't hit Object.prototype
+    if (!Object.prototype.hasOwnProperty.call(index.postings, term)) continue;
+    const flat = index.postings[term];
+    for (let i = 0; i < flat.length; i += 2) {
+      scores.set(flat[i], (scores.get(flat[i]) ?? 0) + flat[i + 1]);
+    }
+  }
+  return Array.from(scores.entries())
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+    .slice(0, k)
+    .map(([passage]) => index.chunks[passage]);
+}
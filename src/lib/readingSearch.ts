@@ -0,0 +1,50 @@
+import type { ReadingSearchIndex } from "@/content/readings";
+
+// Same folding as tokenize() in readings_pipeline/search.py: lowercase, strip accents,
+// split on anything that isn't an ASCII letter or digit, drop 1-char tokens.
+export function tokenize(text: string): string[] {
+  return text
+    .toLowerCase()
+    .normalize("NFKD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .split(/[^a-z0-9]+/)
+    .filter((t) => t.length > 1);
+}
+
+// First position in the sorted terms list that is >= prefix
+function lowerBound(terms: string[], prefix: string): number {
+  let lo = 0;
+  let hi = terms.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (terms[mid] < prefix) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+function prefixMatches(index: ReadingSearchIndex, prefix: string): Set<number> {
+  const docs = new Set<number>();
+  for (let i = lowerBound(index.terms, prefix); i < index.terms.length; i++) {
+    if (!index.terms[i].startsWith(prefix)) break;
+    index.postings[i].forEach((doc) => docs.add(doc));
+  }
+  return docs;
+}
+
+/**
+ * Ids (`${groupSlug}/${slug}`) of readings matching every word of the query,
+ * each treated as a prefix. Returns null when the query has no searchable words.
+ */
+export function searchReadings(index: ReadingSearchIndex, query: string): Set<string> | null {
+  const words = tokenize(query);
+  if (words.length === 0) return null;
+
+  let matched: Set<number> | null = null;
+  for (const word of words) {
+    const docs = prefixMatches(index, word);
+    matched = matched === null ? docs : new Set(Array.from(matched).filter((doc) => docs.has(doc)));
+    if (matched.size === 0) break;
+  }
+  return new Set(Array.from(matched ?? []).map((doc) => index.ids[doc]));
+}
@@ -0,0 +1,12 @@
+"""Helpers shared by the test modules (import them with `from conftest import ...`)."""
+
+from readings_pipeline.records import Reading
+
+
+def reading(slug, citation=None, group_slug='ai-architectures', doi=None, title=None):
+    """A Reading with placeholder authors/year/venue; title defaults to the slug's words."""
+    title = title or slug.replace('-', ' ')
+    record = Reading(slug, group_slug, title, "Brown, T.", 2020, "NeurIPS",
+                     citation or f"Brown, T. (2020). {title}. NeurIPS.")
+    record.external_links.doi = doi
+    return record
@@ -0,0 +1,62 @@
+import importlib
+
+from readings_pipeline.cache import ReadingCache
+from readings_pipeline.pipeline import iter_readings
+
+cache_module = importlib.import_module('readings_pipeline.cache')
+
+DUMP = """<Section 1: Foundations>
+
+1. Goffman, E. (1955). On face-work. Psychiatry, 18(3), 213-231. https://doi.org/10.1080/00332747.1955.11023008
+Face-work keeps interaction going.
+
+2. Sacks, H. (1974). A simplest systematics for turn-taking. Language, 50(4), 696-735. https://doi.org/10.2307/412243
+Turn-taking is locally managed.
+
+<Section 5: AI>
+
+3. Ouyang, L. (2022). Training language models to follow instructions. NeurIPS. https://arxiv.org/abs/2203.02155
+RLHF rewards agreeable answers.
+"""
+
+
+def build(tmp_path, content):
+    dump = tmp_path / 'raw.txt'
+    dump.write_text(content)
+    cache = ReadingCache(str(tmp_path / 'cache.jsonl'))
+    records = list(iter_readings(str(dump), cache))
+    cache.save()
+    return cache, records
+
+
+def test_one_reading_edit_reparses_only_that_reading(tmp_path):
+    cache, records = build(tmp_path, DUMP)
+    assert (cache.hits, cache.misses) == (0, 3)
+    cache, edited = build(tmp_path, DUMP.replace("locally managed", "managed turn by turn"))
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert edited[0] == records[0] and edited[2] == records[2]
+    assert edited[1].one_line_summary == "Turn-taking is managed turn by turn."
+
+
+def test_truncated_last_line_is_tolerated(tmp_path):
+    build(tmp_path, DUMP)
+    path = tmp_path / 'cache.jsonl'
+    content = path.read_text()
+    path.write_text(content[:len(content) - 40])
+    cache, _ = build(tmp_path, DUMP)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_unused_entries_are_dropped_on_save(tmp_path):
+    build(tmp_path, DUMP)
+    build(tmp_path, DUMP.replace("locally managed", "managed turn by turn"))
+    assert len(ReadingCache(str(tmp_path / 'cache.jsonl')).entries) == 3
+    cache, _ = build(tmp_path, DUMP)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_version_bump_invalidates_entries(tmp_path, monkeypatch):
+    build(tmp_path, DUMP)
+    monkeypatch.setattr(cache_module, 'CACHE_VERSION', cache_module.CACHE_VERSION + 1)
+    cache, _ = build(tmp_path, DUMP)
+    assert (cache.hits, cache.misses) == (0, 3)
@@ -0,0 +1,55 @@
+from dataclasses import replace
+
+from conftest import reading
+from readings_pipeline.cli import main
+from readings_pipeline.diff import _match_records, diff_readings
+from readings_pipeline.output import write_ts
+
+FEW_SHOT = reading('few-shot-learners', doi="https://doi.org/10.5555/few-shot")
+ATTENTION = reading('attention-is-all-you-need')
+FACE_WORK = reading('on-face-work', group_slug='foundations')
+
+
+def test_doi_matches_across_a_slug_change():
+    renamed = replace(FEW_SHOT, slug='language-models-are-few-shot-learners',
+                      full_citation="Brown, T. (2020). Language models are few-shot learners. NeurIPS.")
+    result = diff_readings([FEW_SHOT, ATTENTION], [ATTENTION, renamed])
+    assert (result['added'], result['removed'], result['moved']) == ([], [], [])
+    [change] = result['changed']
+    assert change['id'] == 'ai-architectures/language-models-are-few-shot-learners'
+    assert change['fields']['slug'] == {'old': 'few-shot-learners', 'new': 'language-models-are-few-shot-learners'}
+
+
+def test_reading_moved_between_groups():
+    moved = replace(ATTENTION, group_slug='foundations')
+    result = diff_readings([ATTENTION, FACE_WORK], [FACE_WORK, moved])
+    assert result['moved'] == [{'from': 'ai-architectures/attention-is-all-you-need',
+                                'to': 'foundations/attention-is-all-you-need'}]
+    assert (result['added'], result['removed'], result['changed']) == ([], [], [])
+
+
+def test_duplicate_keys_fall_through_to_the_next_pass():
+    # Both share a DOI, so the DOI pass can't pair them; their citations can
+    first = reading('first', doi="https://doi.org/10.5555/shared", citation="First citation.")
+    second = reading('second', doi="https://doi.org/10.5555/shared", citation="Second citation.")
+    new_first, new_second = replace(first, slug='first-renamed'), replace(second, slug='second-renamed')
+    pairs, removed, added = _match_records([first, second], [new_second, new_first])
+    assert sorted(pairs) == [(0, 1), (1, 0)]
+    assert (removed, added) == ([], [])
+
+
+def test_added_and_removed_readings():
+    result = diff_readings([FEW_SHOT, ATTENTION], [ATTENTION, FACE_WORK])
+    assert result['added'] == [{'id': 'foundations/on-face-work', 'title': 'on face work'}]
+    assert result['removed'] == [{'id': 'ai-architectures/few-shot-learners', 'title': 'few shot learners'}]
+    assert (result['moved'], result['changed']) == ([], [])
+
+
+def test_exit_status_is_1_only_when_versions_differ(tmp_path, capsys):
+    old, same, new = (str(tmp_path / name) for name in ('old.ts', 'same.ts', 'new.ts'))
+    write_ts([FEW_SHOT, ATTENTION], old)
+    write_ts([FEW_SHOT, ATTENTION], same)
+    write_ts([FEW_SHOT, FACE_WORK], new)
+    assert main(['diff', old, same]) == 0
+    assert main(['diff', old, new]) == 1
+    assert "+ foundations/on-face-work" in capsys.readouterr().out
@@ -0,0 +1,101 @@
+import importlib
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from readings_pipeline.cache import ReadingCache
+from readings_pipeline.pipeline import load_readings
+
+# The package's `ingest_readings` is re-exported lazily; patch the module itself
+ingest = importlib.import_module('readings_pipeline.ingest')
+
+# Small chunks, queues and batches, so a few dozen files exercise every stage
+SMALL = {'concurrency': 2, 'chunk_size': 3, 'window': 3, 'batch_size': 4}
+
+
+def write_files(directory, n_files=40):
+    for i in range(n_files):
+        section = i % 9 + 1
+        readings = "".join(
+            f"{j}. Author{i}, A. (20{j:02d}). Title {i} {j}. Venue. https://doi.org/10.1000/{i}.{j}\n"
+            f"Summary of reading {i}.{j}.\n\nCore idea {i}.{j}.\n\n"
+            for j in range(1, i % 3 + 2)
+        )
+        (directory / f"{i:03d}.txt").write_text(f"<Section {section}: Group {section}>\n\n{readings}")
+    return [str(directory)]
+
+
+def run(fn, timeout=60):
+    """fn() on a thread; fails instead of hanging the suite if it never returns."""
+    outcome = {}
+
+    def target():
+        try:
+            outcome['value'] = fn()
+        except BaseException as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), f"still running after {timeout}s"
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['value']
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_output_matches_load_readings(tmp_path, jobs):
+    paths = write_files(tmp_path)
+    expected = load_readings(paths)
+    assert len(expected) == 79
+    assert run(lambda: list(ingest.ingest_readings(paths, jobs=jobs, **SMALL))) == expected
+
+
+def test_output_matches_load_readings_with_a_cache(tmp_path):
+    in_dir = tmp_path / 'in'
+    in_dir.mkdir()
+    paths = write_files(in_dir)
+    expected = load_readings(paths)
+    cache_path = str(tmp_path / 'cache.jsonl')
+    for _ in range(2):
+        cache = ReadingCache(cache_path)
+        assert run(lambda: list(ingest.ingest_readings(paths, cache=cache, **SMALL))) == expected
+        cache.save()
+    assert (cache.hits, cache.misses) == (79, 0)
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_undecodable_file_raises(tmp_path, jobs):
+    paths = write_files(tmp_path)
+    (tmp_path / '017.txt').write_bytes(b"<Section 1: Bad>\n\n1. \xff\xfe not UTF-8\n")
+    with pytest.raises(UnicodeDecodeError):
+        run(lambda: list(ingest.ingest_readings(paths, jobs=jobs, **SMALL)))
+
+
+def test_closing_early_shuts_both_executors_down(tmp_path, monkeypatch):
+    paths = write_files(tmp_path)
+    shut_down = []
+
+    class RecordingThreadPool(ThreadPoolExecutor):
+        def shutdown(self, *args, **kwargs):
+            super().shutdown(*args, **kwargs)
+            shut_down.append('thread')
+
+    class RecordingProcessPool(ProcessPoolExecutor):
+        def shutdown(self, *args, **kwargs):
+            super().shutdown(*args, **kwargs)
+            shut_down.append('process')
+
+    monkeypatch.setattr(ingest, 'ThreadPoolExecutor', RecordingThreadPool)
+    monkeypatch.setattr(ingest, 'ProcessPoolExecutor', RecordingProcessPool)
+
+    def take_three():
+        records = ingest.ingest_readings(paths, jobs=2, **SMALL)
+        first = [next(records) for _ in range(3)]
+        records.close()
+        return first
+
+    assert run(take_three) == load_readings(paths)[:3]
+    assert sorted(shut_down) == ['process', 'thread']
@@ -0,0 +1,67 @@
+import json
+import os
+
+from conftest import reading
+from readings_pipeline.metadata import JsonLinesMetadataStore, MetadataResolver
+
+DOI = '10.1000/brown'
+LATER_DOI = '10.1000/later'
+
+
+def heuristic(doi, title):
+    return reading(title.lower().replace(' ', '-'), doi=f"https://doi.org/{doi}", title=title)
+
+
+def write_store(path, works, mtime):
+    with open(path, 'w') as f:
+        for doi, title in works.items():
+            f.write(json.dumps({'doi': doi, 'title': title}) + '\n')
+    os.utime(path, ns=(mtime, mtime))
+
+
+def resolve(store_path, cache_path):
+    resolver = MetadataResolver(JsonLinesMetadataStore(store_path), cache_path)
+    records = list(resolver.collect([heuristic(DOI, 'Heuristic'), heuristic(LATER_DOI, 'Also heuristic')]))
+    resolver.write()
+    return [r.title for r in records]
+
+
+def test_store_edits_are_picked_up(tmp_path):
+    store, cache = str(tmp_path / 'works.jsonl'), str(tmp_path / 'cache.jsonl')
+    write_store(store, {DOI: 'Old title'}, 1_000_000_000)
+    assert resolve(store, cache) == ['Old title', 'Also heuristic']
+    assert resolve(store, cache) == ['Old title', 'Also heuristic']
+
+    write_store(store, {DOI: 'New title', LATER_DOI: 'Added later'}, 2_000_000_000)
+    assert resolve(store, cache) == ['New title', 'Added later']
+
+
+def test_unchanged_store_is_served_from_disk(tmp_path):
+    store, cache = str(tmp_path / 'works.jsonl'), str(tmp_path / 'cache.jsonl')
+    write_store(store, {DOI: 'Title'}, 1_000_000_000)
+    resolve(store, cache)
+
+    resolver = MetadataResolver(JsonLinesMetadataStore(store), cache)
+    list(resolver.collect([heuristic(DOI, 'Heuristic'), heuristic(LATER_DOI, 'Also heuristic')]))
+    assert sum(b['disk_hits'] for b in resolver.batches) == 2
+    assert sum(b['fetched'] for b in resolver.batches) == 0
+
+
+def test_fully_cached_build_does_not_read_the_dump(tmp_path):
+    store, cache = str(tmp_path / 'works.jsonl'), str(tmp_path / 'cache.jsonl')
+    write_store(store, {DOI: 'Title'}, 1_000_000_000)
+    resolve(store, cache)
+
+    jsonl = JsonLinesMetadataStore(store)
+    resolver = MetadataResolver(jsonl, cache)
+    assert [r.title for r in resolver.collect([heuristic(DOI, 'Heuristic')])] == ['Title']
+    assert jsonl.works is None
+
+
+def test_unreadable_years_keep_the_heuristic_year():
+    resolver = MetadataResolver(JsonLinesMetadataStore('unused.jsonl'))
+    record = heuristic(DOI, 'Heuristic')
+    assert resolver.apply(record, {'year': '2021a', 'title': 'T'}).year == 2021
+    assert resolver.apply(record, {'year': 2019}).year == 2019
+    assert resolver.apply(record, {'year': 'n.d.', 'title': 'T'}).year == 2020
+    assert resolver.apply(record, {'year': '20201'}).year == 2020
@@ -0,0 +1,127 @@
+import os
+from dataclasses import replace
+
+import pytest
+
+from conftest import reading
+from readings_pipeline.cli import main
+from readings_pipeline.output import (TS_HEADER, load_reading_groups, load_ts_module, render_ts, write_group_modules,
+                                      write_if_changed, write_ts)
+
+EDITED = TS_HEADER.replace('title: "Foundations of Social Friction"', 'title: "Foundations, Revised"')
+
+
+def test_split_index_takes_groups_from_the_input_module(tmp_path):
+    module = tmp_path / 'readings.ts'
+    module.write_text(EDITED + '[];\n', encoding='utf-8')
+    out_dir = tmp_path / 'readingsIndex'
+    assert main([str(module), '--split-bodies', str(out_dir), '-o', str(tmp_path / 'out.ts')]) == 0
+    assert load_reading_groups(str(out_dir / 'index.ts')) == load_reading_groups(str(module))
+    assert 'Foundations, Revised' in (out_dir / 'index.ts').read_text(encoding='utf-8')
+
+
+READINGS_TS = os.path.join(os.path.dirname(__file__), '..', 'src', 'content', 'readings.ts')
+
+# Written the way the README's "Adding Reading Discussions" example is
+HAND_WRITTEN = '''
+  // Added by hand
+  {
+    slug: "reading-slug",
+    groupSlug: "foundations",
+    title: "Paper Title",
+    authors: "Author Names",
+    year: 2024,
+    venue: "Journal Name",
+    fullCitation: "Full APA citation",
+    externalLinks: {
+      doi: "https://doi.org/10.1000/example",
+      pdf: "https://example.org/paper.pdf",
+    },
+    oneLineSummary: "One sentence summary",
+    discussion: null,
+  },'''
+
+
+def _hand_edited_module(tmp_path):
+    marker = 'export const readings: Reading[] = ['
+    content = open(READINGS_TS, encoding='utf-8').read().replace(marker, marker + HAND_WRITTEN, 1)
+    module = tmp_path / 'readings.ts'
+    module.write_text(content, encoding='utf-8')
+    return module
+
+
+def test_hand_written_entry_in_ts_literal_syntax_is_read(tmp_path):
+    readings = load_ts_module(str(_hand_edited_module(tmp_path)))
+    added = readings[0]
+    assert (added.slug, added.year, added.discussion) == ('reading-slug', 2024, None)
+    assert added.external_links.pdf == "https://example.org/paper.pdf"
+    assert readings[1:] == load_ts_module(READINGS_TS)
+
+
+def test_reading_without_discussion_goes_through_every_output(tmp_path):
+    module = _hand_edited_module(tmp_path)
+    out_dir = tmp_path / 'readingsIndex'
+    assert main([str(module), '--split-bodies', str(out_dir), '--search-index', str(tmp_path / 'search.ts'),
+                 '--related', str(tmp_path / 'related.ts'), '--chat-index', str(tmp_path / 'chat.json'),
+                 '-o', str(tmp_path / 'out.ts')]) == 0
+    body = (out_dir / 'foundations.ts').read_text(encoding='utf-8')
+    assert '"reading-slug": {\n    "fullCitation": "Full APA citation",\n    "discussion": null\n  }' in body
+    assert load_ts_module(str(tmp_path / 'out.ts'))[0].discussion is None
+
+
+def test_unsupported_syntax_is_reported_with_its_position(tmp_path):
+    module = _hand_edited_module(tmp_path)
+    content = module.read_text(encoding='utf-8').replace('title: "Paper Title"', "title: 'Paper Title'", 1)
+    module.write_text(content, encoding='utf-8')
+    line = content[:content.index("'Paper Title'")].count('\n') + 1
+    with pytest.raises(ValueError, match=rf"readings\.ts:{line}:12: use double-quoted strings"):
+        load_ts_module(str(module))
+
+
+def test_size_report_counts_the_modules_each_page_imports(tmp_path, capsys):
+    search, related = tmp_path / 'readingsSearchIndex.ts', tmp_path / 'readingsRelated.ts'
+    assert main([READINGS_TS, '--split-bodies', str(tmp_path / 'readingsIndex'), '--search-index', str(search),
+                 '--related', str(related), '-o', str(tmp_path / 'out.ts')]) == 0
+    lines = {line.split()[1]: line for line in capsys.readouterr().err.splitlines() if line.startswith('//   ')}
+    after = len((tmp_path / 'readingsIndex' / 'index.ts').read_bytes()) + len(search.read_bytes())
+    assert f"after {after:>9,} B" in lines['/readings']
+    assert lines['/readings'].endswith("[index.ts + readingsSearchIndex.ts]")
+    assert lines['detail'].endswith("+ readingsRelated.ts]")
+
+
+RECORDS = [reading('on-face-work', group_slug='foundations'), reading('attention-is-all-you-need'),
+           reading('few-shot-learners')]
+
+
+def _set_mtime(path, ns=1_000_000_000):
+    os.utime(path, ns=(ns, ns))
+
+
+@pytest.mark.parametrize('records', [RECORDS, []], ids=['three', 'empty'])
+def test_write_ts_matches_print_render_ts(tmp_path, capsys, records):
+    path = tmp_path / 'readings.ts'
+    assert write_ts(iter(records), str(path)) == (len(records), True)
+    print(render_ts(records))
+    assert path.read_text(encoding='utf-8') == capsys.readouterr().out
+
+
+def test_identical_rerun_leaves_the_mtime_alone(tmp_path):
+    path = tmp_path / 'readings.ts'
+    write_ts(RECORDS, str(path))
+    _set_mtime(path)
+    assert write_ts(RECORDS, str(path)) == (3, False)
+    assert os.stat(path).st_mtime_ns == 1_000_000_000
+    assert not write_if_changed(str(path), path.read_text(encoding='utf-8'))
+    assert os.stat(path).st_mtime_ns == 1_000_000_000
+    assert [p.name for p in tmp_path.iterdir()] == ['readings.ts']
+
+
+def test_editing_one_group_rewrites_only_that_module(tmp_path):
+    out_dir = tmp_path / 'groups'
+    assert len(write_group_modules(RECORDS, str(out_dir))) == 3
+    for path in out_dir.iterdir():
+        _set_mtime(path)
+    edited = RECORDS[:2] + [replace(RECORDS[2], title="Language models are few-shot learners")]
+    assert write_group_modules(edited, str(out_dir)) == [str(out_dir / 'ai-architectures.ts')]
+    assert {p.name for p in out_dir.iterdir() if os.stat(p).st_mtime_ns == 1_000_000_000} == {
+        'foundations.ts', 'index.ts'}
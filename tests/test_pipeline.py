@@ -0,0 +1,39 @@
+from readings_pipeline.output import render_ts
+from readings_pipeline.pipeline import iter_readings, load_readings
+from readings_pipeline.profiling import run_profiled
+
+DUMP = """<Section 2: Neural Plasticity>
+
+1. Hensch, T. K. (2005). Critical period plasticity in local cortical circuits. Nature Reviews Neuroscience, 6(11), 877-888. https://doi.org/10.1038/nrn1787
+Windows of plasticity.
+
+2. Blakemore, S.-J., & Mills, K. L. (2014). Is adolescence a sensitive period for sociocultural processing? Annual Review of Psychology, 65, 187-207. https://doi.org/10.1146/annurev-psych-010213-115202
+Adolescence.
+
+<Section 1: Foundations of Social Friction>
+
+1. Goffman, E. (1955). On face-work. Psychiatry, 18(3), 213-231. https://doi.org/10.1080/00332747.1955.11023008
+Face-work.
+"""
+
+
+def test_jobs_keep_the_serial_order(tmp_path):
+    path = tmp_path / 'dump.txt'
+    path.write_text(DUMP)
+    serial = list(iter_readings(str(path)))
+    assert [r.group_slug for r in serial] == ['neural-plasticity', 'neural-plasticity', 'foundations']
+    assert load_readings([str(path)], jobs=2) == serial
+    assert load_readings([str(path)], jobs=1) == serial
+
+
+def test_profile_counts_scanned_chars_and_times_the_write_apart(tmp_path):
+    path = tmp_path / 'dump.txt'
+    path.write_text(DUMP)
+    out = tmp_path / 'readings.ts'
+    stages = run_profiled(str(path), output_path=str(out))['stages']
+    assert stages['citation']['chars'] > 0
+    assert stages['summary_body']['chars'] > 0
+    text = out.read_text()
+    assert text == render_ts(list(iter_readings(str(path)))) + "\n"
+    assert stages['json_encode']['chars'] == stages['write']['chars'] == len(text)
+    assert 'serialize' not in stages
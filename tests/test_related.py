@@ -0,0 +1,20 @@
+import pytest
+
+from readings_pipeline.related import related_neighbours
+
+# Duplicates and repeated words give exactly tied (or rounding-noise tied) scores
+TIED = ['friction repair', 'friction', 'friction friction', 'repair', 'friction', 'friction repair',
+        'dopamine', '', 'friction']
+
+
+def test_ties_rank_lower_index_first():
+    assert related_neighbours(TIED, k=2, use_numpy=False)[1] == [2, 4]
+
+
+@pytest.mark.parametrize('k', [1, 2, 3, 8])
+@pytest.mark.parametrize('block_size', [1, 4, 512])
+def test_numpy_path_matches_python_path(k, block_size):
+    pytest.importorskip('numpy')
+    pytest.importorskip('scipy')
+    assert (related_neighbours(TIED, k, block_size, use_numpy=True)
+            == related_neighbours(TIED, k, use_numpy=False))
@@ -0,0 +1,159 @@
+"""Section header scanning on pathological raw dumps.
+
+scan_section_headers() must find exactly what SECTION_START_PATTERN finds,
+and it and the batch, stream and mmap parses must stay linear on inputs
+that were quadratic for the regex (megabyte lines, thousands of fake
+"Section" tokens, headers missing their '>').
+"""
+
+import re
+import time
+
+import pytest
+
+from readings_pipeline.extract import extract_reading
+from readings_pipeline.pipeline import iter_readings, iter_readings_mmap
+from readings_pipeline.scan import (GROUP_MAP, SECTION_START_PATTERN, scan_section_headers, split_readings,
+                                    split_sections)
+
+BYTES_SECTION_START_PATTERN = re.compile(SECTION_START_PATTERN.pattern.encode(), SECTION_START_PATTERN.flags
+                                         & ~re.UNICODE)
+
+HEADER = "<Section 1: Foundations of Social Friction>\n\n"
+CITATION = "1. Goffman, E. (1955). On face-work. Psychiatry, 18(3), 213-231. https://doi.org/10.1080/0033\n"
+
+
+def _repeat(unit, n_bytes):
+    return unit * max(1, n_bytes // len(unit))
+
+
+def unterminated_headers(n):
+    # Thousands of "Section N:" on one line with no '>' or newline after them
+    return HEADER + CITATION + _repeat("Section 1: ", n)
+
+
+def fake_section_tokens(n):
+    # Tokens that start like a header and fail at every later step
+    return HEADER + CITATION + _repeat("Section x <Section section: SECTION 12 < < ", n) + "\n"
+
+
+def whitespace_runs(n):
+    # '<' and "Section" followed by huge whitespace runs and no header
+    half = max(1, n // 2)
+    return HEADER + CITATION + "<" + " " * half + "x\nSection" + "\t" * half + "\n"
+
+
+def megabyte_line_reading(n):
+    # A whole reading on one line: no URL, so the citation is the entire line
+    return HEADER + "1. Someone, A. (2001) " + _repeat("word ", n) + "\n\n2. " + CITATION[3:]
+
+
+def dotted_megabyte_line(n):
+    # One-line reading full of ". " and "http" fragments the citation logic splits on
+    return HEADER + "1. Someone, A. (2001). " + _repeat("Title. http ", n) + "\n"
+
+
+def normal_dump(n):
+    sections = [
+        f"<Section {s}: Group {s}>\n\n" + "".join(
+            f"{i}. Author, A. (2001). Title {i}. Venue. https://doi.org/10.1000/{s}.{i}\n"
+            f"One line summary of reading {i}.\n\nCore idea of reading {i}.\n\n"
+            for i in range(1, 41)
+        )
+        for s in range(1, 10)
+    ]
+    return _repeat("".join(sections), n)
+
+
+ADVERSARIAL_CASES = [unterminated_headers, fake_section_tokens, whitespace_runs, megabyte_line_reading,
+                     dotted_megabyte_line]
+
+CORNER_CASES = {
+    'adjacent headers': "<Section 3: A><Section 4: B>\nSection 5: C\n",
+    'missing >': "<Section 1: Title ends at the newline\nbody\n",
+    'unterminated': "1. x\nSection 2: no terminator at all",
+    'whitespace around <': "<  \t Section   12:Title>",
+    'no space before number': "Section12: not a header\n",
+    'no colon': "Section 12 not a header>\n",
+    'case folding': "SECTION 1: upper>\nsEcTiOn 2: mixed>\nſection 3: long s>\n",
+    'unicode digits and spaces': "Section ٣: arabic-indic three>\n",
+    # With no terminator after the whitespace run, the regex backtracks "\s*"
+    # to the last newline inside it and matches an empty title there
+    'backtrack to newline': "Section 2:  \n \t\n   ",
+    'backtrack with text after': "Section 2: \n\n  ",
+    'newline run then title': "Section 2:\n\nTitle>",
+}
+
+
+def _expected(text, pattern=SECTION_START_PATTERN):
+    return [(m.start(), m.end(), m.group(1), m.group(2)) for m in pattern.finditer(text)]
+
+
+def _scanned(text):
+    headers = scan_section_headers(text)
+    if isinstance(text, str):
+        return [(h.start, h.end, h.number, h.title) for h in headers]
+    return [(h.start, h.end, h.number.encode('ascii'), bytes(h.title)) for h in headers]
+
+
+@pytest.mark.parametrize('text', CORNER_CASES.values(), ids=CORNER_CASES.keys())
+def test_corner_cases_match_the_regex(text):
+    assert _scanned(text) == _expected(text)
+
+
+@pytest.mark.parametrize('text', [t for t in CORNER_CASES.values() if t.isascii()],
+                         ids=[k for k, t in CORNER_CASES.items() if t.isascii()])
+def test_corner_cases_match_the_regex_on_bytes(text):
+    data = text.encode()
+    assert _scanned(data) == _expected(data, BYTES_SECTION_START_PATTERN)
+
+
+@pytest.mark.parametrize('case', ADVERSARIAL_CASES, ids=lambda case: case.__name__)
+def test_adversarial_dumps_match_the_regex(case):
+    # Small enough for the quadratic regex to finish quickly
+    text = case(4000)
+    assert _scanned(text) == _expected(text)
+    assert _scanned(text.encode()) == _expected(text.encode(), BYTES_SECTION_START_PATTERN)
+
+
+def _batch(content):
+    return [
+        extract_reading(r_text, GROUP_MAP.get(sec['number'], 'unknown'))
+        for sec in split_sections(content)
+        for r_text in split_readings(sec['content'])
+    ]
+
+
+PATHS = {
+    'scan': lambda content, path: list(scan_section_headers(content)),
+    'batch': lambda content, path: _batch(content),
+    'stream': lambda content, path: list(iter_readings(path)),
+    'mmap': lambda content, path: list(iter_readings_mmap(path)),
+}
+
+
+def _seconds(step, content, path, repeat=5):
+    # Fastest of several runs: the least disturbed by the rest of the machine
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        step(content, path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize('path_name', PATHS)
+@pytest.mark.parametrize('case', ADVERSARIAL_CASES + [normal_dump], ids=lambda case: case.__name__)
+def test_time_grows_linearly(tmp_path, case, path_name):
+    # Quadrupling the input: ~4x when linear, ~16x when quadratic. 256 KB
+    # of unterminated headers takes the regex close to three minutes.
+    step = PATHS[path_name]
+    timings = []
+    for size in (256_000, 1_024_000):
+        content = case(size)
+        path = tmp_path / f'{size}.txt'
+        path.write_text(content)
+        timings.append(_seconds(step, content, str(path)))
+    small, big = timings
+    assert big < 5.0
+    assert big / max(small, 1e-3) < 8.0
@@ -0,0 +1,60 @@
+from dataclasses import replace
+
+from conftest import reading
+from readings_pipeline.slugs import ReadingIndex
+
+
+BROWN = reading('language-models-are-few-shot-learners',
+                "Brown, T., Mann, B., Ryder, N., et al. (2020). Language models are few-shot learners. "
+                "Advances in Neural Information Processing Systems, 33, 1877–1901.")
+OTHER = reading('attention-is-all-you-need', "Vaswani, A., et al. (2017). Attention is all you need.")
+
+
+def build(path, readings):
+    index = ReadingIndex(path)
+    out = [r.slug for r in index.assign(readings)]
+    index.save()
+    return out
+
+
+def test_citation_edit_keeps_the_slug(tmp_path):
+    path = str(tmp_path / 'index.json')
+    build(path, [BROWN, OTHER])
+    edited = replace(BROWN, full_citation=BROWN.full_citation.replace('1877–1901', '1877–1902'))
+    assert build(path, [edited, OTHER]) == ['language-models-are-few-shot-learners', 'attention-is-all-you-need']
+    # The edited citation now owns the slug on later runs too
+    assert build(path, [edited, OTHER]) == ['language-models-are-few-shot-learners', 'attention-is-all-you-need']
+
+
+def test_citation_edit_keeps_the_slug_when_streamed(tmp_path):
+    path = str(tmp_path / 'index.json')
+    build(path, [BROWN, OTHER])
+    edited = replace(BROWN, full_citation=BROWN.full_citation + " Revised.")
+    index = ReadingIndex(path)
+    assert [r.slug for r in index.assign(iter([OTHER, edited]))] == [
+        'attention-is-all-you-need', 'language-models-are-few-shot-learners']
+
+
+def test_new_reading_does_not_take_a_present_readings_slug(tmp_path):
+    path = str(tmp_path / 'index.json')
+    build(path, [BROWN])
+    namesake = replace(BROWN, full_citation="Someone, A. (2024). Language models are few-shot learners, again.")
+    assert build(path, [namesake, BROWN]) == [
+        'language-models-are-few-shot-learners-2', 'language-models-are-few-shot-learners']
+
+
+def test_absent_readings_release_their_slugs(tmp_path):
+    path = str(tmp_path / 'index.json')
+    preprint = replace(BROWN, full_citation="Brown, T. (2020). Preprint.")
+    assert build(path, [BROWN, preprint]) == [
+        'language-models-are-few-shot-learners', 'language-models-are-few-shot-learners-2']
+    # Both owners are gone (and neither is an unambiguous match to inherit
+    # from), so a new reading with the same title gets the plain slug
+    newcomer = replace(BROWN, full_citation="Brown, T. (2021). Third version.")
+    assert build(path, [newcomer, OTHER]) == ['language-models-are-few-shot-learners', 'attention-is-all-you-need']
+
+
+def test_version_1_index_is_read(tmp_path):
+    path = tmp_path / 'index.json'
+    path.write_text('{"version": 1, "slugs": {"%s": "custom-slug"}}' % ReadingIndex.identity(BROWN))
+    assert build(str(path), [BROWN]) == ['custom-slug']
@@ -0,0 +1,33 @@
+import os
+import importlib
+
+from readings_pipeline.output import load_ts_module
+
+# The package's `watch` attribute is the function, not this module
+watch_module = importlib.import_module('readings_pipeline.watch')
+
+DUMP = """<Section 1: Foundations>
+
+1. Goffman, E. (1955). On face-work. Psychiatry, 18(3), 213-231. https://doi.org/10.1080/00332747.1955.11023008
+Face-work keeps interaction going.
+"""
+
+
+def test_failed_rebuild_keeps_watching(tmp_path, monkeypatch, capsys):
+    dump, moved, output = tmp_path / 'raw.txt', tmp_path / 'raw.txt.tmp', tmp_path / 'readings.ts'
+    dump.write_text(DUMP)
+
+    def changes():
+        # A save that leaves no file behind for a moment, then the new version
+        os.rename(dump, moved)
+        yield
+        os.rename(moved, dump)
+        yield
+
+    monkeypatch.setattr(watch_module, '_inotify_changes', lambda file_path: changes())
+    watch_module.watch(str(dump), str(output))
+
+    err = capsys.readouterr().err
+    assert "rebuild failed: FileNotFoundError" in err
+    assert err.count("// rebuilt in") == 2
+    assert [r.slug for r in load_ts_module(str(output))] == ['on-face-work']